@@ -0,0 +1,241 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+
+from polymat.calibration.error_measures import error_nmad, error_re, error_rms
+from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.materials.time_dependent.bergstrom_boyce import BergstromBoyce
+from polymat.materials.time_dependent.prony import Prony
+from polymat.materials.time_invariant.eight_chain import EightChain
+from polymat.materials.time_invariant.mooney import Mooney5
+from polymat.materials.time_invariant.neo_hook import NeoHook
+from polymat.materials.time_invariant.ogden import Ogden, Ogden2
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.elastic_deformation import biaxial_stress, planar_stress, uniaxial_stress
+from polymat.mechanics.incompressible_deformation import (
+    biaxial_stress_incompressible,
+    planar_stress_incompressible,
+    uniaxial_stress_incompressible,
+)
+from polymat.mechanics.time_dependent_deformation import uniaxial_stress_history
+from polymat.types import ElasticDeformation, ElasticModel, ErrorMeasure, Tensor, Vector
+
+CURVE_LENGTHS: tuple[int, ...] = (10, 100, 1000, 10000)
+QUICK_CURVE_LENGTHS: tuple[int, ...] = (10, 100)
+
+MAX_TRUE_STRAIN = 0.5
+
+# Length of the long viscoelastic histories, e.g. a creep or relaxation test sampled for a day
+LONG_HISTORY_LENGTH = 100000
+
+# Number of parameter sets of the batched Bergstrom-Boyce cases
+BERGSTROM_BOYCE_POPULATION = 32
+
+# Representative material parameters for each model
+MODELS: dict[str, tuple[ElasticModel, list[float]]] = {
+    "NeoHook": (NeoHook, [1.0, 100.0]),
+    "Yeoh": (Yeoh, [1.0, -0.01, 1e-4, 100.0]),
+    "Mooney5": (Mooney5, [1.0, 0.2, 0.01, 0.001, 0.0005, 100.0]),
+    "EightChain": (EightChain, [1.0, 3.0, 100.0]),
+    "Ogden": (Ogden, [1.0, 0.2, 2.0, -2.0, 100.0]),
+    "Ogden2": (Ogden2, [1.0, 0.2, 2.0, -2.0, 100.0]),
+}
+
+DEFORMATION_MODES: dict[str, ElasticDeformation] = {
+    "uniaxial_stress": uniaxial_stress,
+    "biaxial_stress": biaxial_stress,
+    "planar_stress": planar_stress,
+    "uniaxial_stress_incompressible": uniaxial_stress_incompressible,
+    "biaxial_stress_incompressible": biaxial_stress_incompressible,
+    "planar_stress_incompressible": planar_stress_incompressible,
+}
+
+ERROR_MEASURES: dict[str, ErrorMeasure] = {
+    "error_nmad": error_nmad,
+    "error_rms": error_rms,
+    "error_re": error_re,
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Single benchmark case.
+
+    Parameters
+    ----------
+    name: str
+        Unique identifier, "group/..." path used to match baseline results
+
+    func: Callable[[], object]
+        Timed function, called without arguments
+
+    checksum: Callable[[object], float]
+        Reduces the output of func to a number, compared against the baseline to detect changed results
+
+    max_repeat: int | None = None
+        Upper bound on the number of timing repeats, for long running cases
+    """
+
+    name: str
+    func: Callable[[], object]
+    checksum: Callable[[object], float]
+    max_repeat: int | None = None
+
+    @property
+    def group(self) -> str:
+        return self.name.split("/")[0]
+
+
+def _sum(result: object) -> float:
+    return float(np.nansum(result))
+
+
+def _fit_error(result: object) -> float:
+    return float(result[1])
+
+
+def model_cases() -> Iterator[Case]:
+    """
+    Material models per stress call, on a single general deformation gradient and on a stack of 1000.
+    """
+    F: Tensor = np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]])
+    F_stack: Tensor = F + np.linspace(0.0, 0.2, 1000)[:, None, None] * np.eye(3)
+
+    for name, (model, params) in MODELS.items():
+        yield Case(f"models/{name}/single", lambda m=model, p=params: m(F, p), _sum)
+        yield Case(f"models/{name}/stack1000", lambda m=model, p=params: m(F_stack, p), _sum)
+
+
+def driver_cases(lengths: tuple[int, ...]) -> Iterator[Case]:
+    """
+    Deformation mode drivers for every material model and curve length.
+    """
+    for n in lengths:
+        strain: Vector = np.linspace(0.0, MAX_TRUE_STRAIN, n)
+
+        for mode_name, mode in DEFORMATION_MODES.items():
+            for name, (model, params) in MODELS.items():
+                yield Case(
+                    f"drivers/{mode_name}/{name}/{n}",
+                    lambda d=mode, m=model, p=params, s=strain: d(m, s, p),
+                    _sum,
+                    max_repeat=1 if n >= 10000 else None,
+                )
+
+
+def viscoelastic_cases(lengths: tuple[int, ...]) -> Iterator[Case]:
+    """
+    Prony series viscoelastic model under cyclic uniaxial loading, with three terms spanning four decades of
+    relaxation times.
+    """
+    model = partial(Prony, elastic_model=Yeoh, terms=3)
+    params: list[float] = [1.0, -0.01, 1e-4, 100.0, 0.2, 0.2, 0.2, 1.0, 10.0, 1000.0]
+
+    for n in lengths:
+        time: Vector = np.linspace(0.0, 86400.0, n)
+        strain: Vector = MAX_TRUE_STRAIN * np.sin(time / 3600.0) ** 2
+
+        yield Case(
+            f"viscoelastic/Prony/Yeoh/{n}",
+            lambda s=strain, t=time: uniaxial_stress_history(model, s, t, params),
+            _sum,
+            max_repeat=1 if n >= 10000 else None,
+        )
+
+
+def bergstrom_boyce_cases(lengths: tuple[int, ...]) -> Iterator[Case]:
+    """
+    Bergstrom-Boyce model under cyclic uniaxial loading, batched over parameter sets of varying flow
+    resistance.
+    """
+    params: Vector = np.tile([[1.0], [3.0], [100.0], [2.0], [0.05], [-0.5], [1.0], [4.0]], BERGSTROM_BOYCE_POPULATION)
+    params[6] = np.geomspace(0.5, 5.0, BERGSTROM_BOYCE_POPULATION)
+
+    for n in lengths:
+        time: Vector = np.linspace(0.0, 20.0, n)
+        strain: Vector = MAX_TRUE_STRAIN * np.sin(np.pi * time / 10.0)
+
+        yield Case(
+            f"viscoelastic/BergstromBoyce/{BERGSTROM_BOYCE_POPULATION}/{n}",
+            lambda s=strain, t=time: uniaxial_stress_history(BergstromBoyce, s, t, params),
+            _sum,
+            max_repeat=1 if n >= 10000 else None,
+        )
+
+
+def error_measure_cases(lengths: tuple[int, ...]) -> Iterator[Case]:
+    """
+    Error measures for every curve length.
+    """
+    rng = np.random.default_rng(0)
+
+    for n in lengths:
+        x: Vector = np.linspace(0.01, 5.0, n)
+        p: Vector = x * (1.0 + 0.05 * rng.standard_normal(n))
+
+        for name, error_measure in ERROR_MEASURES.items():
+            yield Case(f"error_measures/{name}/{n}", lambda e=error_measure, x=x, p=p: e(x, p), _sum)
+
+
+def fit_cases() -> Iterator[Case]:
+    """
+    End-to-end calibrations on synthetic curves, with a fixed seed.
+    """
+    strain: list[Vector] = [np.linspace(0.0, MAX_TRUE_STRAIN, 50), np.linspace(0.0, MAX_TRUE_STRAIN, 50)]
+    deformation_mode: list[ElasticDeformation] = [uniaxial_stress_incompressible, planar_stress_incompressible]
+
+    fits: dict[str, tuple[ElasticModel, list[float], list[float], list[float], dict[str, object]]] = {
+        "Yeoh/serial": (Yeoh, [1.0, -0.01, 1e-4, 100.0], [0.1, -1.0, -1.0, 100.0], [10.0, 1.0, 1.0, 100.0], {}),
+        "Yeoh/vectorized": (
+            Yeoh,
+            [1.0, -0.01, 1e-4, 100.0],
+            [0.1, -1.0, -1.0, 100.0],
+            [10.0, 1.0, 1.0, 100.0],
+            {"vectorized": True},
+        ),
+        "EightChain/vectorized": (
+            EightChain,
+            [1.0, 3.0, 100.0],
+            [0.1, 1.5, 100.0],
+            [10.0, 10.0, 100.0],
+            {"vectorized": True},
+        ),
+        "Ogden/vectorized": (
+            Ogden,
+            [1.0, 0.2, 2.0, -2.0, 100.0],
+            [0.01, 0.01, 0.5, -5.0, 100.0],
+            [5.0, 5.0, 5.0, -0.5, 100.0],
+            {"vectorized": True},
+        ),
+    }
+
+    for name, (model, params, lower_bound, upper_bound, options) in fits.items():
+        stress: list[Vector] = [_mode(model, _strain, params) for _strain, _mode in zip(strain, deformation_mode)]
+
+        yield Case(
+            f"fits/{name}",
+            lambda m=model, s=stress, lb=lower_bound, ub=upper_bound, o=options: fit_elastic_material(
+                strain, s, m, deformation_mode, np.array(lb), np.array(ub), seed=0, **o
+            ),
+            _fit_error,
+            max_repeat=1,
+        )
+
+
+def all_cases(quick: bool = False) -> Iterator[Case]:
+    """
+    Every benchmark case, limited to short curves and no calibrations in quick mode.
+    """
+    lengths: tuple[int, ...] = QUICK_CURVE_LENGTHS if quick else CURVE_LENGTHS
+
+    yield from model_cases()
+    yield from driver_cases(lengths)
+    yield from viscoelastic_cases(lengths if quick else (*lengths, LONG_HISTORY_LENGTH))
+    yield from bergstrom_boyce_cases(lengths)
+    yield from error_measure_cases(lengths)
+
+    if not quick:
+        yield from fit_cases()
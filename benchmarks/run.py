@@ -0,0 +1,192 @@
+"""
+Benchmark runner for polymat.
+
+Times every case defined in cases.py, writes the results as JSON and optionally compares them
+against a stored baseline, exiting with a non-zero status on slowdowns or changed results.
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --quick --baseline bench.json --max-slowdown 1.25
+"""
+
+import argparse
+import json
+import math
+import platform
+import re
+import sys
+import time
+from datetime import UTC, datetime
+from importlib.metadata import version
+from statistics import median
+from timeit import Timer
+
+from cases import Case, all_cases
+
+MIN_TIME = 0.05
+REPEAT = 5
+MAX_SLOWDOWN = 1.25
+CHECKSUM_RTOL = 1e-8
+
+
+def time_case(case: Case, min_time: float, repeat: int) -> dict[str, object]:
+    """
+    Times a benchmark case, with enough calls per repeat to last at least min_time seconds.
+
+    Parameters
+    ----------
+    case: Case
+        Benchmark case
+
+    min_time: float
+        Minimum duration of each repeat in seconds
+
+    repeat: int
+        Number of timing repeats
+
+    Returns
+    -------
+    result: dict[str, object]
+        Per-call best and median times in seconds, number of calls and repeats, and result checksum
+    """
+    # The first call provides the checksum, and the timing of long running cases limited to a single repeat
+    start: float = time.perf_counter()
+    checksum: float = case.checksum(case.func())
+    elapsed: float = time.perf_counter() - start
+
+    timer: Timer = Timer(case.func)
+
+    number: int = 1
+
+    if case.max_repeat is not None:
+        repeat = min(repeat, case.max_repeat)
+
+    while elapsed < min_time and repeat > 1:
+        number *= 2 if elapsed <= 0.0 else max(2, min(10, math.ceil(min_time / elapsed)))
+        elapsed = timer.timeit(number)
+
+    times: list[float] = [elapsed / number] + [t / number for t in timer.repeat(repeat - 1, number)]
+
+    return {
+        "name": case.name,
+        "group": case.group,
+        "best": min(times),
+        "median": median(times),
+        "number": number,
+        "repeat": repeat,
+        "checksum": checksum,
+    }
+
+
+def environment() -> dict[str, str]:
+    """
+    Versions and platform the benchmarks ran on.
+    """
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "polymat": version("polymat"),
+        "numpy": version("numpy"),
+        "scipy": version("scipy"),
+    }
+
+
+def compare(
+    results: list[dict[str, object]], baseline: list[dict[str, object]], max_slowdown: float, rtol: float
+) -> list[str]:
+    """
+    Compares benchmark results against a baseline run.
+
+    Parameters
+    ----------
+    results: list[dict[str, object]]
+        Current results
+
+    baseline: list[dict[str, object]]
+        Baseline results, matched by case name
+
+    max_slowdown: float
+        Largest accepted ratio of current to baseline best time
+
+    rtol: float
+        Relative tolerance on the result checksums
+
+    Returns
+    -------
+    failures: list[str]
+        Description of every slowdown or changed result
+    """
+    reference: dict[str, dict[str, object]] = {r["name"]: r for r in baseline}
+
+    failures: list[str] = []
+
+    for result in results:
+        base: dict[str, object] | None = reference.get(result["name"])
+
+        if base is None:
+            continue
+
+        ratio: float = result["best"] / base["best"]
+        result["baseline_ratio"] = ratio
+
+        if ratio > max_slowdown:
+            failures.append(f"{result['name']}: {ratio:.2f}x slower than baseline")
+
+        if not math.isclose(result["checksum"], base["checksum"], rel_tol=rtol, abs_tol=rtol) and not (
+            math.isnan(result["checksum"]) and math.isnan(base["checksum"])
+        ):
+            failures.append(f"{result['name']}: checksum {result['checksum']!r} != baseline {base['checksum']!r}")
+
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the polymat benchmarks")
+    parser.add_argument("--output", "-o", help="JSON file for the results")
+    parser.add_argument("--baseline", "-b", help="JSON results of a previous run to compare against")
+    parser.add_argument("--filter", "-k", default="", help="Regular expression selecting cases by name")
+    parser.add_argument("--quick", action="store_true", help="Short curves only, no calibrations")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help="Minimum duration of each repeat [s]")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Number of timing repeats")
+    parser.add_argument("--max-slowdown", type=float, default=MAX_SLOWDOWN, help="Accepted time ratio to baseline")
+    parser.add_argument("--rtol", type=float, default=CHECKSUM_RTOL, help="Relative tolerance on result checksums")
+    args = parser.parse_args(argv)
+
+    pattern: re.Pattern[str] = re.compile(args.filter)
+
+    results: list[dict[str, object]] = []
+
+    start: float = time.perf_counter()
+
+    for case in all_cases(quick=args.quick):
+        if not pattern.search(case.name):
+            continue
+
+        result: dict[str, object] = time_case(case, args.min_time, args.repeat)
+        results.append(result)
+
+        print(f"{case.name:<60} {result['best'] * 1e3:>12.4f} ms", flush=True)
+
+    print(f"{len(results)} cases in {time.perf_counter() - start:.1f} s")
+
+    failures: list[str] = []
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline: list[dict[str, object]] = json.load(f)["results"]
+
+        failures = compare(results, baseline, args.max_slowdown, args.rtol)
+
+        for failure in failures:
+            print(failure, file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
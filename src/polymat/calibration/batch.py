@@ -0,0 +1,334 @@
+import os
+import signal
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass, field
+from multiprocessing import Pipe, Process, cpu_count
+from multiprocessing.connection import Connection, wait
+from time import perf_counter
+from types import FrameType
+
+from polymat.calibration.instrumentation import CalibrationResult
+from polymat.calibration.parallel import unlink_fitness_memory
+from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.types import ElasticDeformation, ElasticModel, Vector
+
+# Time given to a timed out job to exit after being terminated
+TERMINATE_TIMEOUT = 5.0
+
+
+@dataclass
+class CalibrationJob:
+    """
+    Single material calibration of a batch.
+
+    Parameters
+    ----------
+    name: str
+        Identifier of the job, e.g. material lot
+
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions from polymat.mechanics
+
+    lower_bound: Vector
+        Lower bound for the search space
+
+    upper_bound: Vector
+        Upper bound for the search space
+
+    options: dict[str, object]
+        Additional keyword arguments of fit_elastic_material (e.g. vectorized, seed, refine)
+
+    timeout: float | None = None
+        Time limit of the job in seconds, overriding the batch default
+    """
+
+    name: str
+    strain: list[Vector]
+    stress: list[Vector]
+    elastic_model: ElasticModel
+    deformation_mode: list[ElasticDeformation]
+    lower_bound: Vector
+    upper_bound: Vector
+    options: dict[str, object] = field(default_factory=dict)
+    timeout: float | None = None
+
+
+@dataclass
+class JobResult:
+    """
+    Outcome of a calibration job.
+
+    Parameters
+    ----------
+    index: int
+        Position of the job in the batch
+
+    name: str
+        Identifier of the job
+
+    status: str
+        "done", "failed" (exception or crash of the job process) or "timeout"
+
+    params: Vector | None
+        Calibrated material parameters, if done
+
+    error: float | None
+        Calibration error, if done
+
+    elapsed: float
+        Wall time of the job in seconds
+
+    message: str
+        Description of the failure, if any
+
+    details: CalibrationResult | None
+        Detailed outcome, for jobs run with full_output=True
+    """
+
+    index: int
+    name: str
+    status: str
+    params: Vector | None = None
+    error: float | None = None
+    elapsed: float = 0.0
+    message: str = ""
+    details: CalibrationResult | None = None
+
+
+def run_job(index: int, job: CalibrationJob) -> JobResult:
+    """
+    Runs a calibration job in the current process.
+
+    Parameters
+    ----------
+    index: int
+        Position of the job in the batch
+
+    job: CalibrationJob
+        Calibration to run
+
+    Returns
+    -------
+    result: JobResult
+        Outcome of the job, failed if the calibration raised an exception
+    """
+    start: float = perf_counter()
+
+    try:
+        result: tuple[Vector, float] | CalibrationResult = fit_elastic_material(
+            job.strain,
+            job.stress,
+            job.elastic_model,
+            job.deformation_mode,
+            job.lower_bound,
+            job.upper_bound,
+            **job.options,
+        )
+
+    # Any error of the calibration is reported in the result, isolated from the rest of the batch
+    except Exception as exc:  # noqa: BLE001
+        return JobResult(
+            index, job.name, "failed", elapsed=perf_counter() - start, message=f"{type(exc).__name__}: {exc}"
+        )
+
+    if isinstance(result, CalibrationResult):
+        return JobResult(index, job.name, "done", result.x, result.fun, perf_counter() - start, details=result)
+
+    return JobResult(index, job.name, "done", result[0], result[1], perf_counter() - start)
+
+
+def _terminated(signum: int, frame: FrameType | None) -> None:
+    raise SystemExit(128 + signum)
+
+
+def _job_process(index: int, job: CalibrationJob, connection: Connection) -> None:
+    """
+    Target of the job processes, sending the JobResult back through the connection.
+
+    The job leads its own process group, so that the workers of its FitnessPool (workers option) are killed
+    with it, and unwinds when terminated, so that the pool stops its workers and frees its shared memory.
+    """
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+
+    signal.signal(signal.SIGTERM, _terminated)
+
+    connection.send(run_job(index, job))
+    connection.close()
+
+
+class _RunningJob:
+    """
+    Job process being executed by run_batch.
+    """
+
+    def __init__(self, index: int, job: CalibrationJob, timeout: float | None) -> None:
+        self.index: int = index
+        self.job: CalibrationJob = job
+
+        self.connection, child_connection = Pipe(duplex=False)
+
+        # Not a daemon, so that jobs may use their own worker processes (workers option)
+        self.process: Process = Process(
+            target=_job_process, args=(index, job, child_connection), name=f"polymat-{job.name}"
+        )
+
+        self.start: float = perf_counter()
+        self.process.start()
+        child_connection.close()
+
+        self.deadline: float | None = None if timeout is None else self.start + timeout
+        self.exitcode: int | None = None
+
+    def result(self) -> JobResult:
+        """
+        Receives the result of a finished job, or reports a crash of its process.
+        """
+        job_result: JobResult | None = None
+
+        try:
+            if self.connection.poll():
+                job_result = self.connection.recv()
+        except (EOFError, OSError):
+            pass
+
+        self.close()
+
+        if job_result is not None:
+            return job_result
+
+        return JobResult(
+            self.index,
+            self.job.name,
+            "failed",
+            elapsed=perf_counter() - self.start,
+            message=f"Job process exited with code {self.exitcode}",
+        )
+
+    def kill(self) -> JobResult:
+        """
+        Terminates a job that exceeded its time limit.
+        """
+        self.stop()
+
+        return JobResult(
+            self.index,
+            self.job.name,
+            "timeout",
+            elapsed=perf_counter() - self.start,
+            message=f"Job exceeded its time limit of {self.deadline - self.start:g} s",
+        )
+
+    def stop(self) -> None:
+        """
+        Terminates the job process, then kills what is left of its process group and frees its shared memory.
+        """
+        pid: int = self.process.pid
+
+        self.process.terminate()
+        self.close()
+
+        if hasattr(os, "killpg"):
+            with suppress(ProcessLookupError, PermissionError):
+                os.killpg(pid, signal.SIGKILL)
+
+        unlink_fitness_memory(pid)
+
+    def close(self) -> None:
+        self.process.join(TERMINATE_TIMEOUT)
+
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+        self.exitcode = self.process.exitcode
+
+        self.connection.close()
+        self.process.close()
+
+
+def run_batch(
+    jobs: Iterable[CalibrationJob],
+    max_workers: int | None = None,
+    timeout: float | None = None,
+) -> Iterator[JobResult]:
+    """
+    Runs many material calibrations concurrently, yielding their results as soon as they finish.
+
+    Each job runs fit_elastic_material in its own process, with at most max_workers jobs at a time, so that
+    a long calibration only holds one slot while shorter ones keep flowing through the others. A job raising
+    an exception, crashing its process or exceeding its time limit is reported in its JobResult without
+    affecting the rest of the batch. A timed out job is terminated together with the workers of its own pool
+    (workers option), whose shared memory is freed. Jobs are started in order, and are only read from the
+    iterable when a slot is free.
+
+    Parameters
+    ----------
+    jobs: Iterable[CalibrationJob]
+        Calibrations to run
+
+    max_workers: int | None = None
+        Maximum number of concurrent jobs, the number of CPUs by default
+
+    timeout: float | None = None
+        Default time limit of each job in seconds
+
+    Returns
+    -------
+    results: Iterator[JobResult]
+        Job results in order of completion
+    """
+    max_workers = cpu_count() if max_workers is None else max_workers
+
+    if max_workers < 1:
+        raise ValueError(f"Invalid number of workers: {max_workers}")
+
+    pending: Iterator[tuple[int, CalibrationJob]] = iter(enumerate(jobs))
+    running: list[_RunningJob] = []
+    exhausted: bool = False
+
+    try:
+        while True:
+            while not exhausted and len(running) < max_workers:
+                try:
+                    index, job = next(pending)
+                except StopIteration:
+                    exhausted = True
+                    break
+
+                running.append(_RunningJob(index, job, job.timeout if job.timeout is not None else timeout))
+
+            if not running:
+                return
+
+            deadlines: list[float] = [r.deadline for r in running if r.deadline is not None]
+            wait_time: float | None = max(min(deadlines) - perf_counter(), 0.0) if deadlines else None
+
+            ready: list[object] = wait(
+                [r.connection for r in running] + [r.process.sentinel for r in running], timeout=wait_time
+            )
+
+            now: float = perf_counter()
+
+            for r in list(running):
+                if r.connection in ready or r.process.sentinel in ready:
+                    running.remove(r)
+                    yield r.result()
+
+                elif r.deadline is not None and now >= r.deadline:
+                    running.remove(r)
+                    yield r.kill()
+
+    finally:
+        for r in running:
+            r.stop()
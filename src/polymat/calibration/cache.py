@@ -0,0 +1,333 @@
+import json
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+from functools import cache, partial
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from types import CodeType
+
+from numpy import asarray, ascontiguousarray, float64, generic, ndarray
+
+from polymat.calibration.instrumentation import CalibrationResult, Generation
+from polymat.calibration.resampling import ResamplingReport
+from polymat.types import Vector
+
+try:
+    from fcntl import LOCK_EX, flock
+
+    def _lock(fd: int) -> None:
+        flock(fd, LOCK_EX)
+
+except ImportError:  # Windows
+    from msvcrt import LK_LOCK, locking
+
+    def _lock(fd: int) -> None:
+        locking(fd, LK_LOCK, 1)
+
+
+# Part of every key, to be increased when the cached values or the key contents change
+CACHE_FORMAT = 3
+
+DEFAULT_MAX_SIZE = 256 * 2**20
+
+ENTRY_SUFFIX = ".json"
+
+# Packages whose version is part of every key, since a named function is only keyed by its import path
+KEY_PACKAGES: tuple[str, ...] = ("polymat", "numpy", "scipy")
+
+# Dataclasses stored in the entries, the only types rebuilt when reading them
+ENTRY_TYPES: dict[str, type] = {cls.__name__: cls for cls in (CalibrationResult, Generation, ResamplingReport)}
+
+
+@cache
+def _versions() -> str:
+    """
+    Versions of Python and of KEY_PACKAGES, so that an upgrade does not serve results of the previous code.
+    """
+    versions: list[str] = [f"python={sys.version_info.major}.{sys.version_info.minor}"]
+
+    for package in KEY_PACKAGES:
+        try:
+            versions.append(f"{package}={version(package)}")
+        except PackageNotFoundError:
+            versions.append(f"{package}=unknown")
+
+    return ",".join(versions)
+
+
+def identity(obj: object) -> str:
+    """
+    Stable description of a function for a cache key, its import path, or the import path and arguments of a
+    functools.partial (e.g. a model with a given inverse Langevin method).
+    """
+    if isinstance(obj, partial):
+        return f"{identity(obj.func)}{obj.args!r}{sorted(obj.keywords.items())!r}"
+
+    module: str | None = getattr(obj, "__module__", None)
+    qualname: str | None = getattr(obj, "__qualname__", None)
+
+    if module is None or qualname is None:
+        return repr(obj)
+
+    return f"{module}:{qualname}"
+
+
+def _is_anonymous(obj: object) -> bool:
+    """
+    Whether a function shares its identity with other functions, as lambdas and nested functions do.
+    """
+    qualname: str = getattr(obj, "__qualname__", "")
+    return "<lambda>" in qualname or "<locals>" in qualname
+
+
+def _is_hashable_part(obj: object) -> bool:
+    """
+    Whether an object is one of the types hashed by content in CalibrationCache.key.
+    """
+    return obj is None or isinstance(obj, (str, int, float, bool, dict, list, tuple, ndarray)) or callable(obj)
+
+
+def _code_identity(code: CodeType) -> str:
+    """
+    Deterministic description of a code object: its bytecode, constants (nested code objects included) and
+    referenced names.
+    """
+    consts: list[str] = [_code_identity(c) if isinstance(c, CodeType) else repr(c) for c in code.co_consts]
+    return sha256(code.co_code + repr((consts, code.co_names)).encode()).hexdigest()
+
+
+def _encode(value: object) -> object:
+    """
+    JSON representation of an entry, made of arrays, tuples, the dataclasses of ENTRY_TYPES and JSON values.
+    """
+    if isinstance(value, ndarray):
+        return {"__array__": value.tolist(), "dtype": value.dtype.str}
+
+    if isinstance(value, generic):
+        return value.item()
+
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v) for v in value]}
+
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+
+    if isinstance(value, dict):
+        return {str(name): _encode(v) for name, v in value.items()}
+
+    if is_dataclass(value) and ENTRY_TYPES.get(type(value).__name__) is type(value):
+        return {"__type__": type(value).__name__, **{f.name: _encode(getattr(value, f.name)) for f in fields(value)}}
+
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+
+    raise TypeError(f"Cannot store {type(value).__name__} in the calibration cache")
+
+
+def _decode(value: object) -> object:
+    """
+    Entry from its JSON representation, building only arrays, tuples and the dataclasses of ENTRY_TYPES.
+    """
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if "__array__" in value:
+        return asarray(value["__array__"], dtype=value["dtype"])
+
+    if "__tuple__" in value:
+        return tuple(_decode(v) for v in value["__tuple__"])
+
+    if "__type__" in value:
+        cls: type = ENTRY_TYPES[value["__type__"]]
+        return cls(**{f.name: _decode(value[f.name]) for f in fields(cls) if f.name in value})
+
+    return {name: _decode(v) for name, v in value.items()}
+
+
+class CalibrationCache:
+    """
+    Persistent content-addressed cache of material calibrations, shared between processes.
+
+    Entries are JSON files named by the key of the calibration, written to a temporary file and renamed, so
+    that readers never see a partial entry and need no lock. Unlike pickles, reading an entry written by
+    another user of a shared cache directory cannot run code: only arrays, tuples and the result dataclasses of
+    ENTRY_TYPES are rebuilt. Writers and eviction take an exclusive lock on
+    the cache directory. Reading an entry updates its modification time, and the least recently used entries
+    are evicted when the total size of the cache exceeds max_size.
+
+    Parameters
+    ----------
+    directory: str | Path
+        Cache directory, created if needed
+
+    max_size: int = DEFAULT_MAX_SIZE
+        Maximum total size of the entries in bytes
+    """
+
+    def __init__(self, directory: str | Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory: Path = Path(directory)
+        self.max_size: int = max_size
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(*parts: object) -> str:
+        """
+        Hash of the inputs of a calibration.
+
+        Arrays (and lists of floats) are hashed by shape and float64 content, functions by identity, and
+        other objects by repr, so parts must have a deterministic repr (numbers, strings, dicts...). Lambdas and
+        nested functions, which share their identity within a module, are also hashed by their code, defaults
+        and closure contents. The key also holds the versions of Python, polymat, numpy and scipy, so that
+        upgrading them invalidates the entries, but not the changes of an editable install.
+
+        Parameters
+        ----------
+        parts: object
+            Experimental curves, model, deformation modes, bounds, error measure and solver settings
+
+        Returns
+        -------
+        key: str
+            Hexadecimal SHA-256 digest
+        """
+        digest = sha256(f"polymat-calibration-{CACHE_FORMAT}-{_versions()}".encode())
+
+        seen: set[int] = set()
+
+        def update(part: object) -> None:
+            if part is None or isinstance(part, (str, int, float, bool)):
+                digest.update(repr(part).encode())
+
+            elif isinstance(part, dict):
+                digest.update(b"{")
+                for name, value in sorted(part.items()):
+                    digest.update(f"{name}=".encode())
+                    update(value)
+                digest.update(b"}")
+
+            elif callable(part):
+                digest.update(identity(part).encode())
+
+                # Lambdas and nested functions of a module share their identity, and are told apart by their
+                # code, defaults and closure, once per function to allow recursive closures
+                func: object = part.func if isinstance(part, partial) else part
+
+                if _is_anonymous(func) and hasattr(func, "__code__") and id(func) not in seen:
+                    seen.add(id(func))
+
+                    digest.update(_code_identity(func.__code__).encode())
+                    update(func.__defaults__)
+                    update(func.__kwdefaults__)
+
+                    for cell in func.__closure__ or ():
+                        try:
+                            contents: object = cell.cell_contents
+                        except ValueError:  # Empty cell
+                            contents = None
+
+                        update(contents if _is_hashable_part(contents) else repr(contents))
+
+            elif isinstance(part, (list, tuple)) and not all(isinstance(p, (int, float)) for p in part):
+                digest.update(f"[{len(part)}".encode())
+                for p in part:
+                    update(p)
+                digest.update(b"]")
+
+            else:
+                array: Vector = ascontiguousarray(part, dtype=float64)
+                digest.update(f"{array.shape}".encode())
+                digest.update(array.tobytes())
+
+        for part in parts:
+            update(part)
+
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with open(self.directory / ".lock", "a+b") as f:
+            _lock(f.fileno())
+            yield
+
+    def get(self, key: str) -> object | None:
+        """
+        Cached value of a key, None on a miss or an unreadable entry.
+        """
+        path: Path = self._path(key)
+
+        try:
+            with path.open() as f:
+                value: object = _decode(json.load(f))
+
+            os.utime(path)
+
+        # Entry missing, evicted meanwhile, or left corrupted (e.g. written by another version)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        return value
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Stores the value of a key, then evicts the least recently used entries beyond max_size.
+
+        The value is made of numbers, strings, arrays, lists, tuples, dicts and the dataclasses of ENTRY_TYPES,
+        e.g. a calibration result.
+        """
+        data: str = json.dumps(_encode(value))
+
+        with self._locked():
+            with NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as f:
+                try:
+                    f.write(data)
+                except BaseException:
+                    f.close()
+                    os.unlink(f.name)
+                    raise
+
+            os.replace(f.name, self._path(key))
+
+            self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat: os.stat_result = path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total: int = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._locked():
+            for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob(f"*{ENTRY_SUFFIX}"))
@@ -3,7 +3,7 @@ from numpy import abs, maximum, mean, sqrt
 from polymat.types import Vector
 
 
-def error_nmad(x: Vector, p: Vector) -> float:
+def error_nmad(x: Vector, p: Vector) -> float | Vector:
     """
     Normalized Mean Absolute Difference (NMAD) error measure
 
@@ -13,21 +13,21 @@ def error_nmad(x: Vector, p: Vector) -> float:
         eXperimental data vector
 
     p: Vector
-        Predicted data vector
+        Predicted data vector, or matrix of shape (P,N) with one prediction per row
 
     Returns
     -------
-    error: float
-        Computed NMAD error
+    error: float | Vector
+        Computed NMAD error (one per prediction row)
     """
-    mad: float = mean(abs(x - p))
-    arith_mean: float = max((mean(abs(x)), mean(abs(p))))
+    mad: float = mean(abs(x - p), axis=-1)
+    arith_mean: float = maximum(mean(abs(x), axis=-1), mean(abs(p), axis=-1))
     nmad: float = mad / arith_mean
 
     return nmad * 100.0
 
 
-def error_rms(x: Vector, p: Vector) -> float:
+def error_rms(x: Vector, p: Vector) -> float | Vector:
     """
     Normalized Root-Mean-Squared Difference (RMS) error measure
 
@@ -37,20 +37,20 @@ def error_rms(x: Vector, p: Vector) -> float:
         eXperimental data vector
 
     p: Vector
-        Predicted data vector
+        Predicted data vector, or matrix of shape (P,N) with one prediction per row
 
     Returns
     -------
-    error: float
-        Computed NRMS error
+    error: float | Vector
+        Computed NRMS error (one per prediction row)
     """
-    rms: float = sqrt(mean((x - p) ** 2.0))
-    geom_mean: float = sqrt(mean(x**2))
+    rms: float = sqrt(mean((x - p) ** 2.0, axis=-1))
+    geom_mean: float = sqrt(mean(x**2, axis=-1))
 
     return 100.0 * rms / geom_mean
 
 
-def error_re(x: Vector, p: Vector) -> float:
+def error_re(x: Vector, p: Vector) -> float | Vector:
     """
     Normalized Relative Error (RE) measure
 
@@ -60,16 +60,16 @@ def error_re(x: Vector, p: Vector) -> float:
         eXperimental data vector
 
     p: Vector
-        Predicted data vector
+        Predicted data vector, or matrix of shape (P,N) with one prediction per row
 
     Returns
     -------
-    error: float
-        Computed RE error
+    error: float | Vector
+        Computed RE error (one per prediction row)
     """
     abs_res: Vector = abs(x - p)
     max_abs: Vector = maximum(abs(x), abs(p))
     rel_err: Vector = abs_res / max_abs
-    mean_re: float = mean(rel_err)
+    mean_re: float = mean(rel_err, axis=-1)
 
     return 100.0 * mean_re
@@ -1,3 +1,5 @@
+from numpy import inf, nan_to_num
+
 from polymat.types import ElasticDeformation, ElasticModel, ErrorMeasure, Vector
 
 
@@ -8,7 +10,7 @@ def fitness_elastic(
     elastic_model: ElasticModel,
     deformation_mode: list[ElasticDeformation],
     error_measure: ErrorMeasure,
-) -> float:
+) -> float | Vector:
     """
     Fitness fuction to measure error in stress prediction of hyperelastic materials.
 
@@ -17,7 +19,7 @@ def fitness_elastic(
     Parameters
     ----------
     params: Vector
-        Test material parameters
+        Test material parameters, or matrix of shape (S,P) holding P parameter sets by columns
 
     strain: list[Vector]
         List of experimental strain curves
@@ -36,10 +38,10 @@ def fitness_elastic(
 
     Retunrs
     -------
-    fitness: float
-        Target value for minimization algorithm
+    fitness: float | Vector
+        Target value for minimization algorithm, of shape (P,) for a matrix of parameter sets
     """
-    err: float = 0.0
+    err: float | Vector = 0.0
     n: int = 0
 
     for _strain, _stress, _deformation in zip(strain, stress, deformation_mode):
@@ -47,4 +49,5 @@ def fitness_elastic(
         err += error_measure(_stress[1:], predictedStress)
         n += 1
 
-    return err / n
+    # Parameter sets without a valid stress prediction are discarded
+    return nan_to_num(err / n, nan=inf, posinf=inf)
@@ -0,0 +1,185 @@
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Self
+
+from numpy import isfinite, std
+from scipy.optimize import OptimizeResult
+
+from polymat.types import Vector
+
+if TYPE_CHECKING:
+    from polymat.calibration.resampling import ResamplingReport
+
+_NO_TIMER: AbstractContextManager[None] = nullcontext()
+
+
+def no_timer(stage: str) -> AbstractContextManager[None]:
+    """
+    Stand-in for Instrumentation.timer when instrumentation is disabled.
+    """
+    return _NO_TIMER
+
+
+class Instrumentation:
+    """
+    Timers and call counters of the stages of a calibration.
+
+    Timers are exclusive: when stages are nested (e.g. the material model called by the lateral stretch
+    solver of a compressible deformation mode), the time spent in the inner stage is only reported under
+    that stage, so that the timings add up to the total time spent in instrumented code.
+
+    Stages used by polymat.calibration are "kinematics", "model", "lateral_stretch", "error_measure",
+    "fitness", "residuals" and "jacobian". Vectorized fitness evaluations also count "parameter_sets".
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = defaultdict(float)
+        self.counts: dict[str, int] = defaultdict(int)
+        self._nested: list[float] = []
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """
+        Context manager timing and counting one execution of a stage.
+        """
+        self._nested.append(0.0)
+        start: float = perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed: float = perf_counter() - start
+            nested: float = self._nested.pop()
+
+            self.timings[stage] += elapsed - nested
+            self.counts[stage] += 1
+
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def wrap[**P, R](self, stage: str, func: Callable[P, R]) -> Callable[P, R]:
+        """
+        Wraps a function so that each of its calls is timed and counted as a stage.
+        """
+
+        def timed(*args: P.args, **kwargs: P.kwargs) -> R:
+            with self.timer(stage):
+                return func(*args, **kwargs)
+
+        return timed
+
+    def count_parameter_sets[R](self, func: Callable[[Vector], R]) -> Callable[[Vector], R]:
+        """
+        Wraps a fitness function so that the parameter sets it scores are counted as "parameter_sets",
+        one per column for a vectorized evaluation.
+        """
+
+        def counted(params: Vector) -> R:
+            self.counts["parameter_sets"] += params.shape[1] if params.ndim == 2 else 1
+            return func(params)
+
+        return counted
+
+
+@dataclass(frozen=True)
+class Generation:
+    """
+    Progress of a differential evolution search after one generation.
+
+    Parameters
+    ----------
+    nit: int
+        Generation number
+
+    nfev: int
+        Number of fitness evaluations so far, as counted by differential_evolution (calls in vectorized mode)
+
+    best_fitness: float
+        Fitness of the best parameter set found so far
+
+    x: Vector
+        Best parameter set found so far
+
+    spread: float
+        Standard deviation of the fitness of the population members with a valid stress prediction
+
+    elapsed: float
+        Time since the start of the calibration in seconds
+    """
+
+    nit: int
+    nfev: int
+    best_fitness: float
+    x: Vector
+    spread: float
+    elapsed: float
+
+    @classmethod
+    def from_intermediate_result(cls, intermediate_result: OptimizeResult, elapsed: float) -> Self:
+        energies: Vector = intermediate_result.population_energies
+
+        return cls(
+            nit=intermediate_result.nit,
+            nfev=intermediate_result.nfev,
+            best_fitness=float(intermediate_result.fun),
+            x=intermediate_result.x,
+            spread=float(std(energies[isfinite(energies)])) if isfinite(energies).any() else float("inf"),
+            elapsed=elapsed,
+        )
+
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    """
+    Detailed outcome of a material calibration.
+
+    Parameters
+    ----------
+    x: Vector
+        Calibrated material parameters
+
+    fun: float
+        Error of the calibrated parameters
+
+    nfev: int
+        Number of parameter sets evaluated by the global search, plus residual evaluations of the refinement if any
+
+    nit: int
+        Number of generations of the global search
+
+    success: bool
+        Whether the global search converged
+
+    message: str
+        Termination message of the global search
+
+    elapsed: float
+        Wall time of the calibration in seconds
+
+    timings: dict[str, float]
+        Exclusive time spent in each stage in seconds, see Instrumentation
+
+    counts: dict[str, int]
+        Number of executions of each stage
+
+    history: list[Generation]
+        Progress after each generation of the global search
+
+    resampling: ResamplingReport | None = None
+        Fitness on the full and resampled curves, for calibrations run with max_points
+    """
+
+    x: Vector
+    fun: float
+    nfev: int
+    nit: int
+    success: bool
+    message: str
+    elapsed: float
+    timings: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    history: list[Generation] = field(default_factory=list)
+    resampling: "ResamplingReport | None" = None
@@ -0,0 +1,210 @@
+import os
+from collections.abc import Callable, Iterable
+from multiprocessing import Pool, cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from typing import Self
+
+from numpy import array_split, asarray, concatenate, float64, ndarray
+
+from polymat.calibration.problem import CalibrationProblem
+from polymat.types import ElasticDeformation, ElasticModel, ErrorMeasure, Vector
+
+type CurvesLayout = tuple[str, tuple[int, ...], tuple[int, ...]]
+
+# Prefix of the shared memory blocks, named after the process creating them
+MEMORY_PREFIX = "polymat-fitness"
+
+# Experimental curves attached to the shared memory block in the current process
+_shared_memory: SharedMemory | None = None
+_shared_strain: list[Vector] = []
+_shared_stress: list[Vector] = []
+_shared_problems: dict[tuple[object, ...], CalibrationProblem] = {}
+
+
+def _attach_curves(layout: CurvesLayout) -> None:
+    """
+    Pool initializer mapping the experimental curves from the shared memory block.
+
+    Parameters
+    ----------
+    layout: CurvesLayout
+        Shared memory block name and lengths of the strain and stress curves
+    """
+    global _shared_memory, _shared_strain, _shared_stress
+
+    name, strain_sizes, stress_sizes = layout
+
+    _shared_memory = SharedMemory(name=name, track=False)
+
+    data: Vector = ndarray((sum(strain_sizes) + sum(stress_sizes),), dtype=float64, buffer=_shared_memory.buf)
+
+    curves: list[Vector] = []
+    offset: int = 0
+
+    for size in strain_sizes + stress_sizes:
+        curves.append(data[offset : offset + size])
+        offset += size
+
+    _shared_strain = curves[: len(strain_sizes)]
+    _shared_stress = curves[len(strain_sizes) :]
+    _shared_problems.clear()
+
+
+def _detach_curves() -> None:
+    """
+    Releases the experimental curves mapped in the current process.
+    """
+    global _shared_memory, _shared_strain, _shared_stress
+
+    _shared_strain = []
+    _shared_stress = []
+    _shared_problems.clear()
+
+    if _shared_memory is not None:
+        _shared_memory.close()
+        _shared_memory = None
+
+
+class SharedFitness:
+    """
+    Picklable elastic fitness function reading the experimental curves from shared memory.
+
+    Only the model, deformation modes and error measure are sent to the worker processes with each task.
+    The curves are attached once per process by the FitnessPool initializer, and the corresponding
+    CalibrationProblem (with its cached kinematics) is built on the first call in each process.
+    """
+
+    def __init__(
+        self,
+        elastic_model: ElasticModel,
+        deformation_mode: list[ElasticDeformation],
+        error_measure: ErrorMeasure,
+    ) -> None:
+        self.elastic_model = elastic_model
+        self.deformation_mode = deformation_mode
+        self.error_measure = error_measure
+
+    def __call__(self, params: Vector) -> float | Vector:
+        key: tuple[object, ...] = (self.elastic_model, *self.deformation_mode, self.error_measure)
+
+        if key not in _shared_problems:
+            _shared_problems[key] = CalibrationProblem(
+                _shared_strain, _shared_stress, self.elastic_model, self.deformation_mode, self.error_measure
+            )
+
+        return _shared_problems[key].fitness(params)
+
+
+def fitness_memory_name(pid: int) -> str:
+    """
+    Name of the shared memory block of the FitnessPool of a process.
+    """
+    return f"{MEMORY_PREFIX}-{pid}"
+
+
+def unlink_fitness_memory(pid: int) -> None:
+    """
+    Frees the shared memory block of the FitnessPool of a process killed before leaving it, if any.
+
+    Parameters
+    ----------
+    pid: int
+        Process identifier of the killed process
+    """
+    try:
+        memory: SharedMemory = SharedMemory(fitness_memory_name(pid), track=False)
+    except FileNotFoundError:
+        return
+
+    memory.close()
+    memory.unlink()
+
+
+class FitnessPool:
+    """
+    Process pool sharing the experimental curves of a calibration with its workers.
+
+    Context manager placing the strain and stress curves in a shared memory block, which is attached
+    by every worker (and by the calling process) when the pool starts. The block is named after the calling
+    process (see fitness_memory_name), so that it can be freed by the parent of a killed process. Leaving the
+    context with an exception terminates the workers instead of waiting for their tasks.
+
+    Parameters
+    ----------
+    workers: int
+        Number of worker processes, -1 to use all available CPUs
+
+    strain: list[Vector]
+        List of experimental strain curves
+
+    stress: list[Vector]
+        List of experimental stress curves
+    """
+
+    def __init__(self, workers: int, strain: list[Vector], stress: list[Vector]) -> None:
+        self.workers: int = cpu_count() if workers == -1 else workers
+
+        if self.workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}")
+
+        self._curves: list[Vector] = [asarray(c, dtype=float64).ravel() for c in (*strain, *stress)]
+        self._layout: tuple[tuple[int, ...], tuple[int, ...]] = (
+            tuple(len(c) for c in strain),
+            tuple(len(c) for c in stress),
+        )
+
+    def __enter__(self) -> Self:
+        size: int = sum(len(c) for c in self._curves)
+
+        nbytes: int = max(size, 1) * float64().itemsize
+
+        # Another pool of the same process, or a block left by a killed process with the same pid, gets any name
+        try:
+            self._memory = SharedMemory(fitness_memory_name(os.getpid()), create=True, size=nbytes)
+        except FileExistsError:
+            self._memory = SharedMemory(create=True, size=nbytes)
+
+        data: Vector = ndarray((size,), dtype=float64, buffer=self._memory.buf)
+        data[:] = concatenate(self._curves) if size else 0.0
+
+        layout: CurvesLayout = (self._memory.name, *self._layout)
+
+        # The calling process evaluates the fitness too, e.g. when polishing the solution
+        _attach_curves(layout)
+
+        self._pool = Pool(processes=self.workers, initializer=_attach_curves, initargs=(layout,))
+
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is None:
+            self._pool.close()
+        else:
+            self._pool.terminate()
+
+        self._pool.join()
+
+        _detach_curves()
+
+        self._memory.close()
+        self._memory.unlink()
+
+    def map(self, func: Callable[[Vector], float], iterable: Iterable[Vector]) -> list[float]:
+        """
+        Map-like callable evaluating one parameter set per task, as used by differential_evolution workers.
+        """
+        return self._pool.map(func, iterable)
+
+    def vectorized(self, func: Callable[[Vector], Vector]) -> Callable[[Vector], Vector]:
+        """
+        Wraps a vectorized fitness so that the columns of the parameter matrix are split across the workers.
+        """
+
+        def split_fitness(params: Vector) -> Vector:
+            if params.ndim == 1:
+                return func(params)
+
+            chunks: list[Vector] = array_split(params, min(self.workers, params.shape[1]), axis=1)
+            return concatenate(self._pool.map(func, chunks))
+
+        return split_fitness
@@ -0,0 +1,292 @@
+from numpy import abs, arange, asarray, atleast_1d, inf, isfinite, log2, nan_to_num, ones, r_, unique
+
+from polymat.calibration.error_measures import error_re
+from polymat.calibration.instrumentation import Instrumentation, no_timer
+from polymat.mechanics.incompressible_deformation import INCOMPRESSIBLE_KINEMATICS, axial_stress_incompressible
+from polymat.mechanics.kinematics import Kinematics
+from polymat.types import ElasticDeformation, ElasticModel, ErrorMeasure, Vector
+
+
+class CalibrationProblem:
+    """
+    Calibration of a hyperelastic model against a fixed set of experimental curves.
+
+    The first point of each curve is dropped once, and the kinematics of the closed-form
+    (incompressible) deformation modes are precomputed and cached, so that evaluating the
+    fitness for new material parameters only runs the material model and the error measure.
+    Other deformation modes are evaluated through their stress computation function.
+
+    Parameters
+    ----------
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions from polymat.mechanics
+
+    error_measure: ErrorMeasure = error_re
+        Error metric for the fitness function
+
+    instrumentation: Instrumentation | None = None
+        Timers and counters recording the kinematics, model, lateral stretch and error measure stages
+    """
+
+    def __init__(
+        self,
+        strain: list[Vector],
+        stress: list[Vector],
+        elastic_model: ElasticModel,
+        deformation_mode: list[ElasticDeformation],
+        error_measure: ErrorMeasure = error_re,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        self.elastic_model: ElasticModel = elastic_model
+        self.deformation_mode: list[ElasticDeformation] = list(deformation_mode)
+        self.error_measure: ErrorMeasure = error_measure
+        self.instrumentation: Instrumentation | None = instrumentation
+
+        self._timer = no_timer if instrumentation is None else instrumentation.timer
+        self._model: ElasticModel = (
+            elastic_model if instrumentation is None else instrumentation.wrap("model", elastic_model)
+        )
+
+        self.strain: list[Vector] = [asarray(_strain, dtype=float)[1:] for _strain in strain]
+        self.stress: list[Vector] = [asarray(_stress, dtype=float)[1:] for _stress in stress]
+
+        with self._timer("kinematics"):
+            self.kinematics: list[Kinematics | None] = [
+                Kinematics(INCOMPRESSIBLE_KINEMATICS[_deformation](_strain)).precompute()
+                if _deformation in INCOMPRESSIBLE_KINEMATICS
+                else None
+                for _strain, _deformation in zip(self.strain, self.deformation_mode)
+            ]
+
+    def predict(self, params: Vector) -> list[Vector]:
+        """
+        Predicted stress curves.
+
+        Parameters
+        ----------
+        params: Vector
+            Material parameters, or matrix of shape (S,P) holding P parameter sets by columns
+
+        Returns
+        -------
+        stress: list[Vector]
+            Predicted stress for each curve, of shape (N,) or (P,N)
+        """
+        stress: list[Vector] = []
+
+        for _strain, _deformation, K in zip(self.strain, self.deformation_mode, self.kinematics):
+            if K is not None:
+                stress.append(axial_stress_incompressible(self._model, K, params))
+            else:
+                with self._timer("lateral_stretch"):
+                    stress.append(_deformation(self._model, _strain, params))
+
+        return stress
+
+    def fitness(self, params: Vector) -> float | Vector:
+        """
+        Average error of the predicted stress curves, as computed by fitness_elastic.
+
+        Parameters
+        ----------
+        params: Vector
+            Material parameters, or matrix of shape (S,P) holding P parameter sets by columns
+
+        Returns
+        -------
+        fitness: float | Vector
+            Target value for minimization algorithm, of shape (P,) for a matrix of parameter sets
+        """
+        err: float | Vector = 0.0
+
+        for _stress, predictedStress in zip(self.stress, self.predict(params)):
+            with self._timer("error_measure"):
+                err += self.error_measure(_stress, predictedStress)
+
+        # Parameter sets without a valid stress prediction are discarded
+        return nan_to_num(err / len(self.stress), nan=inf, posinf=inf)
+
+    def __call__(self, params: Vector) -> float | Vector:
+        return self.fitness(params)
+
+
+class MultiFidelityProblem:
+    """
+    Calibration problem scoring parameter sets on coarse subsamples of the curves first.
+
+    The curves are subsampled with a ladder of strides (powers of two), from a coarsest level of about
+    MIN_LEVEL_POINTS points per curve up to the full curves. Each parameter set is first scored at the current
+    coarse level, and only the promising ones, whose coarse fitness exceeds the best full resolution fitness
+    by less than SAFETY times the largest relative difference observed between both resolutions, are scored
+    again on the full curves (the first window of parameter sets being scored at both resolutions).
+    Clearly bad candidates of a differential evolution search are thus rejected for the price of a coarse
+    evaluation. When more than REFINE_FRACTION of the parameter sets scored over a window are promising, as
+    happens when the population converges, the coarse level is refined, until all evaluations run on the full
+    curves.
+
+    The fitness returned for a parameter set is its full resolution fitness when promising, its coarse
+    fitness otherwise. Since a candidate is promising whenever its coarse fitness is below the best full
+    resolution fitness found so far, the best fitness of a search is always a full resolution one. Other
+    members of a differential evolution population can hold coarse fitness values, and a trial whose coarse
+    fitness underestimates its error (by up to about the discretization error) can replace a parent that is
+    better on the full curves: this is a heuristic, whose search path and optimum can differ from a full
+    resolution search.
+
+    Parameters
+    ----------
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions from polymat.mechanics
+
+    error_measure: ErrorMeasure = error_re
+        Error metric for the fitness function
+
+    window: int = 100
+        Number of parameter sets scored at a level before deciding to refine it, e.g. the population size
+
+    instrumentation: Instrumentation | None = None
+        Timers and counters, shared by the problems of all levels
+    """
+
+    MIN_LEVEL_POINTS = 16
+    SAFETY = 2.0
+    REFINE_FRACTION = 0.5
+
+    def __init__(
+        self,
+        strain: list[Vector],
+        stress: list[Vector],
+        elastic_model: ElasticModel,
+        deformation_mode: list[ElasticDeformation],
+        error_measure: ErrorMeasure = error_re,
+        window: int = 100,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        strain = [asarray(_strain, dtype=float) for _strain in strain]
+        stress = [asarray(_stress, dtype=float) for _stress in stress]
+
+        self.full: CalibrationProblem = CalibrationProblem(
+            strain, stress, elastic_model, deformation_mode, error_measure, instrumentation
+        )
+
+        n_levels: int = max(int(log2(len(_strain) / self.MIN_LEVEL_POINTS)) for _strain in strain)
+
+        # Coarse levels, from the coarsest, each curve being subsampled down to MIN_LEVEL_POINTS at most
+        self.levels: list[CalibrationProblem] = []
+
+        for level in range(n_levels, 0, -1):
+            indices: list[Vector] = [
+                _subsample(len(_strain), min(2**level, max(len(_strain) // self.MIN_LEVEL_POINTS, 1)))
+                for _strain in strain
+            ]
+
+            self.levels.append(
+                CalibrationProblem(
+                    [_strain[i] for _strain, i in zip(strain, indices)],
+                    [_stress[i] for _stress, i in zip(stress, indices)],
+                    elastic_model,
+                    deformation_mode,
+                    error_measure,
+                    instrumentation,
+                )
+            )
+
+        self.window: int = window
+        self.level: int = 0
+        self.best: float = inf
+
+        # Largest relative difference between coarse and full resolution fitness observed so far
+        self.discretization_error: float = 0.0
+
+        self._scored: int = 0
+        self._promising: int = 0
+
+        # Number of parameter sets scored at each level, the last one being the full resolution
+        self.evaluations: list[int] = [0] * (len(self.levels) + 1)
+
+    def fitness(self, params: Vector) -> float | Vector:
+        """
+        Coarse or full resolution fitness of the parameter sets, see the class description.
+
+        Parameters
+        ----------
+        params: Vector
+            Material parameters, or matrix of shape (S,P) holding P parameter sets by columns
+
+        Returns
+        -------
+        fitness: float | Vector
+            Target value for minimization algorithm, of shape (P,) for a matrix of parameter sets
+        """
+        params = asarray(params, dtype=float)
+
+        if self.level == len(self.levels):
+            fitness: Vector = atleast_1d(self.full.fitness(params))
+            self.evaluations[-1] += len(fitness)
+            self.best = min(self.best, float(fitness.min()))
+
+            return fitness if params.ndim == 2 else float(fitness[0])
+
+        coarse: Vector = atleast_1d(self.levels[self.level].fitness(params))
+        self.evaluations[self.level] += len(coarse)
+
+        # The first window of parameter sets is scored at both resolutions to estimate the discretization error
+        if self.evaluations[-1] < self.window:
+            promising: Vector = ones(coarse.shape, dtype=bool)
+        else:
+            promising = coarse <= self.best * (1.0 + self.SAFETY * self.discretization_error)
+
+        fitness = coarse.copy()
+
+        if promising.any():
+            fine: Vector = atleast_1d(self.full.fitness(params[:, promising] if params.ndim == 2 else params))
+            self.evaluations[-1] += len(fine)
+
+            finite: Vector = isfinite(fine) & isfinite(coarse[promising]) & (fine > 0.0)
+
+            if finite.any():
+                relative_error: Vector = abs(coarse[promising][finite] - fine[finite]) / fine[finite]
+                self.discretization_error = max(self.discretization_error, float(relative_error.max()))
+
+            fitness[promising] = fine
+            self.best = min(self.best, float(fine.min()))
+
+        self._scored += len(coarse)
+        self._promising += int(promising.sum())
+
+        if self._scored >= self.window:
+            # The error of the previous level is kept as a conservative estimate for the finer one
+            if self._promising > self.REFINE_FRACTION * self._scored:
+                self.level += 1
+
+            self._scored = 0
+            self._promising = 0
+
+        return fitness if params.ndim == 2 else float(fitness[0])
+
+    def __call__(self, params: Vector) -> float | Vector:
+        return self.fitness(params)
+
+
+def _subsample(n: int, stride: int) -> Vector:
+    """
+    Indices of every stride-th point of a curve of n points, with the last point.
+    """
+    return unique(r_[arange(0, n, stride), n - 1])
@@ -0,0 +1,279 @@
+from dataclasses import dataclass
+
+from numpy import (
+    abs,
+    add,
+    arange,
+    arctan2,
+    argmax,
+    argmin,
+    asarray,
+    cumsum,
+    diff,
+    hypot,
+    interp,
+    linspace,
+    ptp,
+    r_,
+    searchsorted,
+    union1d,
+    unwrap,
+)
+
+from polymat.calibration.error_measures import error_re
+from polymat.calibration.problem import CalibrationProblem
+from polymat.types import ElasticDeformation, ElasticModel, ErrorMeasure, Vector
+
+# Arc length equivalent of a full turn of the normalized curve, weighting curvature against strain spacing
+CURVATURE_WEIGHT = 0.5
+
+# Average number of selected points per segment of the smoothed curve on which importance is measured
+SEGMENT_POINTS = 4
+
+# Minimum stress swing around a local extremum, relative to the stress range, for it to be kept as a peak
+PEAK_PROMINENCE = 0.05
+
+
+def _smoothed(strain: Vector, stress: Vector, stride: int) -> tuple[Vector, Vector, Vector]:
+    """
+    Curve averaged over blocks of stride points, so that measurement noise does not count as curvature,
+    with the end points kept. Returns the first index of each block, and the block strain and stress.
+    """
+    starts: Vector = arange(0, len(strain), stride)
+    counts: Vector = diff(r_[starts, len(strain)])
+
+    x: Vector = r_[strain[0], add.reduceat(strain, starts) / counts, strain[-1]]
+    y: Vector = r_[stress[0], add.reduceat(stress, starts) / counts, stress[-1]]
+
+    return r_[0, starts + counts // 2, len(strain) - 1], x, y
+
+
+def _importance(strain: Vector, stress: Vector, stride: int) -> Vector:
+    """
+    Cumulative importance of the points of a curve: arc length of the smoothed (strain, stress) curve
+    normalized by its ranges, plus weighted turning angle.
+    """
+    nodes, x, y = _smoothed(strain, stress, stride)
+
+    dx: Vector = diff(x) / (ptp(strain) or 1.0)
+    dy: Vector = diff(y) / (ptp(stress) or 1.0)
+
+    # Turning angle at each interior node, shared between its two segments
+    turn: Vector = abs(diff(unwrap(arctan2(dy, dx)))) / 2.0
+    weight: Vector = hypot(dx, dy) + CURVATURE_WEIGHT * (r_[0.0, turn] + r_[turn, 0.0])
+
+    return interp(arange(len(strain)), nodes, r_[0.0, cumsum(weight)])
+
+
+def _peaks(stress: Vector, stride: int) -> list[int]:
+    """
+    Indices of the global stress extrema, and of the local extrema of the smoothed curve followed by a
+    reversal larger than PEAK_PROMINENCE (e.g. the end of loading in a loading-unloading test).
+    """
+    nodes, _, y = _smoothed(stress, stress, stride)
+    threshold: float = PEAK_PROMINENCE * ptp(stress)
+
+    peaks: list[int] = [int(argmax(stress)), int(argmin(stress))]
+    extremum: int = 0
+    rising: bool | None = None
+
+    for j in range(1, len(y)):
+        if rising is None:
+            if abs(y[j] - y[0]) > threshold:
+                rising = bool(y[j] > y[0])
+                extremum = j
+        elif (y[j] > y[extremum]) == rising:
+            extremum = j
+        elif abs(y[j] - y[extremum]) > threshold:
+            window: slice = slice(nodes[max(extremum - 1, 0)], nodes[min(extremum + 1, len(y) - 1)] + 1)
+            peaks.append(int(window.start + (argmax if rising else argmin)(stress[window])))
+            rising = not rising
+            extremum = j
+
+    return peaks
+
+
+def resample_curve(strain: Vector, stress: Vector, max_points: int) -> Vector:
+    """
+    Selects a subset of the points of an experimental curve for calibration.
+
+    Points are spread evenly along the arc length of the curve normalized by its strain and stress ranges,
+    with extra points where it bends, so that the reduced curve follows the shape of the full one with much
+    fewer points. The end points and stress peaks (e.g. the maximum of a loading-unloading test) are always
+    kept, which may exceed max_points by the number of peaks. Measured points are selected rather than
+    interpolated, keeping the original data.
+
+    Parameters
+    ----------
+    strain: Vector
+        Experimental true strain curve
+
+    stress: Vector
+        Experimental true stress curve
+
+    max_points: int
+        Target number of points of the reduced curve
+
+    Returns
+    -------
+    indices: Vector
+        Sorted indices of the selected points
+    """
+    strain = asarray(strain, dtype=float)
+    stress = asarray(stress, dtype=float)
+
+    n: int = len(strain)
+
+    if max_points < 2:
+        raise ValueError(f"At least 2 points are required, got {max_points}")
+
+    if n <= max_points:
+        return arange(n)
+
+    stride: int = max(n * SEGMENT_POINTS // max_points, 1)
+
+    importance: Vector = _importance(strain, stress, stride)
+    kept: Vector = union1d([0, n - 1], _peaks(stress, stride))
+
+    targets: Vector = linspace(0.0, importance[-1], max(max_points - len(kept), 0) + 2)
+    selected: Vector = searchsorted(importance, targets).clip(0, n - 1)
+
+    return union1d(kept, selected)
+
+
+def resample_curves(strain: list[Vector], stress: list[Vector], max_points: int) -> tuple[list[Vector], list[Vector]]:
+    """
+    Reduces every experimental curve to about max_points points, see resample_curve.
+
+    Parameters
+    ----------
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    max_points: int
+        Target number of points of each reduced curve
+
+    Returns
+    -------
+    strain: list[Vector]
+        Reduced true strain curves
+
+    stress: list[Vector]
+        Reduced true stress curves
+    """
+    reduced_strain: list[Vector] = []
+    reduced_stress: list[Vector] = []
+
+    for _strain, _stress in zip(strain, stress):
+        _strain = asarray(_strain, dtype=float)
+        _stress = asarray(_stress, dtype=float)
+
+        indices: Vector = resample_curve(_strain, _stress, max_points)
+
+        reduced_strain.append(_strain[indices])
+        reduced_stress.append(_stress[indices])
+
+    return reduced_strain, reduced_stress
+
+
+@dataclass(frozen=True)
+class ResamplingReport:
+    """
+    Accuracy of a calibration on resampled curves.
+
+    Parameters
+    ----------
+    full_points: list[int]
+        Number of points of each full curve
+
+    reduced_points: list[int]
+        Number of points of each reduced curve
+
+    full_fitness: float | Vector
+        Fitness on the full curves, one per parameter set
+
+    reduced_fitness: float | Vector
+        Fitness on the reduced curves, one per parameter set
+    """
+
+    full_points: list[int]
+    reduced_points: list[int]
+    full_fitness: float | Vector
+    reduced_fitness: float | Vector
+
+    @property
+    def difference(self) -> float:
+        """
+        Largest absolute difference between the fitness on the reduced and full curves.
+        """
+        return float(abs(asarray(self.reduced_fitness) - self.full_fitness).max())
+
+    @property
+    def reduction(self) -> float:
+        """
+        Ratio of the total number of points of the full and reduced curves.
+        """
+        return sum(self.full_points) / sum(self.reduced_points)
+
+
+def resampling_report(
+    params: Vector,
+    strain: list[Vector],
+    stress: list[Vector],
+    reduced_strain: list[Vector],
+    reduced_stress: list[Vector],
+    elastic_model: ElasticModel,
+    deformation_mode: list[ElasticDeformation],
+    error_measure: ErrorMeasure = error_re,
+) -> ResamplingReport:
+    """
+    Compares the fitness on resampled curves with the fitness on the full curves.
+
+    Evaluated for a sample of parameter sets spanning the search space, the difference bounds the error made
+    by calibrating against the reduced curves.
+
+    Parameters
+    ----------
+    params: Vector
+        Material parameters, or matrix of shape (S,P) holding P parameter sets by columns
+
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    reduced_strain: list[Vector]
+        Resampled true strain curves, from resample_curves
+
+    reduced_stress: list[Vector]
+        Resampled true stress curves, from resample_curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions from polymat.mechanics
+
+    error_measure: ErrorMeasure = error_re
+        Error metric for the fitness function
+
+    Returns
+    -------
+    report: ResamplingReport
+        Number of points and fitness of the full and reduced curves
+    """
+    full: CalibrationProblem = CalibrationProblem(strain, stress, elastic_model, deformation_mode, error_measure)
+    reduced: CalibrationProblem = CalibrationProblem(
+        reduced_strain, reduced_stress, elastic_model, deformation_mode, error_measure
+    )
+
+    return ResamplingReport(
+        full_points=[len(_strain) for _strain in strain],
+        reduced_points=[len(_strain) for _strain in reduced_strain],
+        full_fitness=full.fitness(params),
+        reduced_fitness=reduced.fitness(params),
+    )
@@ -1,13 +1,48 @@
+from collections.abc import Callable
+from contextlib import nullcontext
+from time import perf_counter
+
+from numpy import asarray, dot
 from scipy.optimize import Bounds, LinearConstraint, NonlinearConstraint, OptimizeResult, differential_evolution
 
+from polymat.calibration.cache import CalibrationCache
 from polymat.calibration.error_measures import error_re
-from polymat.calibration.fitness_functions import fitness_elastic
+from polymat.calibration.instrumentation import CalibrationResult, Generation, Instrumentation
+from polymat.calibration.parallel import FitnessPool, SharedFitness
+from polymat.calibration.problem import CalibrationProblem, MultiFidelityProblem
+from polymat.calibration.resampling import ResamplingReport, resample_curves, resampling_report
+from polymat.calibration.solvers.local_fit import refine_elastic_material
+from polymat.calibration.warm_start import initial_population, initial_shear_modulus, shear_modulus_guess
 from polymat.types import ElasticDeformation, ElasticModel, Vector
 
 SEARCH_TOL = 1e-9
 SEARCH_MAX_ITER = 500
 SEARCH_POP_SIZE = 20
 
+# Coarse global search settings when followed by a local gradient-based refinement
+REFINE_SEARCH_TOL = 1e-2
+REFINE_SEARCH_MAX_ITER = 100
+
+# Absolute violation of the constraints tolerated for refined parameters
+CONSTRAINT_TOL = 1e-9
+
+
+def _is_feasible(params: Vector, constraints: list[LinearConstraint | NonlinearConstraint]) -> bool:
+    """
+    Whether material parameters satisfy the linear and nonlinear constraints of the search.
+    """
+    for constraint in constraints:
+        value: Vector = asarray(
+            dot(constraint.A, params) if isinstance(constraint, LinearConstraint) else constraint.fun(params)
+        )
+        lb: Vector = asarray(constraint.lb) - CONSTRAINT_TOL
+        ub: Vector = asarray(constraint.ub) + CONSTRAINT_TOL
+
+        if ((value < lb) | (value > ub)).any():
+            return False
+
+    return True
+
 
 def fit_elastic_material(
     strain: list[Vector],
@@ -18,7 +53,19 @@ def fit_elastic_material(
     upper_bound: Vector,
     linear_constraint: LinearConstraint | None = None,
     nonlinear_constraint: NonlinearConstraint | None = None,
-) -> tuple[Vector, float]:
+    vectorized: bool = False,
+    workers: int | None = None,
+    seed: int | None = None,
+    x0: Vector | None = None,
+    refine: bool = False,
+    callback: Callable[[Generation], bool | None] | None = None,
+    full_output: bool = False,
+    max_points: int | None = None,
+    multi_fidelity: bool = False,
+    cache: CalibrationCache | None = None,
+    guesses: list[Vector | CalibrationResult] | None = None,
+    estimate_shear_modulus: bool = False,
+) -> tuple[Vector, float] | CalibrationResult:
     """
     Solves optimization problem to calibrate the material model against the test data.
 
@@ -50,14 +97,123 @@ def fit_elastic_material(
     nonlinear_constraint: NonlinearConstraint | None = None
         Object modeling constraints in the form lb <= f(x) <= ub
 
+    vectorized: bool = False
+        If True, the whole population of every generation is scored in a single batched evaluation
+
+    workers: int | None = None
+        Number of processes evaluating the population in parallel (-1 for all CPUs). The experimental
+        curves are sent once to the workers through shared memory. With vectorized=True, each worker scores
+        a batch of the population.
+
+    seed: int | None = None
+        Seed of the random number generator for reproducible searches. With a seed (as with workers or
+        vectorized=True), the population is updated once per generation, so that a seeded result does not
+        depend on whether or how many workers are used.
+
+    x0: Vector | None = None
+        Initial guess included in the search population, e.g. from fit_linear_elastic_material
+
+    refine: bool = False
+        If True, a short and coarse differential evolution search is followed by a least squares
+        refinement using the analytic parameter derivatives of the model (see refine_elastic_material). The
+        refined parameters are kept only if they lower the error of the search and, the refinement being only
+        bounded, satisfy linear_constraint and nonlinear_constraint.
+
+    callback: Callable[[Generation], bool | None] | None = None
+        Called after each generation with the best fitness, population spread and elapsed time.
+        The search stops early if it returns True.
+
+    full_output: bool = False
+        If True, the fit is instrumented and a CalibrationResult is returned with the number of fitness
+        evaluations and generations, the per-stage timings and call counts, and the search history.
+        With workers, stages run in the worker processes are only reported as a whole under "fitness".
+
+    max_points: int | None = None
+        If set, each curve is reduced to about max_points points before fitting (see resample_curve),
+        which makes every evaluation cheaper for densely sampled test data. The returned error is then
+        computed on the full curves, and the full and reduced fitness are compared in result.resampling.
+
+    multi_fidelity: bool = False
+        If True, candidates are first scored on coarse subsamples of the curves and only the promising ones
+        on the full curves, the subsamples being refined as the population converges (see
+        MultiFidelityProblem). Saves most model evaluations of the compressible deformation modes.
+        The candidates rejected on their coarse score keep it, and can replace parents scored on the full
+        curves: this is a heuristic, whose optimum can differ from a full-fidelity search. The returned error
+        is always computed on the full curves. Not available with workers.
+
+    cache: CalibrationCache | None = None
+        If set, the result is looked up in the cache by a hash of the curves, model, deformation modes, bounds,
+        constraints, error measure and solver settings, and stored after a new calibration. The callback is not
+        called for a cached result. Nonlinear constraints are identified by the import path of their function.
+
+    guesses: list[Vector | CalibrationResult] | None = None
+        Parameter guesses seeding the initial population, e.g. user estimates or previous calibrations of the
+        same material family (see initial_population), instead of a Latin hypercube over the whole bounds
+
+    estimate_shear_modulus: bool = False
+        If True, parameters matching the shear modulus measured on the initial slope of the curves are added
+        to the guesses (see initial_shear_modulus and shear_modulus_guess)
+
     Returns
     -------
     calibrated_params: Vector
         Found list of optimal material parameters
 
     error: float
-        Computed error for the found solution
+        Computed error for the found solution, on the full curves
+
+    result: CalibrationResult
+        Only with full_output=True, detailed outcome of the calibration instead of the two values above
     """
+    start: float = perf_counter()
+
+    if cache is not None:
+        key: str = cache.key(
+            strain,
+            stress,
+            elastic_model,
+            deformation_mode,
+            lower_bound,
+            upper_bound,
+            None if linear_constraint is None else (linear_constraint.A, linear_constraint.lb, linear_constraint.ub),
+            None
+            if nonlinear_constraint is None
+            else (nonlinear_constraint.fun, nonlinear_constraint.lb, nonlinear_constraint.ub),
+            error_re,
+            {
+                "vectorized": vectorized,
+                "parallel": workers is not None,
+                "seed": seed,
+                "x0": x0,
+                "refine": refine,
+                "max_points": max_points,
+                "multi_fidelity": multi_fidelity,
+                "guesses": None if guesses is None else [getattr(g, "x", g) for g in guesses],
+                "estimate_shear_modulus": estimate_shear_modulus,
+                "search": (SEARCH_TOL, SEARCH_MAX_ITER, SEARCH_POP_SIZE, REFINE_SEARCH_TOL, REFINE_SEARCH_MAX_ITER),
+            },
+        )
+
+        cached: object | None = cache.get(key)
+
+        # A full output is only served from a full output entry
+        if isinstance(cached, CalibrationResult):
+            return cached if full_output else (cached.x, cached.fun)
+
+        if isinstance(cached, tuple) and not full_output:
+            return cached
+
+    instrumentation: Instrumentation | None = Instrumentation() if full_output else None
+
+    history: list[Generation] = []
+
+    def generation_callback(intermediate_result: OptimizeResult) -> None:
+        generation: Generation = Generation.from_intermediate_result(intermediate_result, perf_counter() - start)
+        history.append(generation)
+
+        if callback is not None and callback(generation):
+            raise StopIteration
+
     constraints: list[LinearConstraint | NonlinearConstraint] = []
 
     if linear_constraint:
@@ -66,19 +222,124 @@ def fit_elastic_material(
     if nonlinear_constraint:
         constraints.append(nonlinear_constraint)
 
+    if multi_fidelity and workers is not None:
+        raise ValueError("Multi-fidelity fitness is evaluated in the calling process and does not support workers")
+
     bounds: Bounds = Bounds(lower_bound, upper_bound)
 
-    opt: OptimizeResult = differential_evolution(
-        func=fitness_elastic,
-        bounds=bounds,
-        args=(strain, stress, elastic_model, deformation_mode, error_re),
-        constraints=constraints,
-        maxiter=SEARCH_MAX_ITER,
-        popsize=SEARCH_POP_SIZE,
-        tol=SEARCH_TOL,
-    )
+    warm_start: list[Vector] = [g.x if isinstance(g, CalibrationResult) else g for g in guesses or []]
+
+    if estimate_shear_modulus:
+        mu: float = initial_shear_modulus(strain, stress, deformation_mode)
+        warm_start.append(shear_modulus_guess(elastic_model, mu, lower_bound, upper_bound))
+
+    init: str | Vector = "latinhypercube"
+
+    if warm_start:
+        init = initial_population(lower_bound, upper_bound, warm_start, SEARCH_POP_SIZE * len(lower_bound), seed)
+
+    full_strain: list[Vector] = strain
+    full_stress: list[Vector] = stress
+
+    if max_points is not None:
+        strain, stress = resample_curves(strain, stress, max_points)
+
+    with FitnessPool(workers, strain, stress) if workers is not None else nullcontext() as pool:
+        if multi_fidelity:
+            func = MultiFidelityProblem(
+                strain,
+                stress,
+                elastic_model,
+                deformation_mode,
+                error_re,
+                window=SEARCH_POP_SIZE * len(lower_bound),
+                instrumentation=instrumentation,
+            )
+            map_workers = 1
+        elif pool is None:
+            func = CalibrationProblem(
+                strain, stress, elastic_model, deformation_mode, error_re, instrumentation=instrumentation
+            )
+            map_workers = 1
+        else:
+            func = SharedFitness(elastic_model, deformation_mode, error_re)
+            map_workers = 1 if vectorized else pool.map
+
+            if vectorized:
+                func = pool.vectorized(func)
+
+        # Parallel evaluations are timed as a whole, the fitness function itself being sent to the workers
+        if instrumentation is not None and callable(map_workers):
+            map_workers = instrumentation.wrap("fitness", map_workers)
+        elif instrumentation is not None:
+            func = instrumentation.wrap("fitness", func)
+
+        if instrumentation is not None and vectorized:
+            func = instrumentation.count_parameter_sets(func)
+
+        opt: OptimizeResult = differential_evolution(
+            func=func,
+            bounds=bounds,
+            constraints=constraints,
+            maxiter=REFINE_SEARCH_MAX_ITER if refine else SEARCH_MAX_ITER,
+            popsize=SEARCH_POP_SIZE,
+            tol=REFINE_SEARCH_TOL if refine else SEARCH_TOL,
+            polish=not refine,
+            vectorized=vectorized,
+            updating="deferred" if vectorized or pool is not None or seed is not None else "immediate",
+            workers=map_workers,
+            rng=seed,
+            init=init,
+            x0=x0,
+            callback=generation_callback if callback is not None or full_output else None,
+        )
 
     calibration_params: Vector = opt.x
     calibration_error: float = opt.fun
 
-    return calibration_params, calibration_error
+    if refine:
+        refined_params, refined_error = refine_elastic_material(
+            opt.x,
+            strain,
+            stress,
+            elastic_model,
+            deformation_mode,
+            lower_bound,
+            upper_bound,
+            instrumentation=instrumentation,
+        )
+
+        # The least squares refinement minimizes another objective within the bounds only, so it is kept if it
+        # lowers error_re without leaving the feasible region
+        if refined_error < calibration_error and _is_feasible(refined_params, constraints):
+            calibration_params, calibration_error = refined_params, refined_error
+
+    resampling: ResamplingReport | None = None
+
+    if max_points is not None:
+        resampling = resampling_report(
+            calibration_params, full_strain, full_stress, strain, stress, elastic_model, deformation_mode, error_re
+        )
+        calibration_error = float(resampling.full_fitness)
+
+    result: tuple[Vector, float] | CalibrationResult = (calibration_params, calibration_error)
+
+    if full_output:
+        result = CalibrationResult(
+            x=calibration_params,
+            fun=calibration_error,
+            nfev=instrumentation.counts.get("parameter_sets", opt.nfev) + instrumentation.counts.get("residuals", 0),
+            nit=opt.nit,
+            success=opt.success,
+            message=opt.message,
+            elapsed=perf_counter() - start,
+            timings=dict(instrumentation.timings),
+            counts=dict(instrumentation.counts),
+            history=history,
+            resampling=resampling,
+        )
+
+    if cache is not None:
+        cache.put(key, result)
+
+    return result
@@ -0,0 +1,145 @@
+from numpy import allclose, asarray, column_stack, concatenate, eye, isfinite
+from numpy.random import default_rng
+from scipy.optimize import OptimizeResult, lsq_linear
+
+from polymat.calibration.cache import identity
+from polymat.calibration.error_measures import error_re
+from polymat.calibration.fitness_functions import fitness_elastic
+from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.calibration.solvers.local_fit import residual_weights
+from polymat.types import ElasticDeformation, ElasticModel, Vector
+
+LINEARITY_RTOL = 1e-8
+
+
+def is_parameter_linear(
+    strain: list[Vector],
+    elastic_model: ElasticModel,
+    deformation_mode: list[ElasticDeformation],
+    n_params: int,
+) -> bool:
+    """
+    Checks numerically whether the predicted stress curves are linear in the material parameters.
+
+    Superposition and homogeneity are tested on random parameter sets, which holds for instance
+    for NeoHook, Yeoh and Mooney5 under incompressible loading.
+
+    Parameters
+    ----------
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions
+
+    n_params: int
+        Number of material parameters
+
+    Returns
+    -------
+    linear: bool
+        True if the stress is linear in the material parameters for every deformation mode
+    """
+    rng = default_rng(0)
+
+    p: Vector = rng.uniform(0.5, 1.5, n_params)
+    q: Vector = rng.uniform(0.5, 1.5, n_params)
+
+    for _strain, _deformation in zip(strain, deformation_mode):
+        s_p, s_q, s_pq, s_2p = _deformation(elastic_model, _strain[1:], column_stack([p, q, p + q, 2.0 * p]))
+
+        scale: float = max(abs(s_p).max(initial=0.0), abs(s_q).max(initial=0.0), 1.0)
+
+        if not (isfinite(s_pq).all() and isfinite(s_2p).all()):
+            return False
+
+        if not allclose(s_pq, s_p + s_q, rtol=0.0, atol=LINEARITY_RTOL * scale):
+            return False
+
+        if not allclose(s_2p, 2.0 * s_p, rtol=0.0, atol=LINEARITY_RTOL * scale):
+            return False
+
+    return True
+
+
+def fit_linear_elastic_material(
+    strain: list[Vector],
+    stress: list[Vector],
+    elastic_model: ElasticModel,
+    deformation_mode: list[ElasticDeformation],
+    lower_bound: Vector,
+    upper_bound: Vector,
+    refine: bool = False,
+) -> tuple[Vector, float]:
+    """
+    Calibrates a material model whose stress is linear in its parameters by bounded linear least squares.
+
+    The design matrix is assembled once from the stress response to each unit parameter. Rows are
+    scaled by the magnitude of the experimental stress, so that relative errors are minimized, in the
+    spirit of the error_re measure used by fit_elastic_material.
+
+    Parameters
+    ----------
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials (e.g. NeoHook, Yeoh, Mooney5)
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions, usually from polymat.mechanics.incompressible_deformation
+
+    lower_bound: Vector
+        Lower bound for the parameters
+
+    upper_bound: Vector
+        Upper bound for the parameters
+
+    refine: bool = False
+        If True, the least squares solution seeds a differential evolution search on the error_re measure
+
+    Returns
+    -------
+    calibrated_params: Vector
+        Found list of optimal material parameters
+
+    error: float
+        Computed error_re error for the found solution
+    """
+    n_params: int = len(lower_bound)
+
+    if not is_parameter_linear(strain, elastic_model, deformation_mode, n_params):
+        raise ValueError(f"Stress prediction of {identity(elastic_model)} is not linear in the material parameters")
+
+    A: list[Vector] = []
+    b: list[Vector] = []
+
+    for _strain, _stress, _deformation in zip(strain, stress, deformation_mode):
+        _stress = asarray(_stress[1:], dtype=float)
+
+        weight: Vector = residual_weights([_stress])[0]
+
+        # Stress response to each unit parameter, one per column
+        A.append(_deformation(elastic_model, _strain[1:], eye(n_params)).T * weight[:, None])
+        b.append(_stress * weight)
+
+    opt: OptimizeResult = lsq_linear(concatenate(A), concatenate(b), bounds=(lower_bound, upper_bound))
+
+    calibration_params: Vector = opt.x
+
+    if refine:
+        return fit_elastic_material(
+            strain, stress, elastic_model, deformation_mode, lower_bound, upper_bound, x0=calibration_params
+        )
+
+    calibration_error: float = fitness_elastic(
+        calibration_params, strain, stress, elastic_model, deformation_mode, error_re
+    )
+
+    return calibration_params, calibration_error
@@ -0,0 +1,213 @@
+from functools import partial
+
+from numpy import abs, clip, concatenate, maximum
+from scipy.optimize import OptimizeResult, least_squares
+
+from polymat.calibration.cache import identity
+from polymat.calibration.error_measures import error_re
+from polymat.calibration.instrumentation import Instrumentation
+from polymat.calibration.problem import CalibrationProblem
+from polymat.materials.time_invariant.eight_chain import EightChain, dEightChain_dparams
+from polymat.materials.time_invariant.mooney import Mooney5, dMooney5_dparams
+from polymat.materials.time_invariant.neo_hook import NeoHook, dNeoHook_dparams
+from polymat.materials.time_invariant.ogden import Ogden, Ogden2, dOgden2_dparams, dOgden_dparams
+from polymat.materials.time_invariant.yeoh import Yeoh, dYeoh_dparams
+from polymat.mechanics.elastic_deformation import COMPRESSIBLE_KINEMATICS, stress_jacobian
+from polymat.mechanics.incompressible_deformation import INCOMPRESSIBLE_KINEMATICS, stress_jacobian_incompressible
+from polymat.types import ElasticDeformation, ElasticModel, ElasticModelJacobian, Vector
+
+REFINE_TOL = 1e-12
+REFINE_MAX_NFEV = 200
+
+# Analytic parameter derivatives of the models in polymat.materials.time_invariant
+PARAMETER_JACOBIANS: dict[ElasticModel, ElasticModelJacobian] = {
+    NeoHook: dNeoHook_dparams,
+    Yeoh: dYeoh_dparams,
+    Mooney5: dMooney5_dparams,
+    EightChain: dEightChain_dparams,
+    Ogden: dOgden_dparams,
+    Ogden2: dOgden2_dparams,
+}
+
+
+def parameter_jacobian(elastic_model: ElasticModel) -> ElasticModelJacobian:
+    """
+    Parameter derivatives of a material model from PARAMETER_JACOBIANS, with the same fixed arguments for a
+    functools.partial of a model (e.g. an inverse Langevin method).
+
+    Parameters
+    ----------
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    Returns
+    -------
+    model_jacobian: ElasticModelJacobian
+        Parameter derivatives of the model
+    """
+    if isinstance(elastic_model, partial):
+        jacobian: ElasticModelJacobian = parameter_jacobian(elastic_model.func)
+        return partial(jacobian, *elastic_model.args, **elastic_model.keywords)
+
+    if elastic_model not in PARAMETER_JACOBIANS:
+        raise ValueError(f"No parameter jacobian available for {identity(elastic_model)}")
+
+    return PARAMETER_JACOBIANS[elastic_model]
+
+
+def residual_weights(stress: list[Vector]) -> list[Vector]:
+    """
+    Weights making the stress residuals relative to the magnitude of the experimental stress, the points near
+    zero stress being weighted by a thousandth of the largest stress of their curve. Curves of zero stress get
+    unit weights.
+
+    Parameters
+    ----------
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    Returns
+    -------
+    weights: list[Vector]
+        Weight of each point of the curves
+    """
+    weights: list[Vector] = []
+
+    for _stress in stress:
+        floor: float = 1e-3 * abs(_stress).max()
+        weights.append(1.0 / maximum(abs(_stress), floor if floor > 0.0 else 1.0))
+
+    return weights
+
+
+def curve_jacobians(problem: CalibrationProblem, model_jacobian: ElasticModelJacobian, params: Vector) -> list[Vector]:
+    """
+    Parameter derivatives of the predicted stress curves of a calibration problem.
+
+    Parameters
+    ----------
+    problem: CalibrationProblem
+        Calibration problem, whose cached kinematics are reused
+
+    model_jacobian: ElasticModelJacobian
+        Parameter derivatives of the material model of the problem
+
+    params: Vector
+        Material parameters
+
+    Returns
+    -------
+    dStress: list[Vector]
+        Derivatives of each predicted stress curve, of shape (S,N)
+    """
+    dStress: list[Vector] = []
+
+    for _strain, _deformation, K in zip(problem.strain, problem.deformation_mode, problem.kinematics):
+        if _deformation in INCOMPRESSIBLE_KINEMATICS:
+            dStress.append(stress_jacobian_incompressible(model_jacobian, _deformation, _strain, params, F=K))
+        elif _deformation in COMPRESSIBLE_KINEMATICS:
+            dStress.append(stress_jacobian(problem.elastic_model, model_jacobian, _deformation, _strain, params))
+        else:
+            raise ValueError(f"No parameter jacobian available for deformation mode {_deformation.__name__}")
+
+    return dStress
+
+
+def refine_elastic_material(
+    params: Vector,
+    strain: list[Vector],
+    stress: list[Vector],
+    elastic_model: ElasticModel,
+    deformation_mode: list[ElasticDeformation],
+    lower_bound: Vector,
+    upper_bound: Vector,
+    model_jacobian: ElasticModelJacobian | None = None,
+    method: str = "trf",
+    instrumentation: Instrumentation | None = None,
+) -> tuple[Vector, float]:
+    """
+    Refines a material calibration by a gradient-based local least squares search.
+
+    Residuals are the stress prediction errors relative to the magnitude of the experimental stress.
+    Their derivatives are computed from the analytic parameter derivatives of the material model.
+
+    Parameters
+    ----------
+    params: Vector
+        Starting material parameters, e.g. from a coarse differential evolution search
+
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions from polymat.mechanics
+
+    lower_bound: Vector
+        Lower bound for the parameters
+
+    upper_bound: Vector
+        Upper bound for the parameters
+
+    model_jacobian: ElasticModelJacobian | None = None
+        Parameter derivatives of the material model, looked up by parameter_jacobian by default
+
+    method: str = "trf"
+        scipy.optimize.least_squares algorithm, "trf", "dogbox" or "lm" (Levenberg-Marquardt, unbounded)
+
+    instrumentation: Instrumentation | None = None
+        Timers and counters, recording in particular the "residuals" and "jacobian" evaluations
+
+    Returns
+    -------
+    calibrated_params: Vector
+        Refined material parameters
+
+    error: float
+        Computed error_re error for the refined solution
+    """
+    if model_jacobian is None:
+        model_jacobian = parameter_jacobian(elastic_model)
+
+    problem: CalibrationProblem = CalibrationProblem(
+        strain, stress, elastic_model, deformation_mode, error_re, instrumentation=instrumentation
+    )
+
+    weights: list[Vector] = residual_weights(problem.stress)
+
+    def residuals(x: Vector) -> Vector:
+        return concatenate([(p - _stress) * w for p, _stress, w in zip(problem.predict(x), problem.stress, weights)])
+
+    def jacobian(x: Vector) -> Vector:
+        return concatenate(
+            [dStress.T * w[:, None] for dStress, w in zip(curve_jacobians(problem, model_jacobian, x), weights)]
+        )
+
+    if instrumentation is not None:
+        residuals = instrumentation.wrap("residuals", residuals)
+        jacobian = instrumentation.wrap("jacobian", jacobian)
+
+    bounds: tuple[Vector, Vector] = (lower_bound, upper_bound) if method != "lm" else (-float("inf"), float("inf"))
+
+    opt: OptimizeResult = least_squares(
+        residuals,
+        clip(params, lower_bound, upper_bound),
+        jac=jacobian,
+        bounds=bounds,
+        method=method,
+        x_scale="jac",
+        ftol=REFINE_TOL,
+        xtol=REFINE_TOL,
+        gtol=REFINE_TOL,
+        max_nfev=REFINE_MAX_NFEV,
+    )
+
+    calibration_params: Vector = opt.x
+    calibration_error: float = problem.fitness(calibration_params)
+
+    return calibration_params, calibration_error
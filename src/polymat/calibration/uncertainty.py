@@ -0,0 +1,524 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing import Pool, cpu_count
+
+from numpy import (
+    abs,
+    asarray,
+    clip,
+    concatenate,
+    cov,
+    delete,
+    diag,
+    full,
+    insert,
+    interp,
+    isfinite,
+    isnan,
+    linspace,
+    log,
+    maximum,
+    nan,
+    nanpercentile,
+    ones,
+    sqrt,
+    stack,
+)
+from numpy.linalg import pinv
+from numpy.random import Generator, SeedSequence, default_rng
+from scipy.optimize import OptimizeResult, least_squares
+from scipy.stats import chi2
+
+from polymat.calibration.error_measures import error_re
+from polymat.calibration.instrumentation import CalibrationResult
+from polymat.calibration.problem import CalibrationProblem
+from polymat.calibration.solvers.local_fit import (
+    REFINE_MAX_NFEV,
+    REFINE_TOL,
+    curve_jacobians,
+    parameter_jacobian,
+    residual_weights,
+)
+from polymat.types import ElasticDeformation, ElasticModel, ElasticModelJacobian, Vector
+
+CONFIDENCE = 0.95
+
+BOOTSTRAP_REPLICATES = 200
+
+# Number of profile points on each side of the optimum, spanning PROFILE_SPAN asymptotic standard errors
+PROFILE_POINTS = 8
+PROFILE_SPAN = 4.0
+
+RESAMPLING_METHODS: tuple[str, ...] = ("residuals", "cases")
+
+
+@dataclass(frozen=True)
+class UncertaintyResult:
+    """
+    Uncertainty of calibrated material parameters.
+
+    Parameters
+    ----------
+    x: Vector
+        Nominal material parameters, the least squares optimum refitted from the calibrated ones
+
+    covariance: Vector
+        Parameter covariance matrix of shape (S,S)
+
+    lower: Vector
+        Lower confidence bounds of the parameters
+
+    upper: Vector
+        Upper confidence bounds of the parameters
+
+    confidence: float
+        Confidence level of the bounds
+
+    failures: int = 0
+        Number of refits that did not give finite parameters, excluded from the statistics
+
+    samples: Vector | None = None
+        Bootstrap refits of shape (R,S), for bootstrap_elastic_material
+
+    grid: Vector | None = None
+        Profiled values of each parameter, of shape (S,2*PROFILE_POINTS+1), for profile_elastic_material
+
+    statistic: Vector | None = None
+        Likelihood ratio statistic at the profiled values, compared to the chi-squared quantile of the
+        confidence level, for profile_elastic_material
+    """
+
+    x: Vector
+    covariance: Vector
+    lower: Vector
+    upper: Vector
+    confidence: float
+    failures: int = 0
+    samples: Vector | None = None
+    grid: Vector | None = None
+    statistic: Vector | None = None
+
+    @property
+    def standard_error(self) -> Vector:
+        return sqrt(diag(self.covariance))
+
+
+class _Refit:
+    """
+    Picklable least squares refit of a calibration around its nominal optimum.
+
+    The calibrated parameters, e.g. the error_re optimum of fit_elastic_material, are first refitted with the
+    least squares objective of the refits: this nominal optimum and its SSR are the baseline of the profiles and
+    the center of the residual bootstrap. The calibration problem, with its cached kinematics, and the nominal
+    predictions and residuals are built once, and sent once to each worker process. Every refit starts from the
+    nominal optimum and only changes the target stress, the multiplicity of the points or a fixed parameter,
+    which keeps the kinematics valid.
+    """
+
+    def __init__(
+        self,
+        params: Vector,
+        problem: CalibrationProblem,
+        model_jacobian: ElasticModelJacobian,
+        lower_bound: Vector,
+        upper_bound: Vector,
+    ) -> None:
+        self.problem: CalibrationProblem = problem
+        self.model_jacobian: ElasticModelJacobian = model_jacobian
+        self.lower_bound: Vector = asarray(lower_bound, dtype=float)
+        self.upper_bound: Vector = asarray(upper_bound, dtype=float)
+
+        self.weights: list[Vector] = residual_weights(problem.stress)
+        self.x: Vector = clip(asarray(params, dtype=float), self.lower_bound, self.upper_bound)
+
+        # The given parameters are kept if the nominal refit fails
+        x, ssr = self.fit(problem.stress)
+
+        if isfinite(ssr):
+            self.x = x
+
+        # Nominal predictions, weighted (relative) residuals of the experimental stress and their sum of squares
+        self.prediction: list[Vector] = problem.predict(self.x)
+        self.residuals: list[Vector] = [
+            (_stress - p) * w for _stress, p, w in zip(problem.stress, self.prediction, self.weights)
+        ]
+        self.ssr: float = float((concatenate(self.residuals) ** 2).sum())
+
+    def fit(
+        self, target: list[Vector], multiplicity: list[Vector] | None = None, fixed: tuple[int, float] | None = None
+    ) -> tuple[Vector, float]:
+        """
+        Least squares fit from the nominal optimum.
+
+        Parameters
+        ----------
+        target: list[Vector]
+            Stress curves to fit
+
+        multiplicity: list[Vector] | None = None
+            Number of times each point is counted in the sum of squares, once by default
+
+        fixed: tuple[int, float] | None = None
+            Index and value of a parameter held fixed
+
+        Returns
+        -------
+        params: Vector
+            Fitted material parameters, NaN if the fit failed
+
+        ssr: float
+            Weighted sum of squared residuals of the fit
+        """
+        scale: list[Vector] = self.weights
+
+        if multiplicity is not None:
+            scale = [w * sqrt(m) for w, m in zip(self.weights, multiplicity)]
+
+        free: Vector = ones(len(self.x), dtype=bool)
+
+        if fixed is not None:
+            free[fixed[0]] = False
+
+        def full_params(x: Vector) -> Vector:
+            return x if fixed is None else insert(x, fixed[0], fixed[1])
+
+        def residuals(x: Vector) -> Vector:
+            predicted: list[Vector] = self.problem.predict(full_params(x))
+            return concatenate([(p - _target) * s for p, _target, s in zip(predicted, target, scale)])
+
+        def jacobian(x: Vector) -> Vector:
+            dStress: list[Vector] = curve_jacobians(self.problem, self.model_jacobian, full_params(x))
+            return concatenate([d[free].T * s[:, None] for d, s in zip(dStress, scale)])
+
+        try:
+            opt: OptimizeResult = least_squares(
+                residuals,
+                self.x[free],
+                jac=jacobian,
+                bounds=(self.lower_bound[free], self.upper_bound[free]),
+                x_scale="jac",
+                ftol=REFINE_TOL,
+                xtol=REFINE_TOL,
+                gtol=REFINE_TOL,
+                max_nfev=REFINE_MAX_NFEV,
+            )
+        except ValueError:
+            return full(len(self.x), nan), nan
+
+        if not isfinite(opt.fun).all():
+            return full(len(self.x), nan), nan
+
+        return full_params(opt.x), float(2.0 * opt.cost)
+
+    def bootstrap(self, seed: SeedSequence, resampling: str) -> Vector:
+        """
+        Refit of one bootstrap replicate of the curves.
+
+        With resampling="residuals", the relative residuals of each curve are resampled with replacement and
+        added to the nominal prediction. With resampling="cases", the points of each curve are resampled with
+        replacement, as multiplicities of the original points.
+        """
+        rng: Generator = default_rng(seed)
+
+        if resampling == "residuals":
+            target: list[Vector] = [
+                p + rng.choice(r, len(r)) / w for p, r, w in zip(self.prediction, self.residuals, self.weights)
+            ]
+            return self.fit(target)[0]
+
+        multiplicity: list[Vector] = [rng.multinomial(len(s), ones(len(s)) / len(s)) for s in self.problem.stress]
+        return self.fit(self.problem.stress, multiplicity)[0]
+
+    def profile(self, index: int, value: float) -> float:
+        """
+        Weighted sum of squared residuals with a parameter held fixed and the others refitted.
+        """
+        return self.fit(self.problem.stress, fixed=(index, value))[1]
+
+    def covariance(self) -> Vector:
+        """
+        Asymptotic (Gauss-Newton) covariance of the nominal parameters.
+        """
+        dStress: list[Vector] = curve_jacobians(self.problem, self.model_jacobian, self.x)
+        jac: Vector = concatenate([d.T * w[:, None] for d, w in zip(dStress, self.weights)])
+
+        return self.ssr / max(len(jac) - len(self.x), 1) * pinv(jac.T @ jac)
+
+
+# Refit attached to the current process by the pool initializer
+_refit: _Refit | None = None
+
+
+def _attach_refit(refit: _Refit | None) -> None:
+    global _refit
+    _refit = refit
+
+
+def _bootstrap_task(task: tuple[SeedSequence, str]) -> Vector:
+    return _refit.bootstrap(*task)
+
+
+def _profile_task(task: tuple[int, float]) -> float:
+    return _refit.profile(*task)
+
+
+def _map[T, R](refit: _Refit, func: Callable[[T], R], tasks: list[T], workers: int | None) -> list[R]:
+    """
+    Runs the refit tasks in the calling process, or in a pool of worker processes each holding a copy of the
+    refit, sent once when the pool starts.
+    """
+    if workers is None:
+        _attach_refit(refit)
+
+        try:
+            return [func(task) for task in tasks]
+        finally:
+            _attach_refit(None)
+
+    processes: int = cpu_count() if workers == -1 else workers
+
+    if processes < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+
+    with Pool(processes=processes, initializer=_attach_refit, initargs=(refit,)) as pool:
+        return pool.map(func, tasks)
+
+
+def _nominal_refit(
+    params: Vector | CalibrationResult,
+    strain: list[Vector],
+    stress: list[Vector],
+    elastic_model: ElasticModel,
+    deformation_mode: list[ElasticDeformation],
+    lower_bound: Vector,
+    upper_bound: Vector,
+    model_jacobian: ElasticModelJacobian | None,
+) -> _Refit:
+    if model_jacobian is None:
+        model_jacobian = parameter_jacobian(elastic_model)
+
+    problem: CalibrationProblem = CalibrationProblem(strain, stress, elastic_model, deformation_mode, error_re)
+
+    return _Refit(getattr(params, "x", params), problem, model_jacobian, lower_bound, upper_bound)
+
+
+def bootstrap_elastic_material(
+    params: Vector | CalibrationResult,
+    strain: list[Vector],
+    stress: list[Vector],
+    elastic_model: ElasticModel,
+    deformation_mode: list[ElasticDeformation],
+    lower_bound: Vector,
+    upper_bound: Vector,
+    replicates: int = BOOTSTRAP_REPLICATES,
+    resampling: str = "residuals",
+    confidence: float = CONFIDENCE,
+    workers: int | None = None,
+    seed: int | None = None,
+    model_jacobian: ElasticModelJacobian | None = None,
+) -> UncertaintyResult:
+    """
+    Bootstrap confidence intervals and covariance of calibrated material parameters.
+
+    Each replicate of the curves is refitted by a least squares search started from the nominal optimum, the
+    least squares refit of params, with the relative residuals of refine_elastic_material and the analytic parameter derivatives of the model,
+    instead of a new global search. The replicates only change the target stress or the multiplicity of the
+    points, so that the kinematics of the curves are computed once for all of them.
+
+    Parameters
+    ----------
+    params: Vector | CalibrationResult
+        Nominal calibrated material parameters, e.g. from fit_elastic_material
+
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions from polymat.mechanics
+
+    lower_bound: Vector
+        Lower bound for the parameters
+
+    upper_bound: Vector
+        Upper bound for the parameters
+
+    replicates: int = BOOTSTRAP_REPLICATES
+        Number of bootstrap replicates
+
+    resampling: str = "residuals"
+        "residuals" to resample the relative residuals of each curve around the nominal prediction, which keeps
+        the strain points, or "cases" to resample the points of each curve with replacement
+
+    confidence: float = CONFIDENCE
+        Confidence level of the percentile intervals
+
+    workers: int | None = None
+        Number of processes running the refits in parallel (-1 for all CPUs), in the calling process by default
+
+    seed: int | None = None
+        Seed of the random number generator, the replicates being the same for any number of workers
+
+    model_jacobian: ElasticModelJacobian | None = None
+        Parameter derivatives of the material model, looked up by parameter_jacobian by default
+
+    Returns
+    -------
+    result: UncertaintyResult
+        Percentile intervals, sample covariance and parameters of the refitted replicates
+    """
+    if resampling not in RESAMPLING_METHODS:
+        raise ValueError(f"Unknown resampling method {resampling}, expected one of {RESAMPLING_METHODS}")
+
+    refit: _Refit = _nominal_refit(
+        params, strain, stress, elastic_model, deformation_mode, lower_bound, upper_bound, model_jacobian
+    )
+
+    seeds: list[SeedSequence] = SeedSequence(seed).spawn(replicates)
+    samples: Vector = stack(_map(refit, _bootstrap_task, [(s, resampling) for s in seeds], workers))
+
+    valid: Vector = isfinite(samples).all(axis=1)
+    alpha: float = 100.0 * (1.0 - confidence) / 2.0
+
+    return UncertaintyResult(
+        x=refit.x,
+        covariance=cov(samples[valid], rowvar=False).reshape(len(refit.x), len(refit.x)),
+        lower=nanpercentile(samples[valid], alpha, axis=0),
+        upper=nanpercentile(samples[valid], 100.0 - alpha, axis=0),
+        confidence=confidence,
+        failures=int((~valid).sum()),
+        samples=samples,
+    )
+
+
+def _profile_bound(grid: Vector, statistic: Vector, threshold: float, bound: float) -> float:
+    """
+    Value where the profile statistic, increasing away from the optimum along grid, reaches the threshold.
+    The search bound is returned if the grid reaches it below the threshold, NaN if the grid is too short or if
+    a refit failed (NaN statistic) before the threshold.
+    """
+    # Failed refits stop the search as crossings do, but give no bound
+    stop: Vector = (~(statistic <= threshold)).nonzero()[0]
+
+    if len(stop) == 0:
+        return bound if grid[-1] == bound else nan
+
+    i: int = stop[0]
+
+    if isnan(statistic[i]):
+        return nan
+
+    return float(interp(threshold, statistic[i - 1 : i + 1], grid[i - 1 : i + 1])) if i > 0 else float(grid[0])
+
+
+def profile_elastic_material(
+    params: Vector | CalibrationResult,
+    strain: list[Vector],
+    stress: list[Vector],
+    elastic_model: ElasticModel,
+    deformation_mode: list[ElasticDeformation],
+    lower_bound: Vector,
+    upper_bound: Vector,
+    points: int = PROFILE_POINTS,
+    confidence: float = CONFIDENCE,
+    workers: int | None = None,
+    model_jacobian: ElasticModelJacobian | None = None,
+) -> UncertaintyResult:
+    """
+    Profile likelihood confidence intervals of calibrated material parameters.
+
+    Each parameter is held fixed at points values on each side of the nominal optimum, the least squares refit
+    of params, spanning PROFILE_SPAN asymptotic standard errors within the bounds, and the other parameters are
+    refitted by a least squares search started from the nominal optimum. Assuming normal relative errors, the
+    likelihood ratio statistic n log(SSR / SSR_nominal) is compared to the chi-squared quantile of the
+    confidence level, and the interval bounds are interpolated where it is reached. Bounds beyond the profiled
+    values or a failed refit are NaN. The covariance is the asymptotic one of the Gauss-Newton approximation.
+
+    Parameters
+    ----------
+    params: Vector | CalibrationResult
+        Nominal calibrated material parameters, e.g. from fit_elastic_material
+
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions from polymat.mechanics
+
+    lower_bound: Vector
+        Lower bound for the parameters
+
+    upper_bound: Vector
+        Upper bound for the parameters
+
+    points: int = PROFILE_POINTS
+        Number of profiled values on each side of the optimum
+
+    confidence: float = CONFIDENCE
+        Confidence level of the intervals
+
+    workers: int | None = None
+        Number of processes running the refits in parallel (-1 for all CPUs), in the calling process by default
+
+    model_jacobian: ElasticModelJacobian | None = None
+        Parameter derivatives of the material model, looked up by parameter_jacobian by default
+
+    Returns
+    -------
+    result: UncertaintyResult
+        Profile likelihood intervals, asymptotic covariance, and the profiled values and statistic
+    """
+    refit: _Refit = _nominal_refit(
+        params, strain, stress, elastic_model, deformation_mode, lower_bound, upper_bound, model_jacobian
+    )
+
+    covariance: Vector = refit.covariance()
+    span: Vector = PROFILE_SPAN * maximum(sqrt(abs(diag(covariance))), 1e-6 * maximum(abs(refit.x), 1.0))
+
+    lower: Vector = maximum(refit.x - span, refit.lower_bound)
+    upper: Vector = clip(refit.x + span, None, refit.upper_bound)
+
+    grid: Vector = concatenate(
+        [linspace(lower, refit.x, points + 1)[:-1], linspace(refit.x, upper, points + 1)], axis=0
+    ).T
+
+    tasks: list[tuple[int, float]] = [(i, float(v)) for i, values in enumerate(grid) for v in delete(values, points)]
+    ssr: Vector = insert(asarray(_map(refit, _profile_task, tasks, workers)).reshape(len(grid), -1), points, nan, 1)
+
+    ssr[:, points] = refit.ssr
+
+    n: int = sum(len(s) for s in refit.problem.stress)
+    statistic: Vector = n * log(ssr / refit.ssr)
+    threshold: float = float(chi2.ppf(confidence, 1))
+
+    return UncertaintyResult(
+        x=refit.x,
+        covariance=covariance,
+        lower=asarray(
+            [
+                _profile_bound(g[points::-1], s[points::-1], threshold, b)
+                for g, s, b in zip(grid, statistic, refit.lower_bound)
+            ]
+        ),
+        upper=asarray(
+            [
+                _profile_bound(g[points:], s[points:], threshold, b)
+                for g, s, b in zip(grid, statistic, refit.upper_bound)
+            ]
+        ),
+        confidence=confidence,
+        failures=int((~isfinite(statistic)).sum()),
+        grid=grid,
+        statistic=statistic,
+    )
@@ -0,0 +1,193 @@
+from numpy import abs, asarray, clip, maximum, polyfit, vstack, where
+from numpy.random import Generator, default_rng
+from scipy.stats.qmc import LatinHypercube
+
+from polymat.materials.time_invariant.eight_chain import EightChain
+from polymat.materials.time_invariant.mooney import Mooney5
+from polymat.materials.time_invariant.neo_hook import NeoHook
+from polymat.materials.time_invariant.ogden import Ogden, Ogden2
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.elastic_deformation import biaxial_stress, planar_stress, simple_shear_stress, uniaxial_stress
+from polymat.mechanics.incompressible_deformation import (
+    biaxial_stress_incompressible,
+    planar_stress_incompressible,
+    uniaxial_stress_incompressible,
+)
+from polymat.types import ElasticDeformation, ElasticModel, Vector
+
+# Range of true strain over which the initial slope of a curve is measured
+SMALL_STRAIN = 0.05
+
+# Initial slope of the true stress-strain curve in units of the shear modulus. The compressible drivers give
+# the small strain moduli of a nearly incompressible material (3G uniaxial, 6G equibiaxial, 4G planar), the
+# incompressible ones the axial Cauchy stress of the model without lateral pressure, of slope 2G in every mode.
+# The shear stress of simple shear has slope G
+SHEAR_MODULUS_FACTORS: dict[ElasticDeformation, float] = {
+    uniaxial_stress: 3.0,
+    biaxial_stress: 6.0,
+    planar_stress: 4.0,
+    simple_shear_stress: 1.0,
+    uniaxial_stress_incompressible: 2.0,
+    biaxial_stress_incompressible: 2.0,
+    planar_stress_incompressible: 2.0,
+}
+
+# Fraction of the population sampled around the guesses, the rest covering the whole search space
+WARM_FRACTION = 0.8
+
+# Standard deviation of the population around a guess, relative to its magnitude
+PERTURBATION = 0.1
+
+
+def initial_shear_modulus(
+    strain: list[Vector], stress: list[Vector], deformation_mode: list[ElasticDeformation]
+) -> float:
+    """
+    Estimates the shear modulus from the initial slope of the experimental curves.
+
+    The slope is fitted over the first SMALL_STRAIN of true strain (at least the first three points), and
+    converted with the small strain modulus of each deformation mode (see SHEAR_MODULUS_FACTORS). Curves of
+    other deformation modes are ignored.
+
+    Parameters
+    ----------
+    strain: list[Vector]
+        List of experimental true strain curves
+
+    stress: list[Vector]
+        List of experimental true stress curves
+
+    deformation_mode: list[ElasticDeformation]
+        List of corresponding stress computation functions from polymat.mechanics
+
+    Returns
+    -------
+    mu: float
+        Average shear modulus estimate of the curves
+    """
+    estimates: list[float] = []
+
+    for _strain, _stress, _deformation in zip(strain, stress, deformation_mode):
+        if _deformation not in SHEAR_MODULUS_FACTORS:
+            continue
+
+        _strain = asarray(_strain, dtype=float)
+        _stress = asarray(_stress, dtype=float)
+
+        n: int = max(int((abs(_strain) <= SMALL_STRAIN).sum()), 3)
+        slope: float = polyfit(_strain[:n], _stress[:n], 1)[0]
+
+        estimates.append(slope / SHEAR_MODULUS_FACTORS[_deformation])
+
+    if not estimates:
+        raise ValueError("No uniaxial, biaxial, planar or simple shear curve to estimate the shear modulus from")
+
+    return sum(estimates) / len(estimates)
+
+
+def shear_modulus_guess(elastic_model: ElasticModel, mu: float, lower_bound: Vector, upper_bound: Vector) -> Vector:
+    """
+    Material parameters with a given small strain shear modulus.
+
+    Parameters that do not contribute to the shear modulus (higher order terms, locking stretch, exponents,
+    bulk modulus) are set to the middle of their bounds, higher order terms to zero when within bounds.
+
+    Parameters
+    ----------
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials.time_invariant
+
+    mu: float
+        Shear modulus, e.g. from initial_shear_modulus
+
+    lower_bound: Vector
+        Lower bound for the search space
+
+    upper_bound: Vector
+        Upper bound for the search space
+
+    Returns
+    -------
+    params: Vector
+        Material parameters within the bounds
+    """
+    lower_bound = asarray(lower_bound, dtype=float)
+    upper_bound = asarray(upper_bound, dtype=float)
+
+    params: Vector = (lower_bound + upper_bound) / 2.0
+
+    if elastic_model in (NeoHook, EightChain):
+        params[0] = mu
+
+    elif elastic_model in (Yeoh, Mooney5):
+        # Higher order terms, after C10 and before the bulk modulus of a compressible model
+        order: slice = slice(1, 3 if elastic_model is Yeoh else 5)
+        params[order] = clip(0.0, lower_bound[order], upper_bound[order])
+        params[0] = mu / 2.0
+
+    elif elastic_model in (Ogden, Ogden2):
+        N: int = len(params) // 2
+        alpha: Vector = params[N : 2 * N]
+
+        # mu = sum(mu_i) for Ogden, sum(mu_i * alpha_i) / 2 for Ogden2
+        params[0:N] = mu / N if elastic_model is Ogden else 2.0 * mu / (N * where(alpha == 0.0, 1.0, alpha))
+
+    else:
+        raise ValueError(f"No shear modulus guess for the material model {elastic_model}")
+
+    return clip(params, lower_bound, upper_bound)
+
+
+def initial_population(
+    lower_bound: Vector,
+    upper_bound: Vector,
+    guesses: list[Vector],
+    size: int,
+    rng: Generator | int | None = None,
+) -> Vector:
+    """
+    Initial differential evolution population seeded with guesses of the material parameters.
+
+    The population holds each guess, WARM_FRACTION of its members sampled around the guesses and the rest from
+    a Latin hypercube over the whole search space, so that the search still explores beyond the guesses.
+
+    Parameters
+    ----------
+    lower_bound: Vector
+        Lower bound for the search space
+
+    upper_bound: Vector
+        Upper bound for the search space
+
+    guesses: list[Vector]
+        Parameter guesses, e.g. previous calibrations of the same material family, clipped to the bounds
+
+    size: int
+        Number of members of the population
+
+    rng: Generator | int | None = None
+        Random number generator or seed
+
+    Returns
+    -------
+    population: Vector
+        Matrix of shape (size,S), one parameter set per row
+    """
+    lower_bound = asarray(lower_bound, dtype=float)
+    upper_bound = asarray(upper_bound, dtype=float)
+
+    rng = default_rng(rng)
+
+    warm: Vector = clip(vstack([asarray(g, dtype=float) for g in guesses]), lower_bound, upper_bound)
+
+    n_warm: int = min(max(int(WARM_FRACTION * size), len(warm)), size)
+
+    centers: Vector = warm[[i % len(warm) for i in range(n_warm)]]
+    scale: Vector = PERTURBATION * maximum(abs(centers), 1e-3 * (upper_bound - lower_bound))
+
+    perturbed: Vector = centers + scale * rng.standard_normal(centers.shape)
+    perturbed[: len(warm)] = warm
+
+    sampled: Vector = LatinHypercube(d=len(lower_bound), rng=rng).random(size - n_warm)
+
+    return clip(vstack([perturbed, lower_bound + sampled * (upper_bound - lower_bound)]), lower_bound, upper_bound)
@@ -0,0 +1,325 @@
+from numpy import (
+    abs,
+    arange,
+    asarray,
+    broadcast_to,
+    clip,
+    cumsum,
+    empty,
+    errstate,
+    eye,
+    full,
+    isfinite,
+    maximum,
+    minimum,
+    nan,
+    r_,
+    repeat,
+    searchsorted,
+    sqrt,
+    swapaxes,
+    trace,
+    where,
+    zeros,
+)
+from numpy.linalg import det, inv
+
+from polymat.materials.time_invariant.eight_chain import EightChain
+from polymat.mechanics.kinematics import Kinematics, kinematics
+from polymat.types import Tensor, Vector
+
+# Relative and absolute tolerances on the components of the viscous deformation gradient
+FLOW_RTOL = 1e-5
+FLOW_ATOL = 1e-7
+
+# Largest number of history points spanned by one integration step, so that steps do not skip over loading
+MAX_STEP_POINTS = 16
+
+MAX_STEPS = 100000
+
+# Relative step of the forward difference Jacobian of the flow
+FLOW_FD_STEP = 1e-7
+
+# Coefficients of the Rosenbrock pair of Shampine and Reichelt
+ROSENBROCK_D = 1.0 / (2.0 + sqrt(2.0))
+ROSENBROCK_E32 = 6.0 + sqrt(2.0)
+
+STEP_SAFETY = 0.9
+STEP_MIN_FACTOR = 0.2
+STEP_MAX_FACTOR = 5.0
+
+
+def _interpolate(time: Vector, F: Tensor, t: Vector) -> Tensor:
+    """
+    Deformation gradients at times t, linearly interpolated in the history.
+    """
+    i: Vector = clip(searchsorted(time, t, side="right") - 1, 0, len(time) - 2)
+
+    dt: Vector = time[i + 1] - time[i]
+    w: Vector = clip((t - time[i]) / where(dt > 0.0, dt, 1.0), 0.0, 1.0)
+
+    return F[i] + w[..., None, None] * (F[i + 1] - F[i])
+
+
+def _solve(W_inv: Tensor, b: Tensor) -> Tensor:
+    """
+    Solves the linear systems of a Rosenbrock stage, for right-hand sides of shape (P,3,3).
+    """
+    return (W_inv @ b.reshape(-1, 9, 1)).reshape(-1, 3, 3)
+
+
+def bergstrom_boyce_flow(F: Tensor, Fv: Tensor, params: Vector, method: str = "bergstrom") -> Tensor:
+    """
+    Rate of the viscous deformation gradient of the Bergstrom-Boyce model.
+
+    The viscous network B, of deformation gradient F = Fe Fv, flows with the rate of viscous deformation
+
+        Dv = gamma_dot / tau sigma_B,  gamma_dot = (lambda_v - 1 + xi)^C (tau / tauHat)^m
+
+    with tau the Frobenius norm of the (deviatoric) stress sigma_B of network B and lambda_v the chain stretch of
+    Fv, and without viscous spin, so that dFv/dt = Fe^-1 Dv F.
+
+    Parameters
+    ----------
+    F : Tensor
+        Deformation gradient tensors of shape (P,3,3)
+
+    Fv : Tensor
+        Viscous deformation gradient tensors of shape (P,3,3)
+
+    params : Vector
+        Material parameters [mu, lambdaL, kappa, s, xi, C, tauHat, m], each of shape (P,)
+
+    method : str = "bergstrom"
+        Approximation of the inverse Langevin function, see INVERSE_LANGEVIN
+
+    Returns
+    -------
+    dFv : Tensor
+        Time derivative of Fv, of shape (P,3,3)
+    """
+    mu, lambdaL, _, s, xi, C, tauHat, m = params
+
+    Fv_inv: Tensor = inv(Fv)
+    Fe: Tensor = F @ Fv_inv
+
+    sigmaB: Tensor = EightChain(Fe, [s * mu, lambdaL, 0.0 * mu], method)
+
+    tau: Vector = sqrt((sigmaB**2).sum(axis=(-2, -1)))
+    lam_v: Vector = sqrt(trace(Fv @ swapaxes(Fv, -1, -2), axis1=-2, axis2=-1) / 3.0)
+
+    gamma_dot: Vector = (lam_v - 1.0 + xi) ** C * (tau / tauHat) ** m
+
+    Dv: Tensor = where(tau > 0.0, gamma_dot / where(tau > 0.0, tau, 1.0), 0.0)[..., None, None] * sigmaB
+
+    return Fv @ inv(F) @ Dv @ F
+
+
+def bergstrom_boyce_viscous_stretch(
+    F: Tensor,
+    time: Vector,
+    params: Vector,
+    method: str = "bergstrom",
+    full_output: bool = False,
+) -> Tensor | tuple[Tensor, Vector]:
+    """
+    Integrates the viscous deformation gradient of the Bergstrom-Boyce model over a deformation history.
+
+    The flow is integrated from Fv = I by the linearly implicit Rosenbrock pair of Shampine and Reichelt
+    (orders 2 and 3, as in MATLAB's ode23s) with error control, for every parameter set at once, each with its
+    own step size. Being L-stable, the steps grow where the flow is slow even once the viscous network has
+    relaxed, where explicit schemes are limited by stability, up to MAX_STEP_POINTS history points. The
+    Jacobian of the flow is approximated by forward differences, evaluated in one batched call, and the
+    deformation gradient is linearly interpolated in time within a step. Fv at the history points is obtained by
+    cubic Hermite interpolation within the steps. Parameter sets whose integration fails (non-finite flow or
+    MAX_STEPS exceeded) are NaN.
+
+    Parameters
+    ----------
+    F : Tensor
+        Deformation gradient history of shape (N,3,3)
+
+    time : Vector
+        Increasing time points of shape (N,)
+
+    params : Vector
+        Material parameters [mu, lambdaL, kappa, s, xi, C, tauHat, m] of shape (8,P)
+
+    method : str = "bergstrom"
+        Approximation of the inverse Langevin function, see INVERSE_LANGEVIN
+
+    full_output : bool = False
+        If True, the number of accepted steps of each parameter set is also returned
+
+    Returns
+    -------
+    Fv : Tensor
+        Viscous deformation gradient histories of shape (P,N,3,3)
+
+    steps : Vector
+        Accepted integration steps per parameter set, only if full_output is True
+    """
+    F = asarray(F, dtype=float)
+    time = asarray(time, dtype=float)
+    params = asarray(params, dtype=float)
+
+    N: int = len(time)
+    P: int = params.shape[1]
+
+    Fv_history: Tensor = empty((P, N, 3, 3))
+    Fv_history[:, 0] = eye(3)
+
+    steps: Vector = full(P, 0)
+
+    if N == 1:
+        return (Fv_history, steps) if full_output else Fv_history
+
+    def flow(t: Vector, Fv: Tensor, members: Vector) -> Tensor:
+        # Trial steps that overshoot into non-physical states give non-finite rates, and are rejected
+        with errstate(invalid="ignore", divide="ignore", over="ignore"):
+            return bergstrom_boyce_flow(_interpolate(time, F, t), Fv, params[:, members], method)
+
+    # Perturbations of the 9 components of Fv and of time, stacked on a leading axis
+    perturbation: Tensor = r_[eye(9), zeros((1, 9))].reshape(10, 1, 3, 3)
+    delay: Vector = r_[zeros(9), 1.0][:, None]
+
+    members: Vector = arange(P)
+
+    t: Vector = full(P, time[0])
+    Fv: Tensor = broadcast_to(eye(3), (P, 3, 3)).copy()
+    dFv: Tensor = flow(t, Fv, members)
+    h: Vector = full(P, (time[1] - time[0]) or (time[-1] - time[0]) / N)
+
+    h_min: float = 1e-12 * (time[-1] - time[0])
+
+    for _ in range(MAX_STEPS):
+        # Steps end at most MAX_STEP_POINTS history points ahead, exactly on the last one
+        limit: Vector = time[minimum(searchsorted(time, t, side="right") + MAX_STEP_POINTS - 1, N - 1)]
+        last: Vector = h >= limit - t
+        h = where(last, limit - t, h)
+
+        # Forward difference Jacobian of the flow with respect to Fv, and derivative with respect to time
+        dt: Vector = FLOW_FD_STEP * h
+        perturbed: Tensor = flow(t + delay * dt, Fv + FLOW_FD_STEP * perturbation, members)
+
+        jacobian: Tensor = swapaxes((perturbed[:9] - dFv).reshape(9, -1, 9), 0, 1).swapaxes(-1, -2) / FLOW_FD_STEP
+        dflow_dt: Tensor = (perturbed[9] - dFv).reshape(-1, 9) / dt[:, None]
+
+        W: Tensor = eye(9) - (ROSENBROCK_D * h)[:, None, None] * jacobian
+        valid: Vector = isfinite(W).all(axis=(-2, -1))
+        W[~valid] = eye(9)
+        valid &= det(W) != 0.0
+        W[~valid] = eye(9)
+        W_inv: Tensor = inv(W)
+
+        hdT: Tensor = (ROSENBROCK_D * h)[:, None, None] * dflow_dt.reshape(-1, 3, 3)
+
+        f0: Tensor = dFv
+        k1: Tensor = _solve(W_inv, f0 + hdT)
+        f1: Tensor = flow(t + h / 2.0, Fv + (h / 2.0)[:, None, None] * k1, members)
+        k2: Tensor = _solve(W_inv, f1 - k1) + k1
+
+        t_new: Vector = where(last, limit, t + h)
+        Fv_new: Tensor = Fv + h[:, None, None] * k2
+        f2: Tensor = flow(t_new, Fv_new, members)
+        k3: Tensor = _solve(W_inv, f2 - ROSENBROCK_E32 * (k2 - f1) - 2.0 * (k1 - f0) + hdT)
+
+        error: Tensor = (h / 6.0)[:, None, None] * (k1 - 2.0 * k2 + k3)
+        scale: Tensor = FLOW_ATOL + FLOW_RTOL * maximum(abs(Fv), abs(Fv_new))
+
+        err: Vector = (abs(error) / scale).max(axis=(-2, -1))
+        valid &= isfinite(err) & isfinite(f2).all(axis=(-2, -1))
+        accepted: Vector = valid & (err <= 1.0)
+
+        # Cubic Hermite interpolation of the history points within the accepted steps
+        a: Vector = accepted.nonzero()[0]
+        first: Vector = searchsorted(time, t[a], side="right")
+        counts: Vector = searchsorted(time, t_new[a], side="right") - first
+
+        step: Vector = repeat(arange(len(a)), counts)
+        index: Vector = arange(counts.sum()) - repeat(cumsum(counts) - counts, counts) + repeat(first, counts)
+
+        if len(index):
+            _a: Vector = a[step]
+            _h: Vector = h[_a][:, None, None]
+            x: Vector = ((time[index] - t[_a]) / h[_a])[:, None, None]
+
+            Fv_history[members[_a], index] = (
+                (1.0 + 2.0 * x) * (1.0 - x) ** 2 * Fv[_a]
+                + x * (1.0 - x) ** 2 * _h * f0[_a]
+                + x**2 * (3.0 - 2.0 * x) * Fv_new[_a]
+                + x**2 * (x - 1.0) * _h * f2[_a]
+            )
+
+        t[a] = t_new[a]
+        Fv[a] = Fv_new[a]
+        dFv[a] = f2[a]
+        steps[members[a]] += 1
+
+        factor: Vector = STEP_SAFETY * where(err > 0.0, err, 1e-12) ** (-1.0 / 3.0)
+        h = where(valid, h * clip(factor, STEP_MIN_FACTOR, STEP_MAX_FACTOR), h * STEP_MIN_FACTOR)
+
+        failed: Vector = h < h_min
+        Fv_history[members[failed]] = nan
+
+        active: Vector = (t < time[-1]) & ~failed
+
+        if not active.any():
+            break
+
+        members, t, Fv, dFv, h = members[active], t[active], Fv[active], dFv[active], h[active]
+
+    else:
+        Fv_history[members] = nan
+
+    if full_output:
+        return Fv_history, steps
+
+    return Fv_history
+
+
+def BergstromBoyce(F: Tensor | Kinematics, time: Vector, params: Vector, method: str = "bergstrom") -> Tensor:
+    """
+    Bergstrom-Boyce two-network viscoelastic material model.
+
+    An equilibrium Eight-Chain network A is in parallel with a viscous network B, made of an Eight-Chain
+    network of shear modulus s mu in series with a viscous flow element (see bergstrom_boyce_flow). Both
+    networks share the locking stretch, the bulk modulus acts on network A only. The time unit of the flow
+    rate (lambda_v - 1 + xi)^C (tau / tauHat)^m is the one of time.
+
+    Parameters
+    ----------
+    F : Tensor | Kinematics
+        Deformation gradient history of shape (N,3,3) or its Kinematics
+
+    time : Vector
+        Increasing time points of shape (N,)
+
+    params : Vector
+        Material parameters [mu, lambdaL, kappa, s, xi, C, tauHat, m], or parameter sets of shape (8,P) or
+        (8,P,1) as prepared by population_params
+
+    method : str = "bergstrom"
+        Approximation of the inverse Langevin function, see INVERSE_LANGEVIN
+
+    Returns
+    -------
+    Stress : Tensor
+        Cauchy stress history, with the same shape as F (or (P,N,3,3) for P parameter sets)
+    """
+    K: Kinematics = kinematics(F)
+
+    _params: Vector = asarray(params, dtype=float)
+    members: Vector = _params.reshape(len(_params), -1)
+
+    Fv: Tensor = bergstrom_boyce_viscous_stretch(K.F, time, members, method)
+
+    mu, lambdaL, kappa, s = (p[:, None] for p in members[:4])
+
+    Stress: Tensor = EightChain(K.F, [mu, lambdaL, kappa], method)
+    Stress = Stress + EightChain(K.F @ inv(Fv), [s * mu, lambdaL, 0.0 * mu], method)
+
+    if _params.ndim == 1:
+        return Stress[0]
+
+    return Stress
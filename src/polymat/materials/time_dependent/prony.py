@@ -0,0 +1,150 @@
+from numpy import asarray, cumsum, diff, exp, expm1, ones, r_, searchsorted, swapaxes, where, zeros_like
+
+from polymat.mechanics.kinematics import Kinematics, kinematics
+from polymat.types import ElasticModel, Tensor, Vector
+
+# Largest time span of a block of the relaxation scan, in units of the shortest relaxation time, which keeps
+# the exponential weights of a block below exp(SCAN_SPAN)
+SCAN_SPAN = 200.0
+
+
+def _prony_terms(params: Vector, terms: int) -> tuple[Vector, Vector, Vector]:
+    """
+    Splits Prony parameters into the hyperelastic parameters, and the relative moduli and relaxation times of
+    shape (terms,1,1,1) or (terms,P,1,1,1), broadcasting against stress histories of shape (N,3,3) or (P,N,3,3).
+    """
+    _params: Vector = asarray(params, dtype=float)
+
+    n: int = len(_params) - 2 * terms
+
+    g: Vector = _params[n : n + terms]
+    tau: Vector = _params[n + terms :]
+
+    # Parameter sets prepared by population_params already end with the axis of the history
+    if g.ndim == 1:
+        g = g[:, None]
+        tau = tau[:, None]
+
+    return _params[:n], g[..., None, None], tau[..., None, None]
+
+
+def relaxation_scan(increments: Tensor, time: Vector, tau: Vector) -> Tensor:
+    """
+    Sums of exponentially decaying increments, H_n = sum_k exp(-(t_n - t_k) / tau) u_k, over a history.
+
+    Equivalent to the recursive update H_n = exp(-(t_n - t_(n-1)) / tau) H_(n-1) + u_n, evaluated by blocks of
+    the history spanning at most SCAN_SPAN shortest relaxation times: within a block, the decayed sum is a
+    cumulative sum of the increments weighted by exp((t_k - t_s) / tau), rescaled by exp(-(t_n - t_s) / tau).
+    The cost is linear in the number of points, and the blocks make as many vectorized steps as the history
+    spans multiples of SCAN_SPAN shortest relaxation times.
+
+    Parameters
+    ----------
+    increments : Tensor
+        Increments u_n, of shape (...,N,3,3) with the history along the third to last axis
+
+    time : Vector
+        Increasing time points of shape (N,)
+
+    tau : Vector
+        Relaxation times, broadcasting against increments
+
+    Returns
+    -------
+    H : Tensor
+        Decayed sums, with the broadcast shape of increments and tau
+    """
+    time = asarray(time, dtype=float)
+    tau = asarray(tau, dtype=float)
+
+    u: Tensor = asarray(increments, dtype=float) * ones(tau.shape)
+    H: Tensor = zeros_like(u)
+
+    span: float = SCAN_SPAN * float(tau.min())
+    dt: Vector = time[:, None, None] - time[0]
+
+    start: int = 0
+
+    while start < len(time):
+        end: int = max(int(searchsorted(time, time[start] + span, side="right")), start + 1)
+
+        block: slice = slice(start, end)
+        elapsed: Vector = (dt[block] - dt[start]) / tau
+
+        H[..., block, :, :] = exp(-elapsed) * cumsum(exp(elapsed) * u[..., block, :, :], axis=-3)
+
+        if start > 0:
+            H[..., block, :, :] += exp(-(dt[block] - dt[start - 1]) / tau) * H[..., start - 1 : start, :, :]
+
+        start = end
+
+    return H
+
+
+def Prony(
+    F: Tensor | Kinematics,
+    time: Vector,
+    params: Vector,
+    elastic_model: ElasticModel,
+    terms: int = 1,
+) -> Tensor:
+    """
+    Finite strain viscoelastic material model, relaxing the stress of a hyperelastic model by a Prony series.
+
+    The second Piola-Kirchhoff stress of the hyperelastic model S0 (its instantaneous response) is relaxed as
+
+        S(t) = g_inf S0(t) + sum_i H_i(t),  H_i(t) = integral g_i exp(-(t - s) / tau_i) dS0/ds ds
+
+    with g_inf = 1 - sum_i g_i, and pushed forward to the Cauchy stress. The convolution integrals are updated
+    recursively with the exponential integrator of a linear S0 within each time step,
+
+        H_i(t_n) = exp(-dt / tau_i) H_i(t_(n-1)) + g_i (1 - exp(-dt / tau_i)) / (dt / tau_i) (S0(t_n) - S0(t_(n-1)))
+
+    evaluated over the whole history at once by relaxation_scan, so that the cost of N steps is O(N terms).
+    The history starts from the instantaneous response at the first time point. Use functools.partial to fix
+    elastic_model and terms, e.g. partial(Prony, elastic_model=Yeoh, terms=2).
+
+    Parameters
+    ----------
+    F : Tensor | Kinematics
+        Deformation gradient history of shape (N,3,3) or its Kinematics
+
+    time : Vector
+        Increasing time points of shape (N,)
+
+    params : Vector
+        Material parameters [*elastic params, g1, g2, ..., tau1, tau2, ...], the hyperelastic parameters
+        followed by the relative moduli and relaxation times of the Prony terms
+
+    elastic_model : ElasticModel
+        Hyperelastic material model from polymat.materials.time_invariant
+
+    terms : int = 1
+        Number of Prony terms
+
+    Returns
+    -------
+    Stress : Tensor
+        Cauchy stress history, with the same shape as F (or (P,N,3,3) for P parameter sets)
+    """
+    elastic_params, g, tau = _prony_terms(params, terms)
+
+    K: Kinematics = kinematics(F)
+
+    time = asarray(time, dtype=float)
+
+    # Pull back of the instantaneous Cauchy stress, S0 = J F^-1 sigma0 F^-T
+    S0: Tensor = K.J[..., None, None] * (swapaxes(K.FinvT, -1, -2) @ elastic_model(K, elastic_params) @ K.FinvT)
+
+    # Exponential integrator weights of the steps, the first increment being the instantaneous response
+    x: Vector = r_[0.0, diff(time)][:, None, None] / tau
+    weight: Vector = where(x > 0.0, -expm1(-x) / where(x > 0.0, x, 1.0), 1.0)
+
+    increments: Tensor = S0.copy()
+    increments[..., 1:, :, :] -= S0[..., :-1, :, :]
+
+    H: Tensor = relaxation_scan(g * weight * increments, time, tau)
+
+    S: Tensor = (1.0 - g.sum(axis=0)) * S0 + H.sum(axis=0)
+
+    return K.F @ S @ swapaxes(K.F, -1, -2) / K.J[..., None, None]
@@ -1,40 +1,190 @@
-from numpy import dot, eye, sign, spacing, sqrt, tan, trace
-from numpy.linalg import det
+from collections.abc import Callable
 
-from polymat.types import Scalar, Tensor, Vector
+from numpy import (
+    abs,
+    asarray,
+    broadcast_arrays,
+    clip,
+    cos,
+    einsum,
+    exp,
+    expm1,
+    eye,
+    maximum,
+    minimum,
+    polyval,
+    sign,
+    spacing,
+    sqrt,
+    stack,
+    tan,
+    tanh,
+    where,
+)
 
+from polymat.mechanics.kinematics import Kinematics, kinematics
+from polymat.types import Tensor, Vector
 
-def invLangevin(x: float) -> float:
+# Coefficients of the Kroger (2015) rational approximation
+_KROGER_NUM: tuple[float, ...] = (
+    3.0,
+    0.0,
+    -773.0 / 768.0,
+    0.0,
+    -1300.0 / 1351.0,
+    0.0,
+    501.0 / 340.0,
+    0.0,
+    -678.0 / 1379.0,
+)
+_KROGER_DEN: float = 866.0 / 853.0
+
+NEWTON_ITER = 3
+LANGEVIN_SERIES_LIMIT = 0.05
+
+
+def _bergstrom(x: Vector) -> tuple[Vector, Vector]:
+    xt: Vector = minimum(x, 0.839)
+    xr: Vector = maximum(x, 0.839)
+
+    y: Vector = where(x < 0.839, 1.31435 * tan(1.59 * xt) + 0.911249 * xt, 1.0 / (1.0 - xr))
+    dy: Vector = where(x < 0.839, 1.31435 * 1.59 / cos(1.59 * xt) ** 2 + 0.911249, 1.0 / (1.0 - xr) ** 2)
+
+    return y, dy
+
+
+def _cohen(x: Vector) -> tuple[Vector, Vector]:
+    return x * (3.0 - x**2) / (1.0 - x**2), (3.0 + x**4) / (1.0 - x**2) ** 2
+
+
+def _jedynak(x: Vector) -> tuple[Vector, Vector]:
+    num: Vector = x * (3.0 - 2.6 * x + 0.7 * x**2)
+    den: Vector = (1.0 - x) * (1.0 + 0.1 * x)
+
+    dnum: Vector = 3.0 - 5.2 * x + 2.1 * x**2
+    dden: Vector = -0.9 - 0.2 * x
+
+    return num / den, (dnum * den - num * dden) / den**2
+
+
+def _rational(x: Vector) -> tuple[Vector, Vector]:
+    num: Vector = x * polyval(_KROGER_NUM[::-1], x)
+    den: Vector = (1.0 - x) * (1.0 + _KROGER_DEN * x)
+
+    dnum: Vector = polyval([(k + 1) * c for k, c in enumerate(_KROGER_NUM)][::-1], x)
+    dden: Vector = _KROGER_DEN - 1.0 - 2.0 * _KROGER_DEN * x
+
+    return num / den, (dnum * den - num * dden) / den**2
+
+
+def _langevin(y: Vector) -> tuple[Vector, Vector]:
+    """
+    Langevin function L(y) = coth(y) - 1/y and its derivative for y >= 0, using the Taylor series close to zero.
+    """
+    ys: Vector = minimum(y, LANGEVIN_SERIES_LIMIT)
+    yl: Vector = maximum(y, LANGEVIN_SERIES_LIMIT)
+
+    exp2: Vector = exp(-2.0 * yl)
+
+    L: Vector = where(
+        y < LANGEVIN_SERIES_LIMIT,
+        ys / 3.0 - ys**3 / 45.0 + 2.0 * ys**5 / 945.0 - ys**7 / 4725.0,
+        1.0 / tanh(yl) - 1.0 / yl,
+    )
+    dL: Vector = where(
+        y < LANGEVIN_SERIES_LIMIT,
+        1.0 / 3.0 - ys**2 / 15.0 + 2.0 * ys**4 / 189.0 - ys**6 / 675.0,
+        1.0 / yl**2 - 4.0 * exp2 / expm1(-2.0 * yl) ** 2,
+    )
+
+    return L, dL
+
+
+def _newton(x: Vector) -> tuple[Vector, Vector]:
+    y, _ = _bergstrom(x)
+
+    # Quadratic convergence from the Bergstrom estimate, whose relative error is below 1e-3
+    for _ in range(NEWTON_ITER):
+        L, dL = _langevin(y)
+        y = maximum(y - (L - x) / dL, 0.0)
+
+    _, dL = _langevin(y)
+
+    return y, 1.0 / dL
+
+
+# Approximations of the inverse Langevin function on [0, 1), returning the value and its derivative.
+# Maximum relative errors over the whole domain:
+#   bergstrom   8.6e-4  (Bergstrom, 1999)
+#   cohen       4.9e-2  (Cohen Pade approximant, 1991)
+#   jedynak     1.5e-2  (Jedynak, 2015)
+#   rational    1.5e-3  (Kroger, 2015)
+#   newton      1e-12   (residual of L(y) = x, Bergstrom estimate refined by Newton iterations)
+INVERSE_LANGEVIN: dict[str, Callable[[Vector], tuple[Vector, Vector]]] = {
+    "bergstrom": _bergstrom,
+    "cohen": _cohen,
+    "jedynak": _jedynak,
+    "rational": _rational,
+    "newton": _newton,
+}
+
+
+def invLangevin(x: Vector, method: str = "bergstrom") -> Vector:
     """
     Inverse of the Langevin function defined as L(x) = coth(x) - 1/x.
 
-    Uses the Bergstrom approach.
+    Evaluated element-wise for array inputs, see INVERSE_LANGEVIN for the available approximations
+    and their accuracy.
 
     Parameters
     ----------
-    x: float
+    x: Vector
         Input to the inverse function
 
+    method: str = "bergstrom"
+        Approximation of the inverse function, "bergstrom", "cohen", "jedynak", "rational" or "newton"
+
     Returns
     -------
-    y: float
+    y: Vector
         Result of the inverse function
     """
     eps: float = spacing(1.0)
 
-    if x >= 1 - eps:
-        x = 1 - eps
+    x = clip(x, -1 + eps, 1 - eps)
 
-    if x <= -1 + eps:
-        x = -1 + eps
+    y, _ = INVERSE_LANGEVIN[method](abs(x))
 
-    if abs(x) < 0.839:
-        return 1.31435 * tan(1.59 * x) + 0.911249 * x
+    return sign(x) * y
 
-    return 1.0 / (sign(x) - x)
 
+def dinvLangevin(x: Vector, method: str = "bergstrom") -> Vector:
+    """
+    Derivative of the approximation of the inverse Langevin function.
 
-def EightChain(F: Tensor, params: Vector) -> Tensor:
+    Parameters
+    ----------
+    x: Vector
+        Input to the inverse function
+
+    method: str = "bergstrom"
+        Approximation of the inverse function, as in invLangevin
+
+    Returns
+    -------
+    dy: Vector
+        Derivative of invLangevin at x
+    """
+    eps: float = spacing(1.0)
+
+    x = clip(x, -1 + eps, 1 - eps)
+
+    _, dy = INVERSE_LANGEVIN[method](abs(x))
+
+    return dy
+
+
+def EightChain(F: Tensor | Kinematics, params: Vector, method: str = "bergstrom") -> Tensor:
     """
     Arruda-Boyce Eight-Chain hyperelastic material model.
 
@@ -42,33 +192,139 @@ def EightChain(F: Tensor, params: Vector) -> Tensor:
 
     Parameters
     ----------
-    F : Tensor
-        Deformation gradient tensor as np.ndarray of size (3x3)
+    F : Tensor | Kinematics
+        Deformation gradient tensor as np.ndarray of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
 
     params : Vector
         Material parameters [mu, lambdaL, kappa]
 
+    method : str = "bergstrom"
+        Approximation of the inverse Langevin function, see INVERSE_LANGEVIN
+
     Returns
     -------
     Tensor
-        Cauchy stress tensor as np.ndarray of size (3x3)
+        Cauchy stress tensor as np.ndarray with the same shape as F
     """
     mu: float = params[0]
     lambdaL: float = params[1]
     kappa: float = params[2]
 
-    J: Scalar = det(F)
+    K: Kinematics = kinematics(F)
 
-    bstar: Tensor = J ** (-2.0 / 3.0) * dot(F, F.T)
+    J: Vector = K.J
 
-    dev_bstar: Tensor = bstar - trace(bstar) / 3.0 * eye(3)
+    dev_bstar: Tensor = K.dev_bstar
 
-    lam_chain: Scalar = sqrt(trace(bstar) / 3.0)
+    lam_chain: Vector = sqrt(K.I1star / 3.0)
 
-    Stress_dev: Tensor = (
-        mu / (J * lam_chain) * invLangevin(lam_chain / lambdaL) / invLangevin(1.0 / lambdaL) * dev_bstar
-    )
+    # Parameter-only factor, evaluated once per parameter set before broadcasting over the strain points
+    mu_lock: Vector = mu / invLangevin(1.0 / asarray(lambdaL), method)
 
-    Stress_vol: Tensor = kappa * (J - 1.0) * eye(3)
+    Stress_dev: Tensor = (mu_lock / (J * lam_chain) * invLangevin(lam_chain / lambdaL, method))[
+        ..., None, None
+    ] * dev_bstar
+
+    Stress_vol: Tensor = (kappa * (J - 1.0))[..., None, None] * eye(3)
 
     return Stress_dev + Stress_vol
+
+
+def dEightChain_dparams(F: Tensor | Kinematics, params: Vector, method: str = "bergstrom") -> Tensor:
+    """
+    Derivatives of the Arruda-Boyce Eight-Chain Cauchy stress with respect to the material parameters.
+
+    Parameters
+    ----------
+    F : Tensor | Kinematics
+        Deformation gradient tensor as np.ndarray of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
+
+    params : Vector
+        Material parameters [mu, lambdaL, kappa]
+
+    method : str = "bergstrom"
+        Approximation of the inverse Langevin function, see INVERSE_LANGEVIN
+
+    Returns
+    -------
+    Tensor
+        Stress derivatives of shape (3,...,3,3), one per material parameter
+    """
+    mu: float = params[0]
+    lambdaL: float = params[1]
+
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    dev_bstar: Tensor = K.dev_bstar
+
+    lam_chain: Vector = sqrt(K.I1star / 3.0)
+
+    L_chain: Vector = invLangevin(lam_chain / lambdaL, method)
+    L_lock: Vector = invLangevin(1.0 / asarray(lambdaL), method)
+
+    # Derivative of the ratio invLangevin(lam_chain / lambdaL) / invLangevin(1 / lambdaL)
+    dRatio_dlambdaL: Vector = (
+        -lam_chain * dinvLangevin(lam_chain / lambdaL, method) * L_lock
+        + dinvLangevin(1.0 / asarray(lambdaL), method) * L_chain
+    ) / (lambdaL**2 * L_lock**2)
+
+    dStress_dmu: Tensor = (1.0 / (J * lam_chain) * L_chain / L_lock)[..., None, None] * dev_bstar
+
+    dStress_dlambdaL: Tensor = (mu / (J * lam_chain) * dRatio_dlambdaL)[..., None, None] * dev_bstar
+
+    dStress_dkappa: Tensor = (J - 1.0)[..., None, None] * eye(3)
+
+    return stack(broadcast_arrays(dStress_dmu, dStress_dlambdaL, dStress_dkappa))
+
+
+def dEightChain_dF(F: Tensor | Kinematics, params: Vector, method: str = "bergstrom") -> Tensor:
+    """
+    Derivatives of the Arruda-Boyce Eight-Chain Cauchy stress with respect to the deformation gradient.
+
+    Parameters
+    ----------
+    F : Tensor | Kinematics
+        Deformation gradient tensor as np.ndarray of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
+
+    params : Vector
+        Material parameters [mu, lambdaL, kappa]
+
+    method : str = "bergstrom"
+        Approximation of the inverse Langevin function, see INVERSE_LANGEVIN
+
+    Returns
+    -------
+    Tensor
+        Stress derivatives of shape (...,3,3,3,3), dStress[..., i, j, k, l] of Stress_ij with respect to F_kl
+    """
+    mu: float = params[0]
+    lambdaL: float = params[1]
+    kappa: float = params[2]
+
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    lam_chain: Vector = sqrt(K.I1star / 3.0)
+
+    mu_lock: Vector = mu / invLangevin(1.0 / asarray(lambdaL), method)
+
+    L_chain: Vector = invLangevin(lam_chain / lambdaL, method)
+    dL_chain: Vector = dinvLangevin(lam_chain / lambdaL, method) / lambdaL
+
+    factor: Vector = mu_lock / (J * lam_chain) * L_chain
+
+    # Derivative of the factor of dev_bstar, through J and lam_chain (dlam_chain = dI1star / (6 lam_chain))
+    dFactor_dlam: Vector = mu_lock / J * (dL_chain / lam_chain - L_chain / lam_chain**2)
+
+    dFactor: Tensor = (dFactor_dlam / (6.0 * lam_chain))[..., None, None] * K.dI1star_dF
+    dFactor -= (factor / J)[..., None, None] * K.dJ_dF
+
+    dStress_dev: Tensor = factor[..., None, None, None, None] * K.ddev_bstar_dF
+    dStress_dev += einsum("...ij,...kl->...ijkl", K.dev_bstar, dFactor)
+
+    dStress_vol: Tensor = einsum("ij,...kl->...ijkl", eye(3), (kappa * K.J)[..., None, None] * K.FinvT)
+
+    return dStress_dev + dStress_vol
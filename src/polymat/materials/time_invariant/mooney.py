@@ -1,10 +1,10 @@
-from numpy import dot, eye, trace
-from numpy.linalg import det
+from numpy import asarray, broadcast_arrays, einsum, eye, stack
 
+from polymat.mechanics.kinematics import Kinematics, kinematics
 from polymat.types import Tensor, Vector
 
 
-def Mooney5(F: Tensor, params: Vector) -> Tensor:
+def Mooney5(F: Tensor | Kinematics, params: Vector) -> Tensor:
     """
     Mooney 5-terms polynomial hyperelastic material model.
 
@@ -12,8 +12,8 @@ def Mooney5(F: Tensor, params: Vector) -> Tensor:
 
     Parameters
     ----------
-    F: Tensor
-        Deformation gradient tensor as array of size (3x3)
+    F: Tensor | Kinematics
+        Deformation gradient tensor as array of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
 
     params: Vector
         Material parameters [C10, C02, C11, C20, C30, kappa]
@@ -21,7 +21,7 @@ def Mooney5(F: Tensor, params: Vector) -> Tensor:
     Returns
     -------
     Stress: Tensor
-        Cauchy stress tensor
+        Cauchy stress tensor, with the same shape as F
     """
     C10: float = params[0]
     C01: float = params[1]
@@ -30,28 +30,142 @@ def Mooney5(F: Tensor, params: Vector) -> Tensor:
     C30: float = params[4]
     kappa: float = params[5]
 
-    J: float = det(F)
+    K: Kinematics = kinematics(F)
 
-    Fstar: Tensor = J ** (-1.0 / 3.0) * F
+    J: Vector = K.J
 
-    bstar: Tensor = dot(Fstar, Fstar.T)
+    I1star: Vector = K.I1star
 
-    bstar2: Tensor = dot(bstar, bstar)
+    I2star: Vector = K.I2star
 
-    I1star: float = trace(bstar)
+    dPhi_dI1star: Vector = C10 + C11 * (I2star - 3.0) + 2.0 * C20 * (I1star - 3.0) + 3.0 * C30 * (I1star - 3.0) ** 2.0
 
-    I2star: float = 0.5 * (I1star**2.0 - trace(bstar2))
+    dPhi_dI2star: Vector = C01 + C11 * (I1star - 3.0)
 
-    dPhi_dI1star: float = C10 + C11 * (I2star - 3.0) + 2.0 * C20 * (I1star - 3.0) + 3.0 * C30 * (I1star - 3.0) ** 2.0
+    Stress_dev: Tensor = (2.0 / J * (dPhi_dI1star + dPhi_dI2star * I1star))[..., None, None] * K.bstar
 
-    dPhi_dI2star: float = C01 + C11 * (I1star - 3.0)
+    Stress_dev += (-2.0 / J * dPhi_dI2star)[..., None, None] * K.bstar2
 
-    Stress_dev: Tensor = 2.0 / J * (dPhi_dI1star + dPhi_dI2star * I1star) * bstar
+    Stress_dev += (-2.0 / (3.0 * J) * (I1star * dPhi_dI1star + 2.0 * I2star * dPhi_dI2star))[..., None, None] * eye(3)
 
-    Stress_dev += -2.0 / J * dPhi_dI2star * bstar2
+    Stress_vol: Tensor = (3.0 * kappa * (J - 1.0))[..., None, None] * eye(3)
 
-    Stress_dev += -2.0 / (3.0 * J) * (I1star * dPhi_dI1star + 2.0 * I2star * dPhi_dI2star) * eye(3)
+    return Stress_dev + Stress_vol
 
-    Stress_vol: Tensor = 3.0 * kappa * (J - 1.0) * eye(3)
 
-    return Stress_dev + Stress_vol
+def dMooney5_dparams(F: Tensor | Kinematics, params: Vector) -> Tensor:
+    """
+    Derivatives of the Mooney 5-terms Cauchy stress with respect to the material parameters.
+
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor as array of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
+
+    params: Vector
+        Material parameters [C10, C02, C11, C20, C30, kappa]
+
+    Returns
+    -------
+    dStress: Tensor
+        Stress derivatives of shape (6,...,3,3), one per material parameter
+    """
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    I1star: Vector = K.I1star
+
+    I2star: Vector = K.I2star
+
+    # Stress is linear in dPhi_dI1star and dPhi_dI2star
+    dStress_dPhi1: Tensor = (2.0 / J)[..., None, None] * K.bstar - (2.0 / (3.0 * J) * I1star)[..., None, None] * eye(3)
+
+    dStress_dPhi2: Tensor = (2.0 / J * I1star)[..., None, None] * K.bstar
+    dStress_dPhi2 += (-2.0 / J)[..., None, None] * K.bstar2
+    dStress_dPhi2 += (-4.0 / (3.0 * J) * I2star)[..., None, None] * eye(3)
+
+    dStress_dC11: Tensor = (I2star - 3.0)[..., None, None] * dStress_dPhi1 + (I1star - 3.0)[
+        ..., None, None
+    ] * dStress_dPhi2
+
+    dStress_dC20: Tensor = (2.0 * (I1star - 3.0))[..., None, None] * dStress_dPhi1
+
+    dStress_dC30: Tensor = (3.0 * (I1star - 3.0) ** 2.0)[..., None, None] * dStress_dPhi1
+
+    dStress_dkappa: Tensor = (3.0 * (J - 1.0))[..., None, None] * eye(3)
+
+    return stack(
+        broadcast_arrays(dStress_dPhi1, dStress_dPhi2, dStress_dC11, dStress_dC20, dStress_dC30, dStress_dkappa)
+    )
+
+
+def dMooney5_dF(F: Tensor | Kinematics, params: Vector) -> Tensor:
+    """
+    Derivatives of the Mooney 5-terms Cauchy stress with respect to the deformation gradient.
+
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor as array of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
+
+    params: Vector
+        Material parameters [C10, C02, C11, C20, C30, kappa]
+
+    Returns
+    -------
+    dStress: Tensor
+        Stress derivatives of shape (...,3,3,3,3), dStress[..., i, j, k, l] of Stress_ij with respect to F_kl
+    """
+    C10: float = params[0]
+    C01: float = params[1]
+    C11: float = params[2]
+    C20: float = params[3]
+    C30: float = params[4]
+    kappa: float = params[5]
+
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    I1star: Vector = K.I1star
+
+    I2star: Vector = K.I2star
+
+    dI1star: Tensor = K.dI1star_dF
+
+    dI2star: Tensor = K.dI2star_dF
+
+    dJ: Tensor = K.dJ_dF
+
+    dPhi_dI1star: Vector = C10 + C11 * (I2star - 3.0) + 2.0 * C20 * (I1star - 3.0) + 3.0 * C30 * (I1star - 3.0) ** 2.0
+
+    dPhi_dI2star: Vector = C01 + C11 * (I1star - 3.0)
+
+    # Stress = a bstar + c bstar2 + d I, with derivatives of the scalar factors
+    a: Vector = 2.0 / J * (dPhi_dI1star + dPhi_dI2star * I1star)
+    c: Vector = -2.0 / J * dPhi_dI2star
+    d: Vector = -2.0 / (3.0 * J) * (I1star * dPhi_dI1star + 2.0 * I2star * dPhi_dI2star)
+
+    ddPhi_dI1star: Tensor = (2.0 * C20 + 6.0 * C30 * (I1star - 3.0))[..., None, None] * dI1star + asarray(C11)[
+        ..., None, None
+    ] * dI2star
+    ddPhi_dI2star: Tensor = asarray(C11)[..., None, None] * dI1star
+
+    da: Tensor = (2.0 / J)[..., None, None] * (
+        ddPhi_dI1star + I1star[..., None, None] * ddPhi_dI2star + dPhi_dI2star[..., None, None] * dI1star
+    ) - (a / J)[..., None, None] * dJ
+    dc: Tensor = (-2.0 / J)[..., None, None] * ddPhi_dI2star - (c / J)[..., None, None] * dJ
+    dd: Tensor = (-2.0 / (3.0 * J))[..., None, None] * (
+        dPhi_dI1star[..., None, None] * dI1star
+        + I1star[..., None, None] * ddPhi_dI1star
+        + 2.0 * dPhi_dI2star[..., None, None] * dI2star
+        + 2.0 * I2star[..., None, None] * ddPhi_dI2star
+    ) - (d / J)[..., None, None] * dJ
+
+    dStress: Tensor = a[..., None, None, None, None] * K.dbstar_dF + c[..., None, None, None, None] * K.dbstar2_dF
+    dStress += einsum("...ij,...kl->...ijkl", K.bstar, da)
+    dStress += einsum("...ij,...kl->...ijkl", K.bstar2, dc)
+    dStress += einsum("ij,...kl->...ijkl", eye(3), dd + (3.0 * kappa * J)[..., None, None] * K.FinvT)
+
+    return dStress
@@ -1,10 +1,10 @@
-from numpy import dot, eye, trace
-from numpy.linalg import det
+from numpy import broadcast_arrays, einsum, eye, stack
 
+from polymat.mechanics.kinematics import Kinematics, kinematics
 from polymat.types import Tensor, Vector
 
 
-def NeoHook(F: Tensor, params: Vector) -> Tensor:
+def NeoHook(F: Tensor | Kinematics, params: Vector) -> Tensor:
     """
     Neo-Hookean hyperelastic material model.
 
@@ -12,8 +12,8 @@ def NeoHook(F: Tensor, params: Vector) -> Tensor:
 
     Parameters
     ----------
-    F: Tensor
-        Deformation gradient tensor of shape (3,3)
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
 
     params: Vector
         Material parameters [mu, kappa]
@@ -21,21 +21,73 @@ def NeoHook(F: Tensor, params: Vector) -> Tensor:
     Returns
     -------
     Stress: Tensor
-        Cauchy stress tensor.
+        Cauchy stress tensor, with the same shape as F.
     """
     mu: float = params[0]
     kappa: float = params[1]
 
-    J: float = det(F)
+    K: Kinematics = kinematics(F)
 
-    Fstar: Tensor = J ** (-1.0 / 3.0) * F
+    Stress_dev: Tensor = (mu / K.J)[..., None, None] * K.dev_bstar
 
-    bstar: Tensor = dot(Fstar, Fstar.T)
+    Stress_vol: Tensor = (kappa * (K.J - 1.0))[..., None, None] * eye(3)
 
-    dev_bstar: Tensor = bstar - trace(bstar) / 3.0 * eye(3)
+    return Stress_dev + Stress_vol
 
-    Stress_dev: Tensor = mu / J * dev_bstar
 
-    Stress_vol: Tensor = kappa * (J - 1.0) * eye(3)
+def dNeoHook_dparams(F: Tensor | Kinematics, params: Vector) -> Tensor:
+    """
+    Derivatives of the Neo-Hookean Cauchy stress with respect to the material parameters.
 
-    return Stress_dev + Stress_vol
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
+
+    params: Vector
+        Material parameters [mu, kappa]
+
+    Returns
+    -------
+    dStress: Tensor
+        Stress derivatives of shape (2,...,3,3), one per material parameter
+    """
+    K: Kinematics = kinematics(F)
+
+    dStress_dmu: Tensor = (1.0 / K.J)[..., None, None] * K.dev_bstar
+
+    dStress_dkappa: Tensor = (K.J - 1.0)[..., None, None] * eye(3)
+
+    return stack(broadcast_arrays(dStress_dmu, dStress_dkappa))
+
+
+def dNeoHook_dF(F: Tensor | Kinematics, params: Vector) -> Tensor:
+    """
+    Derivatives of the Neo-Hookean Cauchy stress with respect to the deformation gradient.
+
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
+
+    params: Vector
+        Material parameters [mu, kappa]
+
+    Returns
+    -------
+    dStress: Tensor
+        Stress derivatives of shape (...,3,3,3,3), dStress[..., i, j, k, l] of Stress_ij with respect to F_kl
+    """
+    mu: float = params[0]
+    kappa: float = params[1]
+
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    dStress_dev: Tensor = (mu / J)[..., None, None, None, None] * K.ddev_bstar_dF
+    dStress_dev -= einsum("...ij,...kl->...ijkl", (mu / J**2)[..., None, None] * K.dev_bstar, K.dJ_dF)
+
+    dStress_vol: Tensor = einsum("ij,...kl->...ijkl", eye(3), (kappa * K.J)[..., None, None] * K.FinvT)
+
+    return dStress_dev + dStress_vol
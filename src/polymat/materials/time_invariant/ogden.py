@@ -1,60 +1,118 @@
-from numpy import dot, eye, sqrt
-from numpy.linalg import det, eig, multi_dot
+from numpy import asarray, broadcast_to, concatenate, eye, log, moveaxis, prod
 
+from polymat.mechanics.kinematics import Kinematics, kinematics
 from polymat.types import Tensor, Vector
 
 
-def Ogden(F: Tensor, param: Vector) -> Tensor:
+def _ogden_terms(params: Vector) -> tuple[Vector, Vector, Vector]:
     """
-    Ogden hyperelastic material model.
+    Splits Ogden parameters into moduli and exponents, with the term index moved to the last axis, and bulk modulus.
+    """
+    N: int = int((len(params) - 1) / 2)
 
-    3D loading specified by deformation gradient F.
+    mu: Vector = moveaxis(asarray(params[0:N], dtype=float), 0, -1)
+    alpha: Vector = moveaxis(asarray(params[N : 2 * N], dtype=float), 0, -1)
+    kappa: Vector = params[-1]
+
+    return mu, alpha, kappa
+
+
+def ogden_principal_stress(lam: Vector, param: Vector) -> Vector:
+    """
+    Principal Cauchy stresses of the Ogden hyperelastic material model.
+
+    Loading specified by the principal stretches, which avoids any eigen-decomposition for coaxial loading.
 
     Parameters
     ----------
-    F: Tensor
-        Deformation gradient tensor of shape (3,3)
+    lam: Vector
+        Principal stretches of shape (3,) or stack of shape (N,3)
 
     params: Vector
         Material parameters [mu1, m2, ..., alpha1, alpha2, ..., kappa]
 
     Returns
     -------
-    Stress: Tensor
-        Cauchy stress tensor.
+    StressP: Vector
+        Principal Cauchy stresses, with the same shape as lam.
     """
-    N: int = int((len(param) - 1) / 2)
-    mu: Vector = param[0:N]
-    alpha: Vector = param[N : 2 * N]
-    kappa: float = param[-1]
+    mu, alpha, kappa = _ogden_terms(param)
 
-    J: float = det(F)
+    lam = asarray(lam, dtype=float)
 
-    b: Tensor = dot(F, F.T)
+    J: Vector = prod(lam, axis=-1)
 
-    lam2, Q = eig(b)
+    lamstar: Vector = (J ** (-1.0 / 3.0))[..., None] * lam
 
-    lamstar: Vector = J ** (-1.0 / 3.0) * sqrt(lam2)
+    # Every term of the series at once, along the last axis
+    lamstar_alpha: Vector = lamstar[..., None] ** alpha[..., None, :]
+
+    dev: Vector = lamstar_alpha - lamstar_alpha.mean(axis=-2, keepdims=True)
+
+    fact: Vector = (2.0 / J)[..., None] * (mu / alpha)
+
+    return (kappa * (J - 1))[..., None] + (fact[..., None, :] * dev).sum(axis=-1)
+
+
+def ogden2_principal_stress(lam: Vector, params: Vector) -> Vector:
+    """
+    Principal Cauchy stresses of the alternative Ogden hyperelastic material model (Ansys, Marc).
+
+    Loading specified by the principal stretches, which avoids any eigen-decomposition for coaxial loading.
+
+    Parameters
+    ----------
+    lam: Vector
+        Principal stretches of shape (3,) or stack of shape (N,3)
 
-    StressP: Tensor = kappa * (J - 1) * eye(3)
+    params: Vector
+        Material parameters [mu1, mu2, ..., alpha1, alpha2, ..., kappa]
 
-    for i in range(N):
-        fact: float = (2.0 / J) * mu[i] / alpha[i]
+    Returns
+    -------
+    StressP: Vector
+        Principal Cauchy stresses, with the same shape as lam.
+    """
+    mu, alpha, kappa = _ogden_terms(params)
 
-        p: float = (lamstar[0] ** alpha[i] + lamstar[1] ** alpha[i] + lamstar[2] ** alpha[i]) / 3
+    lam = asarray(lam, dtype=float)
 
-        StressP[0, 0] += fact * (lamstar[0] ** alpha[i] - p)
+    J: Vector = prod(lam, axis=-1)
 
-        StressP[1, 1] += fact * (lamstar[1] ** alpha[i] - p)
+    lam_alpha: Vector = lam[..., None] ** alpha[..., None, :]
 
-        StressP[2, 2] += fact * (lamstar[2] ** alpha[i] - p)
+    dev: Vector = lam_alpha - lam_alpha.mean(axis=-2, keepdims=True)
 
-    Stress: Tensor = multi_dot((Q, StressP, Q.T))
+    fact: Vector = (1 / J)[..., None] * mu * J[..., None] ** (-alpha / 3)
 
-    return Stress
+    return (3 * kappa * (J ** (1 / 3) - 1) * J ** (-2 / 3))[..., None] + (fact[..., None, :] * dev).sum(axis=-1)
 
 
-def Ogden2(F: Tensor, params: Vector) -> Tensor:
+def Ogden(F: Tensor | Kinematics, param: Vector) -> Tensor:
+    """
+    Ogden hyperelastic material model.
+
+    3D loading specified by deformation gradient F.
+
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
+
+    params: Vector
+        Material parameters [mu1, m2, ..., alpha1, alpha2, ..., kappa]
+
+    Returns
+    -------
+    Stress: Tensor
+        Cauchy stress tensor, with the same shape as F.
+    """
+    K: Kinematics = kinematics(F)
+
+    return K.principal_tensor(ogden_principal_stress(K.principal_stretches, param))
+
+
+def Ogden2(F: Tensor | Kinematics, params: Vector) -> Tensor:
     """
     Alternative version of Ogden hyperelastic material model (Ansys, Marc).
 
@@ -62,8 +120,8 @@ def Ogden2(F: Tensor, params: Vector) -> Tensor:
 
     Parameters
     ----------
-    F: Tensor
-        Deformation gradient tensor of shape (3,3)
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
 
     params: Vector
         Material parameters [mu1, mu2, ..., alpha1, alpha2, ..., kappa]
@@ -71,34 +129,234 @@ def Ogden2(F: Tensor, params: Vector) -> Tensor:
     Returns
     -------
     Stress: Tensor
-        Cauchy stress tensor.
+        Cauchy stress tensor, with the same shape as F.
     """
-    N: int = int((len(params) - 1) / 2)
-    mu: Vector = params[0:N]
-    alpha: Vector = params[N : 2 * N]
-    kappa: float = params[-1]
+    K: Kinematics = kinematics(F)
+
+    return K.principal_tensor(ogden2_principal_stress(K.principal_stretches, params))
+
+
+def dOgden_dparams(F: Tensor | Kinematics, param: Vector) -> Tensor:
+    """
+    Derivatives of the Ogden Cauchy stress with respect to the material parameters.
+
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
+
+    params: Vector
+        Material parameters [mu1, m2, ..., alpha1, alpha2, ..., kappa]
+
+    Returns
+    -------
+    dStress: Tensor
+        Stress derivatives of shape (2N+1,...,3,3), one per material parameter
+    """
+    mu, alpha, _ = _ogden_terms(param)
+
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    lamstar: Vector = (J ** (-1.0 / 3.0))[..., None] * K.principal_stretches
+
+    lamstar_alpha: Vector = lamstar[..., None] ** alpha[..., None, :]
+    dev: Vector = lamstar_alpha - lamstar_alpha.mean(axis=-2, keepdims=True)
+
+    lamstar_alpha_log: Vector = lamstar_alpha * log(lamstar)[..., None]
+    dev_log: Vector = lamstar_alpha_log - lamstar_alpha_log.mean(axis=-2, keepdims=True)
+
+    dStressP_dmu: Vector = (2.0 / J)[..., None, None] / alpha[..., None, :] * dev
+
+    dStressP_dalpha: Vector = (
+        (2.0 / J)[..., None, None] * (mu / alpha)[..., None, :] * (dev_log - dev / alpha[..., None, :])
+    )
+
+    dStressP_dkappa: Vector = broadcast_to((J - 1.0)[..., None], dStressP_dmu.shape[:-1])
+
+    return K.principal_tensor(
+        concatenate([moveaxis(dStressP_dmu, -1, 0), moveaxis(dStressP_dalpha, -1, 0), dStressP_dkappa[None]])
+    )
+
+
+def dOgden2_dparams(F: Tensor | Kinematics, params: Vector) -> Tensor:
+    """
+    Derivatives of the alternative Ogden (Ansys, Marc) Cauchy stress with respect to the material parameters.
+
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
+
+    params: Vector
+        Material parameters [mu1, mu2, ..., alpha1, alpha2, ..., kappa]
+
+    Returns
+    -------
+    dStress: Tensor
+        Stress derivatives of shape (2N+1,...,3,3), one per material parameter
+    """
+    mu, alpha, _ = _ogden_terms(params)
+
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    lam: Vector = K.principal_stretches
+
+    fact: Vector = (1 / J)[..., None] * J[..., None] ** (-alpha / 3)
+
+    lam_alpha: Vector = lam[..., None] ** alpha[..., None, :]
+    dev: Vector = lam_alpha - lam_alpha.mean(axis=-2, keepdims=True)
+
+    lam_alpha_log: Vector = lam_alpha * log(lam)[..., None]
+    dev_log: Vector = lam_alpha_log - lam_alpha_log.mean(axis=-2, keepdims=True)
+
+    dStressP_dmu: Vector = fact[..., None, :] * dev
+
+    dStressP_dalpha: Vector = (mu * fact)[..., None, :] * (dev_log - (log(J) / 3)[..., None, None] * dev)
+
+    dStressP_dkappa: Vector = broadcast_to((3 * (J ** (1 / 3) - 1) * J ** (-2 / 3))[..., None], dStressP_dmu.shape[:-1])
+
+    return K.principal_tensor(
+        concatenate([moveaxis(dStressP_dmu, -1, 0), moveaxis(dStressP_dalpha, -1, 0), dStressP_dkappa[None]])
+    )
+
+
+def ogden_principal_tangent(lam: Vector, param: Vector) -> Tensor:
+    """
+    Derivatives of the principal Cauchy stresses of the Ogden model with respect to the principal stretches.
+
+    Parameters
+    ----------
+    lam: Vector
+        Principal stretches of shape (3,) or stack of shape (N,3)
+
+    params: Vector
+        Material parameters [mu1, m2, ..., alpha1, alpha2, ..., kappa]
 
-    J: float = det(F)
+    Returns
+    -------
+    dStressP: Tensor
+        Derivatives of shape (...,3,3), dStressP[..., a, c] of stress a with respect to stretch c
+    """
+    mu, alpha, kappa = _ogden_terms(param)
 
-    b: Tensor = dot(F, F.T)
+    lam = asarray(lam, dtype=float)
 
-    lam2, Q = eig(b)
+    J: Vector = prod(lam, axis=-1)
 
-    lam: Vector = sqrt(lam2)
+    lamstar: Vector = (J ** (-1.0 / 3.0))[..., None] * lam
 
-    StressP: Tensor = 3 * kappa * (J ** (1 / 3) - 1) * J ** (-2 / 3) * eye(3)
+    lamstar_alpha: Vector = lamstar[..., None] ** alpha[..., None, :]
+    mean: Vector = lamstar_alpha.mean(axis=-2, keepdims=True)
 
-    for n in range(N):
-        fact: float = 1 / J * mu[n] * J ** (-alpha[n] / 3)
+    fact: Vector = (2.0 / J)[..., None] * (mu / alpha)
 
-        p: float = (lam[0] ** alpha[n] + lam[1] ** alpha[n] + lam[2] ** alpha[n]) / 3
+    # Terms indexed by [..., a, c, term], stretch c in the denominator
+    lam_c: Vector = lam[..., None, :, None]
 
-        StressP[0, 0] += fact * (lam[0] ** alpha[n] - p)
+    dStressP: Vector = -fact[..., None, None, :] * (lamstar_alpha - mean)[..., :, None, :] / lam_c
+    dStressP += (
+        (fact * alpha)[..., None, None, :]
+        / lam_c
+        * (
+            lamstar_alpha[..., :, None, :] * (eye(3) - 1.0 / 3.0)[..., None]
+            - (lamstar_alpha[..., None, :, :] - mean[..., None, :, :]) / 3.0
+        )
+    )
 
-        StressP[1, 1] += fact * (lam[1] ** alpha[n] - p)
+    return (kappa * J)[..., None, None] / lam[..., None, :] + dStressP.sum(axis=-1)
 
-        StressP[2, 2] += fact * (lam[2] ** alpha[n] - p)
 
-    Stress: Tensor = multi_dot((Q, StressP, Q.T))
+def ogden2_principal_tangent(lam: Vector, params: Vector) -> Tensor:
+    """
+    Derivatives of the principal Cauchy stresses of the alternative Ogden model with respect to the principal
+    stretches.
+
+    Parameters
+    ----------
+    lam: Vector
+        Principal stretches of shape (3,) or stack of shape (N,3)
+
+    params: Vector
+        Material parameters [mu1, mu2, ..., alpha1, alpha2, ..., kappa]
+
+    Returns
+    -------
+    dStressP: Tensor
+        Derivatives of shape (...,3,3), dStressP[..., a, c] of stress a with respect to stretch c
+    """
+    mu, alpha, kappa = _ogden_terms(params)
+
+    lam = asarray(lam, dtype=float)
+
+    J: Vector = prod(lam, axis=-1)
+
+    lam_alpha: Vector = lam[..., None] ** alpha[..., None, :]
+    dev: Vector = lam_alpha - lam_alpha.mean(axis=-2, keepdims=True)
+
+    fact: Vector = mu * J[..., None] ** (-1.0 - alpha / 3.0)
+
+    # Terms indexed by [..., a, c, term], stretch c in the denominator
+    lam_c: Vector = lam[..., None, :, None]
+
+    dStressP: Vector = (fact * (-1.0 - alpha / 3.0))[..., None, None, :] * dev[..., :, None, :] / lam_c
+    dStressP += (
+        (fact * alpha)[..., None, None, :]
+        / lam_c
+        * (lam_alpha[..., :, None, :] * eye(3)[..., None] - lam_alpha[..., None, :, :] / 3.0)
+    )
+
+    dStressP_vol: Vector = kappa * (2.0 * J ** (-2.0 / 3.0) - J ** (-1.0 / 3.0))
+
+    return dStressP_vol[..., None, None] / lam[..., None, :] + dStressP.sum(axis=-1)
+
+
+def dOgden_dF(F: Tensor | Kinematics, param: Vector) -> Tensor:
+    """
+    Derivatives of the Ogden Cauchy stress with respect to the deformation gradient.
+
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
+
+    params: Vector
+        Material parameters [mu1, m2, ..., alpha1, alpha2, ..., kappa]
+
+    Returns
+    -------
+    dStress: Tensor
+        Stress derivatives of shape (...,3,3,3,3), dStress[..., i, j, k, l] of Stress_ij with respect to F_kl
+    """
+    K: Kinematics = kinematics(F)
+
+    lam: Vector = K.principal_stretches
+
+    return K.principal_tangent(ogden_principal_stress(lam, param), ogden_principal_tangent(lam, param))
+
+
+def dOgden2_dF(F: Tensor | Kinematics, params: Vector) -> Tensor:
+    """
+    Derivatives of the alternative Ogden (Ansys, Marc) Cauchy stress with respect to the deformation gradient.
+
+    Parameters
+    ----------
+    F: Tensor | Kinematics
+        Deformation gradient tensor of shape (3,3), stack of tensors of shape (N,3,3) or their Kinematics
+
+    params: Vector
+        Material parameters [mu1, mu2, ..., alpha1, alpha2, ..., kappa]
+
+    Returns
+    -------
+    dStress: Tensor
+        Stress derivatives of shape (...,3,3,3,3), dStress[..., i, j, k, l] of Stress_ij with respect to F_kl
+    """
+    K: Kinematics = kinematics(F)
+
+    lam: Vector = K.principal_stretches
 
-    return Stress
+    return K.principal_tangent(ogden2_principal_stress(lam, params), ogden2_principal_tangent(lam, params))
@@ -1,17 +1,17 @@
-from numpy import dot, eye, trace
-from numpy.linalg import det
+from numpy import broadcast_arrays, einsum, eye, stack
 
-from polymat.types import Scalar, Tensor, Vector
+from polymat.mechanics.kinematics import Kinematics, kinematics
+from polymat.types import Tensor, Vector
 
 
-def Yeoh(F: Tensor, params: Vector) -> Tensor:
+def Yeoh(F: Tensor | Kinematics, params: Vector) -> Tensor:
     """
     Yeoh hyperelastic material model. 3D loading specified by deformation gradient tensor.
 
     Parameters
     ----------
-    F : Tensor
-        Deformation gradient tensor as np.ndarray of size (3x3)
+    F : Tensor | Kinematics
+        Deformation gradient tensor as np.ndarray of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
 
     params : Vector
         Material parameters [C10, C20, C30, kappa]
@@ -19,23 +19,100 @@ def Yeoh(F: Tensor, params: Vector) -> Tensor:
     Returns
     -------
     Tensor
-        Cauchy stress tensor as np.ndarray of size (3x3)
+        Cauchy stress tensor as np.ndarray with the same shape as F
     """
     C10: float = params[0]
     C20: float = params[1]
     C30: float = params[2]
     kappa: float = params[3]
 
-    J: Scalar = det(F)
+    K: Kinematics = kinematics(F)
 
-    bstar: Tensor = J ** (-2.0 / 3.0) * dot(F, F.T)
+    J: Vector = K.J
 
-    dev_bstar: Tensor = bstar - trace(bstar) / 3.0 * eye(3)
+    I1star: Vector = K.I1star
 
-    I1star: Scalar = trace(bstar)
+    Stress_dev: Tensor = (2.0 / J * (C10 + 2.0 * C20 * (I1star - 3.0) + 3.0 * C30 * (I1star - 3) ** 2.0))[
+        ..., None, None
+    ] * K.dev_bstar
 
-    Stress_dev: Tensor = 2.0 / J * (C10 + 2.0 * C20 * (I1star - 3.0) + 3.0 * C30 * (I1star - 3) ** 2.0) * dev_bstar
-
-    Stress_vol: Tensor = kappa * (J - 1.0) * eye(3)
+    Stress_vol: Tensor = (kappa * (J - 1.0))[..., None, None] * eye(3)
 
     return Stress_dev + Stress_vol
+
+
+def dYeoh_dparams(F: Tensor | Kinematics, params: Vector) -> Tensor:
+    """
+    Derivatives of the Yeoh Cauchy stress with respect to the material parameters.
+
+    Parameters
+    ----------
+    F : Tensor | Kinematics
+        Deformation gradient tensor as np.ndarray of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
+
+    params : Vector
+        Material parameters [C10, C20, C30, kappa]
+
+    Returns
+    -------
+    Tensor
+        Stress derivatives of shape (4,...,3,3), one per material parameter
+    """
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    I1star: Vector = K.I1star
+
+    dStress_dC10: Tensor = (2.0 / J)[..., None, None] * K.dev_bstar
+
+    dStress_dC20: Tensor = (2.0 * (I1star - 3.0))[..., None, None] * dStress_dC10
+
+    dStress_dC30: Tensor = (3.0 * (I1star - 3.0) ** 2.0)[..., None, None] * dStress_dC10
+
+    dStress_dkappa: Tensor = (J - 1.0)[..., None, None] * eye(3)
+
+    return stack(broadcast_arrays(dStress_dC10, dStress_dC20, dStress_dC30, dStress_dkappa))
+
+
+def dYeoh_dF(F: Tensor | Kinematics, params: Vector) -> Tensor:
+    """
+    Derivatives of the Yeoh Cauchy stress with respect to the deformation gradient.
+
+    Parameters
+    ----------
+    F : Tensor | Kinematics
+        Deformation gradient tensor as np.ndarray of size (3x3), stack of tensors of size (Nx3x3) or their Kinematics
+
+    params : Vector
+        Material parameters [C10, C20, C30, kappa]
+
+    Returns
+    -------
+    Tensor
+        Stress derivatives of shape (...,3,3,3,3), dStress[..., i, j, k, l] of Stress_ij with respect to F_kl
+    """
+    C10: float = params[0]
+    C20: float = params[1]
+    C30: float = params[2]
+    kappa: float = params[3]
+
+    K: Kinematics = kinematics(F)
+
+    J: Vector = K.J
+
+    I1star: Vector = K.I1star
+
+    dPhi_dI1star: Vector = C10 + 2.0 * C20 * (I1star - 3.0) + 3.0 * C30 * (I1star - 3) ** 2.0
+    d2Phi_dI1star2: Vector = 2.0 * C20 + 6.0 * C30 * (I1star - 3.0)
+
+    # Derivative of the factor 2 / J dPhi_dI1star of dev_bstar
+    dFactor: Tensor = (2.0 / J * d2Phi_dI1star2)[..., None, None] * K.dI1star_dF
+    dFactor -= (2.0 / J**2 * dPhi_dI1star)[..., None, None] * K.dJ_dF
+
+    dStress_dev: Tensor = (2.0 / J * dPhi_dI1star)[..., None, None, None, None] * K.ddev_bstar_dF
+    dStress_dev += einsum("...ij,...kl->...ijkl", K.dev_bstar, dFactor)
+
+    dStress_vol: Tensor = einsum("ij,...kl->...ijkl", eye(3), (kappa * K.J)[..., None, None] * K.FinvT)
+
+    return dStress_dev + dStress_vol
@@ -1,10 +1,550 @@
-from numpy import abs, diag, exp, sqrt, zeros_like
-from scipy.optimize import OptimizeResult, minimize
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+
+from numpy import (
+    abs,
+    arange,
+    array,
+    asarray,
+    broadcast_shapes,
+    broadcast_to,
+    clip,
+    exp,
+    eye,
+    isfinite,
+    isnan,
+    maximum,
+    moveaxis,
+    nan,
+    sqrt,
+    where,
+    zeros,
+    zeros_like,
+)
+from numpy.linalg import det, solve
+from scipy.optimize import OptimizeResult, RootResults, brentq, minimize
+from scipy.optimize.elementwise import bracket_root, find_root
+
+from polymat.materials.time_invariant.eight_chain import EightChain, dEightChain_dF
+from polymat.materials.time_invariant.mooney import Mooney5, dMooney5_dF
+from polymat.materials.time_invariant.neo_hook import NeoHook, dNeoHook_dF
+from polymat.materials.time_invariant.ogden import Ogden, Ogden2, dOgden2_dF, dOgden_dF
+from polymat.materials.time_invariant.yeoh import Yeoh, dYeoh_dF
+from polymat.mechanics.kinematics import Kinematics, population_params, stretch_tensor
+from polymat.types import (
+    ElasticDeformation,
+    ElasticModel,
+    ElasticModelJacobian,
+    ElasticModelTangent,
+    Scalar,
+    Tensor,
+    Vector,
+)
+
+ROOT_XTOL = 1e-12
+ROOT_MAX_ITER = 100
+BRACKET_FACTOR = 1.02
+BRACKET_MAX_ITER = 60
+LATERAL_FD_STEP = 1e-6
+NEWTON_MAX_ITER = 50
+NEWTON_FD_STEP = 1e-7
+
+# Analytic derivatives of the stress with respect to F of the material models
+TANGENTS: dict[ElasticModel, ElasticModelTangent] = {
+    NeoHook: dNeoHook_dF,
+    Yeoh: dYeoh_dF,
+    Mooney5: dMooney5_dF,
+    EightChain: dEightChain_dF,
+    Ogden: dOgden_dF,
+    Ogden2: dOgden2_dF,
+}
+
+
+def model_tangent(model: ElasticModel) -> ElasticModelTangent | None:
+    """
+    Analytic tangent of a material model from TANGENTS, with the same fixed arguments for a functools.partial
+    of a model (e.g. an inverse Langevin method), None if the model has none.
+    """
+    if isinstance(model, partial):
+        tangent: ElasticModelTangent | None = model_tangent(model.func)
+        return None if tangent is None else partial(tangent, *model.args, **model.keywords)
+
+    return TANGENTS.get(model)
+
+
+def _bracket_root(residual: Callable[[Scalar], Scalar], x0: Scalar) -> tuple[Scalar, Scalar] | None:
+    """
+    Geometrically expands an interval around x0 > 0 until residual changes sign.
+
+    Parameters
+    ----------
+    residual : Callable[[Scalar], Scalar]
+        Function of the lateral stretch whose root is searched
+
+    x0 : Scalar
+        Starting guess for the lateral stretch
+
+    Returns
+    -------
+    lo, hi : tuple[Scalar, Scalar] | None
+        Positive stretches bracketing the root, None if no sign change was found
+    """
+    factor: float = BRACKET_FACTOR
+
+    lo: Scalar = x0 / factor
+    hi: Scalar = x0 * factor
+
+    f_lo: Scalar = residual(lo)
+    f_hi: Scalar = residual(hi)
+
+    for _ in range(BRACKET_MAX_ITER):
+        if f_lo * f_hi <= 0.0:
+            return lo, hi
+
+        factor *= 1.6
+
+        if abs(f_lo) < abs(f_hi):
+            lo = lo / factor
+            f_lo = residual(lo)
+        else:
+            hi = hi * factor
+            f_hi = residual(hi)
+
+    return None
+
+
+def _lateral_stretch_population(
+    model: ElasticModel,
+    params: Vector,
+    lam1: Vector,
+    guess: Vector,
+    kinematics: Callable[[Vector, Vector], Tensor],
+    component: int,
+) -> tuple[Vector, Vector]:
+    """
+    Solves for the stress-free lateral stretch of every strain point and parameter set at once.
+
+    Uses the element-wise bracketing and root finding algorithms of scipy, so that every solver
+    iteration is a single batched model evaluation over all parameter sets and strain points.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    params : Vector
+        Matrix of material parameters of shape (S,P)
+
+    lam1 : Vector
+        Prescribed principal stretch history of shape (N,)
+
+    guess : Vector
+        Initial lateral stretch guess for each point
 
-from polymat.types import ElasticModel, Scalar, Tensor, Vector
+    kinematics : Callable[[Vector, Vector], Tensor]
+        Deformation gradients as function of prescribed and lateral stretches
 
+    component : int
+        Index of the stress-free normal component
 
-def uniaxial_stress(model: ElasticModel, trueStrain: Vector, params: Vector) -> Vector:
+    Returns
+    -------
+    lam : Vector
+        Lateral stretch histories of shape (P,N), NaN where the root could not be bracketed
+
+    iterations : Vector
+        Root solver iterations of shape (P,N)
+    """
+    shape: tuple[int, int] = (params.shape[1], len(lam1))
+
+    args: tuple[Vector, ...] = (broadcast_to(lam1, shape), *(broadcast_to(p[:, None], shape) for p in params))
+
+    def residual(x: Vector, lam1: Vector, *params: Vector) -> Vector:
+        return model(kinematics(lam1, x), params)[..., component, component]
+
+    x0: Vector = broadcast_to(guess, shape)
+
+    bracket = bracket_root(residual, x0 / BRACKET_FACTOR, x0 * BRACKET_FACTOR, xmin=0.0, args=args)
+
+    root = find_root(
+        residual,
+        bracket.bracket,
+        args=args,
+        tolerances={"xatol": ROOT_XTOL, "xrtol": 0.0},
+        maxiter=ROOT_MAX_ITER,
+    )
+
+    return where(bracket.success, root.x, nan), root.nit
+
+
+def _lateral_stretch(
+    model: ElasticModel,
+    params: Vector,
+    lam1: Vector,
+    guess: Vector,
+    kinematics: Callable[[Scalar, Scalar], Tensor],
+    component: int,
+    method: str,
+) -> tuple[Vector, Vector]:
+    """
+    Solves for the lateral stretch that makes the stress component (component, component) vanish.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    params : Vector
+        Material parameters to be passed to model
+
+    lam1 : Vector
+        Prescribed principal stretch history
+
+    guess : Vector
+        Initial lateral stretch guess for each point (only the first one is used by "brentq")
+
+    kinematics : Callable[[Scalar, Scalar], Tensor]
+        Deformation gradient as function of prescribed and lateral stretches
+
+    component : int
+        Index of the stress-free normal component
+
+    method : str
+        "brentq" for a bracketed root solve warm-started from the previous point,
+        "nelder-mead" for a direct minimization of the absolute stress component,
+        kept as reference solvers for the Newton iteration of mixed_stretch.
+        A matrix of parameter sets is always solved with the element-wise bracketed root solver.
+
+    Returns
+    -------
+    lam : Vector
+        Lateral stretch history, NaN where the root could not be bracketed
+
+    iterations : Vector
+        Solver iterations used for each point
+    """
+    if method not in ("brentq", "nelder-mead"):
+        raise ValueError(f"Unknown lateral stretch solver method: {method}")
+
+    if asarray(params).ndim == 2:
+        return _lateral_stretch_population(model, asarray(params, dtype=float), lam1, guess, kinematics, component)
+
+    lam: Vector = zeros_like(lam1)
+    iterations: Vector = zeros(len(lam1), dtype=int)
+
+    for i, _lam1 in enumerate(lam1):
+
+        def residual(x: Scalar, _lam1: Scalar = _lam1) -> Scalar:
+            return model(kinematics(_lam1, x), params)[component, component]
+
+        if method == "brentq":
+            x0: Scalar = guess[i] if i == 0 or isnan(lam[i - 1]) else lam[i - 1]
+
+            bracket: tuple[Scalar, Scalar] | None = _bracket_root(residual, x0)
+
+            if bracket is None:
+                lam[i] = nan
+                continue
+
+            info: RootResults
+            lam[i], info = brentq(residual, *bracket, xtol=ROOT_XTOL, maxiter=ROOT_MAX_ITER, full_output=True)
+            iterations[i] = info.iterations
+
+        else:
+            opt: OptimizeResult = minimize(
+                fun=lambda x: abs(residual(x[0])),
+                x0=guess[i],
+                method="Nelder-Mead",
+                tol=1e-9,
+            )
+            lam[i] = opt.x[0]
+            iterations[i] = opt.nit
+
+    return lam, iterations
+
+
+@dataclass(frozen=True)
+class MixedLoading:
+    """
+    Loading path with mixed boundary conditions, prescribing either the stretch or the Cauchy stress of
+    each component of the deformation gradient.
+
+    Parameters
+    ----------
+    F : Tensor
+        Deformation gradients of shape (N,3,3), holding the prescribed components and the initial guess of the
+        free ones
+
+    free : tuple[tuple[int, int], ...] = ()
+        Components (i,j) of F solved for, each with a prescribed Cauchy stress component (i,j)
+
+    stress : Tensor | None = None
+        Cauchy stress tensors of shape (N,3,3) or (3,3) holding the prescribed stress of the free components,
+        stress-free by default
+
+    output : tuple[int, int] = (0, 0)
+        Cauchy stress component returned by the drivers
+    """
+
+    F: Tensor
+    free: tuple[tuple[int, int], ...] = ()
+    stress: Tensor | None = None
+    output: tuple[int, int] = (0, 0)
+
+    def __post_init__(self) -> None:
+        if len(set(self.free)) != len(self.free):
+            raise ValueError(f"Repeated free components: {self.free}")
+
+        # The Cauchy stress is symmetric, F_ij and F_ji cannot be solved from sigma_ij alone
+        for i, j in self.free:
+            if i != j and (j, i) in self.free:
+                raise ValueError(f"Components ({i},{j}) and ({j},{i}) of F cannot both be free")
+
+
+def mixed_stretch(
+    model: ElasticModel,
+    loading: MixedLoading,
+    params: Vector,
+    tangent: ElasticModelTangent | None = None,
+) -> tuple[Tensor, Vector]:
+    """
+    Solves the free components of the deformation gradients of a mixed loading path by Newton iteration.
+
+    Every strain point (and parameter set) is solved independently, all of them at once: each iteration
+    evaluates the model once on the current deformation gradients and their forward difference perturbations
+    stacked along a leading axis, or the model and a given analytic tangent, and solves the batch of small
+    linear systems. Points leave the batch as they converge. Free diagonal components are kept positive by
+    limiting each step to a factor 2 of the stretch.
+
+    The forward differences converge as fast as the analytic tangent and, with a few free components, cost
+    less than the full fourth order tangent, which is why they are the default.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    loading : MixedLoading
+        Prescribed components of F and of the Cauchy stress
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    tangent : ElasticModelTangent | None = None
+        Derivatives of the stress of model with respect to F (see model_tangent), forward differences if None
+
+    Returns
+    -------
+    F : Tensor
+        Stack of deformation gradient tensors of shape (N,3,3) or (P,N,3,3), NaN where the solve failed
+
+    iterations : Vector
+        Newton iterations per strain point, shape (N,) or (P,N)
+    """
+    _params: Vector = asarray(params, dtype=float)
+    F: Tensor = asarray(loading.F, dtype=float)
+
+    population: bool = _params.ndim == 2
+    shape: tuple[int, ...] = broadcast_shapes((_params.shape[1], 1), F.shape[:-2]) if population else F.shape[:-2]
+
+    F = broadcast_to(F, (*shape, 3, 3)).copy()
+    iterations: Vector = zeros(shape, dtype=int)
+
+    m: int = len(loading.free)
+
+    if m == 0:
+        return F, iterations
+
+    rows: Vector = array([i for i, _ in loading.free])
+    cols: Vector = array([j for _, j in loading.free])
+    diagonal: Vector = rows == cols
+
+    target: Vector = zeros((*shape, m))
+
+    if loading.stress is not None:
+        target[...] = asarray(loading.stress, dtype=float)[..., rows, cols]
+
+    # Points and parameter sets flattened to one batch axis
+    Fe: Tensor = F.reshape(-1, 3, 3)
+    target = target.reshape(-1, m)
+    pe: Vector = (
+        broadcast_to(population_params(_params), (len(_params), *shape)).reshape(len(_params), -1)
+        if population
+        else _params
+    )
+    iterations = iterations.reshape(-1)
+
+    active: Vector = arange(len(Fe))
+
+    for _ in range(NEWTON_MAX_ITER):
+        x: Vector = Fe[active[:, None], rows, cols]
+        p: Vector = pe[:, active] if population else pe
+
+        residual: Vector
+        jacobian: Tensor
+
+        if tangent is not None:
+            K: Kinematics = Kinematics(Fe[active])
+
+            residual = model(K, p)[..., rows, cols] - target[active]
+            jacobian = tangent(K, p)[:, rows[:, None], cols[:, None], rows, cols]
+
+        else:
+            h: Vector = NEWTON_FD_STEP * maximum(abs(x), 1.0)
+
+            # Current deformation gradients followed by one perturbation per free component
+            Fs: Tensor = broadcast_to(Fe[active], (m + 1, len(active), 3, 3)).copy()
+
+            for k in range(m):
+                Fs[k + 1, :, rows[k], cols[k]] += h[:, k]
+
+            sigma: Vector = model(Fs, p)[..., rows, cols]
+
+            residual = sigma[0] - target[active]
+            jacobian = ((sigma[1:] - sigma[0]) / h.T[..., None]).transpose(1, 2, 0)
+
+        solvable: Vector = isfinite(residual).all(axis=-1) & isfinite(jacobian).all(axis=(-2, -1))
+        solvable[solvable] = det(jacobian[solvable]) != 0.0
+
+        dx: Vector = zeros_like(x)
+        dx[solvable] = solve(jacobian[solvable], residual[solvable][..., None])[..., 0]
+
+        x_new: Vector = x - dx
+        x_new[:, diagonal] = clip(x_new[:, diagonal], x[:, diagonal] / 2.0, x[:, diagonal] * 2.0)
+
+        Fe[active[:, None], rows, cols] = where(solvable[:, None], x_new, nan)
+        iterations[active] += 1
+
+        converged: Vector = solvable & (abs(dx) <= ROOT_XTOL * maximum(abs(x), 1.0)).all(axis=-1)
+
+        active = active[solvable & ~converged]
+
+        if not len(active):
+            break
+
+    Fe[active[:, None], rows, cols] = nan
+
+    return Fe.reshape(F.shape), iterations.reshape(shape)
+
+
+def mixed_stress(
+    model: ElasticModel,
+    loading: MixedLoading,
+    params: Vector,
+    full_output: bool = False,
+) -> Vector | tuple[Vector, Vector]:
+    """
+    Cauchy stress history of a mixed loading path, see mixed_stretch.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    loading : MixedLoading
+        Prescribed components of F and of the Cauchy stress, and returned stress component
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    full_output : bool = False
+        If True, the Newton iterations per strain point are also returned
+
+    Returns
+    -------
+    trueStress : Vector
+        History of the output stress component, shape (N,) or (P,N)
+
+    iterations : Vector
+        Newton iterations per strain point, only if full_output is True
+    """
+    F, iterations = mixed_stretch(model, loading, params)
+
+    stress: Vector = model(F, population_params(params))[..., loading.output[0], loading.output[1]]
+
+    if full_output:
+        return stress, iterations
+
+    return stress
+
+
+def uniaxial_loading(trueStrain: Vector) -> MixedLoading:
+    """
+    Compresssible uniaxial loading path, with stress-free lateral faces.
+
+    Parameters
+    ----------
+    trueStrain : Vector
+        Uniaxial true strain history
+
+    Returns
+    -------
+    loading : MixedLoading
+        Prescribed axial stretch, free lateral stretches starting from an isochoric guess
+    """
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
+
+    return MixedLoading(stretch_tensor(lam1, 1 / sqrt(lam1), 1 / sqrt(lam1)), free=((1, 1), (2, 2)))
+
+
+def uniaxial_stretch(
+    model: ElasticModel,
+    trueStrain: Vector,
+    params: Vector,
+    method: str = "newton",
+) -> tuple[Tensor, Vector]:
+    """
+    Deformation gradients of compresssible uniaxial loading, with stress-free lateral faces.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    trueStrain : Vector
+        Uniaxial true strain history
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    method : str = "newton"
+        Lateral stretch solver, "newton" (mixed_stretch), "brentq" (warm-started root solve) or "nelder-mead"
+
+    Returns
+    -------
+    F : Tensor
+        Stack of deformation gradient tensors of shape (N,3,3) or (P,N,3,3)
+
+    iterations : Vector
+        Lateral stretch solver iterations per strain point
+    """
+    if method == "newton":
+        return mixed_stretch(model, uniaxial_loading(trueStrain), params)
+
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
+
+    # Search numerically for the transverse stretch that makes S22 = 0
+    lam2, iterations = _lateral_stretch(
+        model=model,
+        params=params,
+        lam1=lam1,
+        guess=1 / sqrt(lam1),
+        kinematics=lambda lam1, x: stretch_tensor(lam1, x, x),
+        component=1,
+        method=method,
+    )
+
+    return stretch_tensor(lam1, lam2, lam2), iterations
+
+
+def uniaxial_stress(
+    model: ElasticModel,
+    trueStrain: Vector,
+    params: Vector,
+    method: str = "newton",
+    full_output: bool = False,
+) -> Vector | tuple[Vector, Vector]:
     """
     Compresssible uniaxial loading.
 
@@ -17,41 +557,108 @@ def uniaxial_stress(model: ElasticModel, trueStrain: Vector, params: Vector) ->
         Uniaxial true strain history
 
     params : Vector
-        Material parameters to be passed to model
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    method : str = "newton"
+        Lateral stretch solver, "newton" (mixed_stretch), "brentq" (warm-started root solve) or "nelder-mead"
+
+    full_output : bool = False
+        If True, the solver iterations per strain point are also returned
 
     Returns
     -------
     trueStress : Vector
-        Uniaxial true stress history
+        Uniaxial true stress history, shape (N,) or (P,N)
+
+    iterations : Vector
+        Lateral stretch solver iterations per strain point, only if full_output is True
     """
-    stress: Vector = zeros_like(trueStrain)
+    F, iterations = uniaxial_stretch(model, trueStrain, params, method)
 
-    def S22abs(x: list[float]) -> Scalar:
-        F: Tensor = diag([lam1, x[0], x[0]])
-        S22: Scalar = model(F, params)[1, 1]
-        return abs(S22)
+    stress: Vector = model(F, population_params(params))[..., 0, 0]
 
-    for i, strain in enumerate(trueStrain):
-        lam1: Scalar = exp(strain)
+    if full_output:
+        return stress, iterations
 
-        # Search numerically for the transverse stretch that makes S22 = 0
-        opt: OptimizeResult = minimize(
-            fun=S22abs,
-            x0=1 / sqrt(lam1),
-            method="Nelder-Mead",
-            tol=1e-9,
-        )
+    return stress
 
-        lam2: Scalar = opt.x[0]
 
-        F: Tensor = diag([lam1, lam2, lam2])
+def biaxial_loading(trueStrain: Vector) -> MixedLoading:
+    """
+    Compresssible equi-biaxial loading path, with stress-free lateral faces.
 
-        stress[i] = model(F, params)[0, 0]
+    Parameters
+    ----------
+    trueStrain : Vector
+        Principal true strain history
 
-    return stress
+    Returns
+    -------
+    loading : MixedLoading
+        Prescribed in-plane stretches, free thickness stretch starting from an isochoric guess
+    """
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
+
+    return MixedLoading(stretch_tensor(lam1, lam1, 1 / lam1**2), free=((2, 2),))
+
+
+def biaxial_stretch(
+    model: ElasticModel,
+    trueStrain: Vector,
+    params: Vector,
+    method: str = "newton",
+) -> tuple[Tensor, Vector]:
+    """
+    Deformation gradients of compresssible equi-biaxial loading, with stress-free lateral faces.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    trueStrain : Vector
+        Principal true strain history
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    method : str = "newton"
+        Lateral stretch solver, "newton" (mixed_stretch), "brentq" (warm-started root solve) or "nelder-mead"
 
+    Returns
+    -------
+    F : Tensor
+        Stack of deformation gradient tensors of shape (N,3,3) or (P,N,3,3)
 
-def biaxial_stress(model: ElasticModel, trueStrain: Vector, params: Vector) -> Vector:
+    iterations : Vector
+        Lateral stretch solver iterations per strain point
+    """
+    if method == "newton":
+        return mixed_stretch(model, biaxial_loading(trueStrain), params)
+
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
+
+    # Search numerically for the transverse strain that makes S33 = 0
+    lam3, iterations = _lateral_stretch(
+        model=model,
+        params=params,
+        lam1=lam1,
+        guess=1 / lam1**2,
+        kinematics=lambda lam1, x: stretch_tensor(lam1, lam1, x),
+        component=2,
+        method=method,
+    )
+
+    return stretch_tensor(lam1, lam1, lam3), iterations
+
+
+def biaxial_stress(
+    model: ElasticModel,
+    trueStrain: Vector,
+    params: Vector,
+    method: str = "newton",
+    full_output: bool = False,
+) -> Vector | tuple[Vector, Vector]:
     """
     Compresssible equi-biaxial loading.
 
@@ -64,41 +671,108 @@ def biaxial_stress(model: ElasticModel, trueStrain: Vector, params: Vector) -> V
         Principal true strain history
 
     params : Vector
-        Material parameters to be passed to model
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    method : str = "newton"
+        Lateral stretch solver, "newton" (mixed_stretch), "brentq" (warm-started root solve) or "nelder-mead"
+
+    full_output : bool = False
+        If True, the solver iterations per strain point are also returned
 
     Returns
     -------
     trueStress : Vector
-        Principal true stress history
+        Principal true stress history, shape (N,) or (P,N)
+
+    iterations : Vector
+        Lateral stretch solver iterations per strain point, only if full_output is True
     """
-    stress: Vector = zeros_like(trueStrain)
+    F, iterations = biaxial_stretch(model, trueStrain, params, method)
 
-    def S33abs(x: list[float]) -> Scalar:
-        F: Tensor = diag([lam1, lam1, x[0]])
-        S33: Scalar = model(F, params)[2, 2]
-        return abs(S33)
+    stress: Vector = model(F, population_params(params))[..., 0, 0]
 
-    for i, strain in enumerate(trueStrain):
-        lam1: Scalar = exp(strain)
+    if full_output:
+        return stress, iterations
 
-        # Search numerically for the transverse strain that makes S33 = 0
-        opt: OptimizeResult = minimize(
-            fun=S33abs,
-            x0=1 / lam1**2,
-            method="Nelder-Mead",
-            tol=1e-9,
-        )
+    return stress
 
-        lam3: Scalar = opt.x[0]
 
-        F: Tensor = diag([lam1, lam1, lam3])
+def planar_loading(trueStrain: Vector) -> MixedLoading:
+    """
+    Compresssible planar loading path (pure shear), with stress-free lateral faces.
+
+    Parameters
+    ----------
+    trueStrain : Vector
+        Principal true strain history
 
-        stress[i] = model(F, params)[0, 0]
+    Returns
+    -------
+    loading : MixedLoading
+        Prescribed in-plane stretches, free thickness stretch starting from an isochoric guess
+    """
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
 
-    return stress
+    return MixedLoading(stretch_tensor(lam1, 1.0, 1 / lam1), free=((2, 2),))
 
 
-def planar_stress(model: ElasticModel, trueStrain: Vector, params: Vector) -> Vector:
+def planar_stretch(
+    model: ElasticModel,
+    trueStrain: Vector,
+    params: Vector,
+    method: str = "newton",
+) -> tuple[Tensor, Vector]:
+    """
+    Deformation gradients of compresssible planar loading (pure shear), with stress-free lateral faces.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    trueStrain : Vector
+        Principal true strain history
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    method : str = "newton"
+        Lateral stretch solver, "newton" (mixed_stretch), "brentq" (warm-started root solve) or "nelder-mead"
+
+    Returns
+    -------
+    F : Tensor
+        Stack of deformation gradient tensors of shape (N,3,3) or (P,N,3,3)
+
+    iterations : Vector
+        Lateral stretch solver iterations per strain point
+    """
+    if method == "newton":
+        return mixed_stretch(model, planar_loading(trueStrain), params)
+
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
+
+    # Search numerically for the transverse stretch that makes S33 = 0
+    lam3, iterations = _lateral_stretch(
+        model=model,
+        params=params,
+        lam1=lam1,
+        guess=1 / lam1,
+        kinematics=lambda lam1, x: stretch_tensor(lam1, 1.0, x),
+        component=2,
+        method=method,
+    )
+
+    return stretch_tensor(lam1, 1.0, lam3), iterations
+
+
+def planar_stress(
+    model: ElasticModel,
+    trueStrain: Vector,
+    params: Vector,
+    method: str = "newton",
+    full_output: bool = False,
+) -> Vector | tuple[Vector, Vector]:
     """
     Compresssible planar loading (pure shear).
 
@@ -111,35 +785,224 @@ def planar_stress(model: ElasticModel, trueStrain: Vector, params: Vector) -> Ve
         Principal true strain history
 
     params : Vector
-        Material parameters to be passed to model
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    method : str = "newton"
+        Lateral stretch solver, "newton" (mixed_stretch), "brentq" (warm-started root solve) or "nelder-mead"
+
+    full_output : bool = False
+        If True, the solver iterations per strain point are also returned
+
+    Returns
+    -------
+    trueStress : Vector
+        Principal true stress history, shape (N,) or (P,N)
+
+    iterations : Vector
+        Lateral stretch solver iterations per strain point, only if full_output is True
+    """
+    F, iterations = planar_stretch(model, trueStrain, params, method)
+
+    stress: Vector = model(F, population_params(params))[..., 0, 0]
+
+    if full_output:
+        return stress, iterations
+
+    return stress
+
+
+def simple_shear_loading(shear: Vector) -> MixedLoading:
+    """
+    Simple shear loading path, F = I + shear e1 x e2, with every component of F prescribed.
+
+    Parameters
+    ----------
+    shear : Vector
+        Amount of shear history
+
+    Returns
+    -------
+    loading : MixedLoading
+        Prescribed deformation gradients, returning the shear stress
+    """
+    F: Tensor = broadcast_to(eye(3), (*asarray(shear).shape, 3, 3)).copy()
+    F[..., 0, 1] = shear
+
+    return MixedLoading(F, output=(0, 1))
+
+
+def simple_shear_stress(
+    model: ElasticModel,
+    shear: Vector,
+    params: Vector,
+    full_output: bool = False,
+) -> Vector | tuple[Vector, Vector]:
+    """
+    Compressible simple shear.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    shear : Vector
+        Amount of shear history
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    full_output : bool = False
+        If True, the solver iterations per strain point (zero) are also returned
 
     Returns
     -------
     trueStress : Vector
-        Principal true stress history
+        Shear true stress history, shape (N,) or (P,N)
+
+    iterations : Vector
+        Solver iterations per strain point, only if full_output is True
     """
-    stress: Vector = zeros_like(trueStrain)
+    return mixed_stress(model, simple_shear_loading(shear), params, full_output)
 
-    def S33abs(x: list[float]) -> Scalar:
-        F: Tensor = diag([lam1, 1.0, x[0]])
-        S33: Scalar = model(F, params)[2, 2]
-        return abs(S33)
 
-    for i, strain in enumerate(trueStrain):
-        lam1: Scalar = exp(strain)
+def confined_compression_loading(trueStrain: Vector) -> MixedLoading:
+    """
+    Confined (oedometric) compression loading path, with laterally fixed faces.
 
-        # Search numerically for the transverse stretch that makes S33 = 0
-        opt: OptimizeResult = minimize(
-            fun=S33abs,
-            x0=1 / lam1,
-            method="Nelder-Mead",
-            tol=1e-9,
-        )
+    Parameters
+    ----------
+    trueStrain : Vector
+        Axial true strain history
 
-        lam3: Scalar = opt.x[0]
+    Returns
+    -------
+    loading : MixedLoading
+        Prescribed axial stretch and unit lateral stretches
+    """
+    return MixedLoading(stretch_tensor(exp(asarray(trueStrain, dtype=float)), 1.0, 1.0))
 
-        F: Tensor = diag([lam1, 1.0, lam3])
 
-        stress[i] = model(F, params)[0, 0]
+def confined_compression_stress(
+    model: ElasticModel,
+    trueStrain: Vector,
+    params: Vector,
+    full_output: bool = False,
+) -> Vector | tuple[Vector, Vector]:
+    """
+    Compressible confined compression.
 
-    return stress
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    trueStrain : Vector
+        Axial true strain history
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    full_output : bool = False
+        If True, the solver iterations per strain point (zero) are also returned
+
+    Returns
+    -------
+    trueStress : Vector
+        Axial true stress history, shape (N,) or (P,N)
+
+    iterations : Vector
+        Solver iterations per strain point, only if full_output is True
+    """
+    return mixed_stress(model, confined_compression_loading(trueStrain), params, full_output)
+
+
+# Mixed loading path of each compressible deformation mode
+COMPRESSIBLE_KINEMATICS: dict[ElasticDeformation, Callable[[Vector], MixedLoading]] = {
+    uniaxial_stress: uniaxial_loading,
+    biaxial_stress: biaxial_loading,
+    planar_stress: planar_loading,
+    simple_shear_stress: simple_shear_loading,
+    confined_compression_stress: confined_compression_loading,
+}
+
+
+def stress_jacobian(
+    model: ElasticModel,
+    model_jacobian: ElasticModelJacobian,
+    deformation: ElasticDeformation,
+    trueStrain: Vector,
+    params: Vector,
+) -> Vector:
+    """
+    Derivatives of a compressible stress history with respect to the material parameters.
+
+    The free components of F depend on the parameters through the prescribed stress conditions, which is
+    accounted for by implicit differentiation. The stress derivatives with respect to the free components
+    are given by the analytic tangent of the model (see model_tangent), or else computed by central
+    differences (one batched model call).
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    model_jacobian : ElasticModelJacobian
+        Parameter derivatives of the hyperelastic material model
+
+    deformation : ElasticDeformation
+        Compressible deformation mode from this module
+
+    trueStrain : Vector
+        True strain history
+
+    params : Vector
+        Material parameters to be passed to model
+
+    Returns
+    -------
+    dStress : Vector
+        Stress history derivatives of shape (S,N), one row per material parameter
+    """
+    loading: MixedLoading = COMPRESSIBLE_KINEMATICS[deformation](trueStrain)
+
+    F, _ = mixed_stretch(model, loading, params)
+
+    dStress_dparams: Tensor = model_jacobian(F, params)
+
+    i, j = loading.output
+
+    if not loading.free:
+        return dStress_dparams[..., i, j]
+
+    rows: Vector = array([r for r, _ in loading.free])
+    cols: Vector = array([c for _, c in loading.free])
+    m: int = len(rows)
+
+    tangent: ElasticModelTangent | None = model_tangent(model)
+
+    dStress_dx: Tensor
+
+    if tangent is not None:
+        dStress_dx = moveaxis(tangent(F, params)[..., rows, cols], -1, 0)
+
+    else:
+        h: Vector = LATERAL_FD_STEP * maximum(abs(F[..., rows, cols]), 1.0)
+
+        # Forward and backward perturbation of each free component, stacked along a leading axis
+        Fs: Tensor = broadcast_to(F, (2, m, *F.shape)).copy()
+
+        for k in range(m):
+            Fs[0, k, :, rows[k], cols[k]] += h[:, k]
+            Fs[1, k, :, rows[k], cols[k]] -= h[:, k]
+
+        sigma: Tensor = model(Fs, params)
+        dStress_dx = (sigma[0] - sigma[1]) / (2.0 * h.T)[..., None, None]
+
+    # Stress derivatives of the free and output components, shapes (N,m,m) and (N,m)
+    A: Tensor = dStress_dx[..., rows, cols].transpose(1, 2, 0)
+    B: Vector = dStress_dx[..., i, j].T
+
+    # dx/dparams = -A^-1 dsigma_free/dparams, shape (N,m,S)
+    dx_dparams: Tensor = -solve(A, dStress_dparams[..., rows, cols].transpose(1, 2, 0))
+
+    return dStress_dparams[..., i, j] + (B[..., None] * dx_dparams).sum(axis=1).T
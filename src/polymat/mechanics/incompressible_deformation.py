@@ -1,46 +1,116 @@
-from numpy import append, diag, exp, sqrt, zeros_like
+from collections.abc import Callable
 
-from polymat.types import ElasticModel, Scalar, Tensor, Vector
+from numpy import append, asarray, exp, sqrt, zeros_like
 
+from polymat.mechanics.kinematics import Kinematics, population_params, stretch_tensor
+from polymat.types import ElasticDeformation, ElasticModel, ElasticModelJacobian, Tensor, Vector
 
-def uniaxial_stress_incompressible(model: ElasticModel, trueStrain: Vector, params: Vector) -> Vector:
+
+def _incompressible_params(params: Vector) -> Vector:
     """
-    Incompresssible uniaxial loading.
+    Appends a zero bulk modulus to the material parameters and prepares them for broadcasting.
+
+    Parameters
+    ----------
+    params : Vector
+        Material parameters without bulk modulus, shape (S,) or (S,P)
+
+    Returns
+    -------
+    params : Vector
+        Material parameters with zero bulk modulus, shape (S+1,) or (S+1,P,1)
+    """
+    _params: Vector = asarray(params, dtype=float)
+
+    return population_params(append(_params, zeros_like(_params[:1]), axis=0))
+
+
+def axial_stress_incompressible(model: ElasticModel, F: Tensor | Kinematics, params: Vector) -> Vector:
+    """
+    First normal stress of an incompressible material for given deformation gradients.
 
     Parameters
     ----------
     model : ElasticModel
         Hyperelastic material model
 
-    trueStrain : Vector
-        Uniaxial true strain history
+    F : Tensor | Kinematics
+        Stack of deformation gradient tensors of shape (N,3,3), or their precomputed Kinematics
 
     params : Vector
-        Material parameters to be passed to model
+        Material parameters (without bulk modulus), shape (S,) or (S,P) for P parameter sets
 
     Returns
     -------
     trueStress : Vector
-        Uniaxial true stress history
+        True stress history, shape (N,) or (P,N)
     """
-    stress: Vector = zeros_like(trueStrain)
+    return model(F, _incompressible_params(params))[..., 0, 0]
 
-    _params: Vector = append(params, 0.0)
 
-    for i, strain in enumerate(trueStrain):
-        lam1: Scalar = exp(strain)
-        lam2: Scalar = 1 / sqrt(lam1)
+def uniaxial_stretch_incompressible(trueStrain: Vector) -> Tensor:
+    """
+    Deformation gradients of incompresssible uniaxial loading.
 
-        F: Tensor = diag([lam1, lam2, lam2])
+    Parameters
+    ----------
+    trueStrain : Vector
+        Uniaxial true strain history
 
-        stress[i] = model(F, _params)[0, 0]
+    Returns
+    -------
+    F : Tensor
+        Stack of deformation gradient tensors of shape (N,3,3)
+    """
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
+    lam2: Vector = 1 / sqrt(lam1)
 
-    return stress
+    return stretch_tensor(lam1, lam2, lam2)
 
 
-def biaxial_stress_incompressible(model: ElasticModel, trueStrain: Vector, params: Vector) -> Vector:
+def biaxial_stretch_incompressible(trueStrain: Vector) -> Tensor:
     """
-    Icompresssible equi-biaxial loading.
+    Deformation gradients of incompresssible equi-biaxial loading.
+
+    Parameters
+    ----------
+    trueStrain : Vector
+        Principal true strain history
+
+    Returns
+    -------
+    F : Tensor
+        Stack of deformation gradient tensors of shape (N,3,3)
+    """
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
+    lam3: Vector = 1 / lam1**2
+
+    return stretch_tensor(lam1, lam1, lam3)
+
+
+def planar_stretch_incompressible(trueStrain: Vector) -> Tensor:
+    """
+    Deformation gradients of incompresssible planar loading (pure shear).
+
+    Parameters
+    ----------
+    trueStrain : Vector
+        Principal true strain history
+
+    Returns
+    -------
+    F : Tensor
+        Stack of deformation gradient tensors of shape (N,3,3)
+    """
+    lam1: Vector = exp(asarray(trueStrain, dtype=float))
+    lam3: Vector = 1 / lam1
+
+    return stretch_tensor(lam1, 1.0, lam3)
+
+
+def uniaxial_stress_incompressible(model: ElasticModel, trueStrain: Vector, params: Vector) -> Vector:
+    """
+    Incompresssible uniaxial loading.
 
     Parameters
     ----------
@@ -48,29 +118,44 @@ def biaxial_stress_incompressible(model: ElasticModel, trueStrain: Vector, param
         Hyperelastic material model
 
     trueStrain : Vector
-        Principal true strain history
+        Uniaxial true strain history
 
     params : Vector
-        Material parameters to be passed to model
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
 
     Returns
     -------
     trueStress : Vector
-        Principal true stress history
+        Uniaxial true stress history, shape (N,) or (P,N)
     """
-    stress: Vector = zeros_like(trueStrain)
+    F: Tensor = uniaxial_stretch_incompressible(trueStrain)
+
+    return axial_stress_incompressible(model, F, params)
 
-    _params: Vector = append(params, 0.0)
 
-    for i, strain in enumerate(trueStrain):
-        lam1: Scalar = exp(strain)
-        lam3: Scalar = 1 / lam1**2
+def biaxial_stress_incompressible(model: ElasticModel, trueStrain: Vector, params: Vector) -> Vector:
+    """
+    Icompresssible equi-biaxial loading.
+
+    Parameters
+    ----------
+    model : ElasticModel
+        Hyperelastic material model
+
+    trueStrain : Vector
+        Principal true strain history
 
-        F: Tensor = diag([lam1, lam1, lam3])
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
 
-        stress[i] = model(F, _params)[0, 0]
+    Returns
+    -------
+    trueStress : Vector
+        Principal true stress history, shape (N,) or (P,N)
+    """
+    F: Tensor = biaxial_stretch_incompressible(trueStrain)
 
-    return stress
+    return axial_stress_incompressible(model, F, params)
 
 
 def planar_stress_incompressible(model: ElasticModel, trueStrain: Vector, params: Vector) -> Vector:
@@ -86,24 +171,59 @@ def planar_stress_incompressible(model: ElasticModel, trueStrain: Vector, params
         Principal true strain history
 
     params : Vector
-        Material parameters to be passed to model
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
 
     Returns
     -------
     trueStress : Vector
-        Principal true stress history
+        Principal true stress history, shape (N,) or (P,N)
+    """
+    F: Tensor = planar_stretch_incompressible(trueStrain)
+
+    return axial_stress_incompressible(model, F, params)
+
+
+# Closed-form kinematics of each incompressible deformation mode
+INCOMPRESSIBLE_KINEMATICS: dict[ElasticDeformation, Callable[[Vector], Tensor]] = {
+    uniaxial_stress_incompressible: uniaxial_stretch_incompressible,
+    biaxial_stress_incompressible: biaxial_stretch_incompressible,
+    planar_stress_incompressible: planar_stretch_incompressible,
+}
+
+
+def stress_jacobian_incompressible(
+    model_jacobian: ElasticModelJacobian,
+    deformation: ElasticDeformation,
+    trueStrain: Vector,
+    params: Vector,
+    F: Tensor | Kinematics | None = None,
+) -> Vector:
     """
-    stress: Vector = zeros_like(trueStrain)
+    Derivatives of an incompressible stress history with respect to the material parameters.
 
-    _params: Vector = append(params, 0.0)
+    Parameters
+    ----------
+    model_jacobian : ElasticModelJacobian
+        Parameter derivatives of the hyperelastic material model
 
-    for i, strain in enumerate(trueStrain):
-        lam1: Scalar = exp(strain)
+    deformation : ElasticDeformation
+        Incompressible deformation mode from this module
 
-        lam3: Scalar = 1 / lam1
+    trueStrain : Vector
+        True strain history
 
-        F: Tensor = diag([lam1, 1.0, lam3])
+    params : Vector
+        Material parameters (without bulk modulus)
+
+    F : Tensor | Kinematics | None = None
+        Precomputed deformation gradients (or Kinematics) of the strain history
 
-        stress[i] = model(F, _params)[0, 0]
+    Returns
+    -------
+    dStress : Vector
+        Stress history derivatives of shape (S,N), one row per material parameter
+    """
+    if F is None:
+        F = INCOMPRESSIBLE_KINEMATICS[deformation](trueStrain)
 
-    return stress
+    return model_jacobian(F, _incompressible_params(params))[:-1, ..., 0, 0]
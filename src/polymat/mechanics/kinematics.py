@@ -0,0 +1,347 @@
+from functools import cached_property
+from typing import Self
+
+from numpy import (
+    abs,
+    asarray,
+    broadcast_arrays,
+    broadcast_to,
+    cross,
+    diagonal,
+    einsum,
+    eye,
+    matmul,
+    sqrt,
+    stack,
+    swapaxes,
+    trace,
+    where,
+    zeros,
+)
+from numpy.linalg import det, eigh
+
+from polymat.types import Tensor, Vector
+
+# Relative difference below which two principal stretches are treated as equal
+PRINCIPAL_TOL = 1e-6
+
+
+class Kinematics:
+    """
+    Kinematic quantities of a deformation gradient tensor or stack of tensors.
+
+    Every quantity is computed on first access and cached, so that material models evaluated
+    repeatedly on the same deformation history (e.g. during a calibration) share them.
+
+    Parameters
+    ----------
+    F : Tensor
+        Deformation gradient tensor of shape (3,3) or stack of tensors of shape (N,3,3)
+    """
+
+    def __init__(self, F: Tensor) -> None:
+        self.F: Tensor = asarray(F, dtype=float)
+
+    @cached_property
+    def J(self) -> Vector:
+        """Volume ratio det(F)"""
+        return det(self.F)
+
+    @cached_property
+    def b(self) -> Tensor:
+        """Left Cauchy-Green tensor F F^T"""
+        return einsum("...ij,...kj->...ik", self.F, self.F)
+
+    @cached_property
+    def bstar(self) -> Tensor:
+        """Distortional left Cauchy-Green tensor J^(-2/3) F F^T"""
+        return (self.J ** (-2.0 / 3.0))[..., None, None] * self.b
+
+    @cached_property
+    def bstar2(self) -> Tensor:
+        """Square of the distortional left Cauchy-Green tensor"""
+        return matmul(self.bstar, self.bstar)
+
+    @cached_property
+    def I1star(self) -> Vector:
+        """First invariant of bstar"""
+        return trace(self.bstar, axis1=-2, axis2=-1)
+
+    @cached_property
+    def I2star(self) -> Vector:
+        """Second invariant of bstar"""
+        return 0.5 * (self.I1star**2.0 - trace(self.bstar2, axis1=-2, axis2=-1))
+
+    @cached_property
+    def dev_bstar(self) -> Tensor:
+        """Deviatoric part of bstar"""
+        return self.bstar - (self.I1star / 3.0)[..., None, None] * eye(3)
+
+    @cached_property
+    def is_diagonal(self) -> bool:
+        """True if every tensor is diagonal, i.e. loaded along the coordinate axes"""
+        return not (self.F * (1.0 - eye(3))).any()
+
+    @cached_property
+    def _spectral(self) -> tuple[Vector, Tensor]:
+        # Principal axes of diagonal (coaxial) deformations are the coordinate axes
+        if self.is_diagonal:
+            return abs(diagonal(self.F, axis1=-2, axis2=-1)), broadcast_to(eye(3), self.F.shape)
+
+        lam2, Q = eigh(self.b)
+        return sqrt(lam2), Q
+
+    @cached_property
+    def principal_stretches(self) -> Vector:
+        """Principal stretches, of shape (...,3)"""
+        return self._spectral[0]
+
+    @cached_property
+    def principal_directions(self) -> Tensor:
+        """Principal directions of b, stored by columns"""
+        return self._spectral[1]
+
+    # Derivatives with respect to F, of shape (...,3,3) for scalars and (...,3,3,3,3) for tensors, the last two
+    # axes indexing the component of F
+
+    @cached_property
+    def FinvT(self) -> Tensor:
+        """Inverse transpose of F, from the cofactors of F"""
+        F: Tensor = self.F
+
+        cofactor: Tensor = stack(
+            [cross(F[..., 1, :], F[..., 2, :]), cross(F[..., 2, :], F[..., 0, :]), cross(F[..., 0, :], F[..., 1, :])],
+            axis=-2,
+        )
+
+        return cofactor / self.J[..., None, None]
+
+    @cached_property
+    def dJ_dF(self) -> Tensor:
+        """Derivative of J, J F^-T"""
+        return self.J[..., None, None] * self.FinvT
+
+    @cached_property
+    def db_dF(self) -> Tensor:
+        """Derivative of b, delta_ik F_jl + F_il delta_jk"""
+        dF: Tensor = eye(3)[:, None, :, None] * self.F[..., None, :, None, :]
+
+        return dF + swapaxes(dF, -3, -4)
+
+    @cached_property
+    def dbstar_dF(self) -> Tensor:
+        """Derivative of bstar"""
+        return (self.J ** (-2.0 / 3.0))[..., None, None, None, None] * self.db_dF - 2.0 / 3.0 * einsum(
+            "...ij,...kl->...ijkl", self.bstar, self.FinvT
+        )
+
+    @cached_property
+    def dI1star_dF(self) -> Tensor:
+        """Derivative of I1star"""
+        return (2.0 * self.J ** (-2.0 / 3.0))[..., None, None] * self.F - (2.0 / 3.0 * self.I1star)[
+            ..., None, None
+        ] * self.FinvT
+
+    @cached_property
+    def dI2star_dF(self) -> Tensor:
+        """Derivative of I2star, I1star dI1star - tr(bstar dbstar)"""
+        return self.I1star[..., None, None] * self.dI1star_dF - einsum(
+            "...ij,...jikl->...kl", self.bstar, self.dbstar_dF
+        )
+
+    @cached_property
+    def dbstar2_dF(self) -> Tensor:
+        """Derivative of the square of bstar"""
+        dbstar_bstar: Tensor = einsum("...imkl,...mj->...ijkl", self.dbstar_dF, self.bstar)
+
+        return dbstar_bstar + swapaxes(dbstar_bstar, -3, -4)
+
+    @cached_property
+    def ddev_bstar_dF(self) -> Tensor:
+        """Derivative of dev_bstar"""
+        return self.dbstar_dF - einsum("ij,...kl->...ijkl", eye(3) / 3.0, self.dI1star_dF)
+
+    def principal_tangent(self, values: Vector, dvalues_dlam: Tensor) -> Tensor:
+        """
+        Derivative with respect to F of the symmetric tensors sharing the principal directions of b (see
+        principal_tensor), from the derivatives of their principal values with respect to the principal
+        stretches.
+
+        The rotation of the principal directions contributes (values_a - values_b) / (lam_a^2 - lam_b^2) to the
+        shear components, replaced by its limit for equal stretches.
+
+        Parameters
+        ----------
+        values : Vector
+            Principal values of shape (...,3), ordered as principal_stretches
+
+        dvalues_dlam : Tensor
+            Derivatives of shape (...,3,3), dvalues_dlam[..., a, c] of values a with respect to stretch c
+
+        Returns
+        -------
+        dTensor : Tensor
+            Tensor derivatives of shape (...,3,3,3,3)
+        """
+        lam: Vector = self.principal_stretches
+        Q: Tensor = self.principal_directions
+
+        values = asarray(values)
+        dvalues_dlam = asarray(dvalues_dlam)
+
+        # Derivative of b in the principal basis, whose diagonal gives d(lam_a^2)
+        db: Tensor = einsum("...ia,...ijkl,...jb->...abkl", Q, self.db_dF, Q)
+        dlam: Tensor = diagonal(db, axis1=-4, axis2=-3) / (2.0 * lam[..., None, None, :])
+
+        lam_a: Vector = lam[..., :, None]
+        lam_b: Vector = lam[..., None, :]
+
+        dvalues_aa: Vector = diagonal(dvalues_dlam, axis1=-2, axis2=-1)[..., :, None]
+        limit: Vector = (
+            (dvalues_aa - dvalues_dlam) / (2.0 * lam_a) + swapaxes(dvalues_aa - dvalues_dlam, -1, -2) / (2.0 * lam_b)
+        ) / 2.0
+
+        close: Vector = abs(lam_a - lam_b) <= PRINCIPAL_TOL * lam_a
+        spin: Vector = where(
+            close, limit, (values[..., :, None] - values[..., None, :]) / where(close, 1.0, lam_a**2 - lam_b**2)
+        )
+
+        dTensor: Tensor = spin[..., None, None] * db * (1.0 - eye(3))[..., None, None]
+        dTensor += einsum("ab,...ac,...klc->...abkl", eye(3), dvalues_dlam, dlam)
+
+        return einsum("...ia,...abkl,...jb->...ijkl", Q, dTensor, Q)
+
+    def precompute(self) -> Self:
+        """
+        Computes every kinematic quantity at once, e.g. before evaluating many parameter sets.
+
+        Returns
+        -------
+        kinematics : Kinematics
+            The same object, with all quantities cached
+        """
+        for quantity in ("J", "b", "bstar", "bstar2", "I1star", "I2star", "dev_bstar", "_spectral"):
+            getattr(self, quantity)
+
+        return self
+
+    def principal_tensor(self, values: Vector) -> Tensor:
+        """
+        Symmetric tensors sharing the principal directions of b.
+
+        Parameters
+        ----------
+        values : Vector
+            Principal values of shape (...,3), ordered as principal_stretches
+
+        Returns
+        -------
+        tensor : Tensor
+            Tensors of shape (...,3,3)
+        """
+        values = asarray(values)
+
+        if self.is_diagonal:
+            return values[..., None] * eye(3)
+
+        Q: Tensor = self.principal_directions
+
+        return matmul(Q * values[..., None, :], swapaxes(Q, -1, -2))
+
+
+def kinematics(F: Tensor | Kinematics) -> Kinematics:
+    """
+    Kinematic quantities of a deformation gradient, reusing them if already computed.
+
+    Parameters
+    ----------
+    F : Tensor | Kinematics
+        Deformation gradient tensor(s) or precomputed Kinematics
+
+    Returns
+    -------
+    kinematics : Kinematics
+        Kinematic quantities of F
+    """
+    if isinstance(F, Kinematics):
+        return F
+
+    return Kinematics(F)
+
+
+def stretch_tensor(lam1: Vector, lam2: Vector, lam3: Vector) -> Tensor:
+    """
+    Diagonal deformation gradient tensors built from principal stretch histories.
+
+    Parameters
+    ----------
+    lam1 : Vector
+        First principal stretch history
+
+    lam2 : Vector
+        Second principal stretch history
+
+    lam3 : Vector
+        Third principal stretch history
+
+    Returns
+    -------
+    F : Tensor
+        Stack of deformation gradient tensors of shape (N,3,3)
+    """
+    _lam1, _lam2, _lam3 = broadcast_arrays(lam1, lam2, lam3)
+
+    F: Tensor = zeros(_lam1.shape + (3, 3))
+
+    F[..., 0, 0] = _lam1
+    F[..., 1, 1] = _lam2
+    F[..., 2, 2] = _lam3
+
+    return F
+
+
+def spatial_tangent(F: Tensor, dStress_dF: Tensor) -> Tensor:
+    """
+    Spatial tangent modulus of the Cauchy stress, relating its rate to the velocity gradient l = dF/dt F^-1.
+
+    Parameters
+    ----------
+    F : Tensor
+        Deformation gradient tensor of shape (3,3) or stack of tensors of shape (N,3,3)
+
+    dStress_dF : Tensor
+        Derivatives of the Cauchy stress with respect to F of shape (...,3,3,3,3), from a model tangent
+
+    Returns
+    -------
+    a : Tensor
+        Spatial tangent of shape (...,3,3,3,3), dsigma_ij/dt = a_ijkl l_kl
+    """
+    return einsum("...ijkm,...lm->...ijkl", dStress_dF, F)
+
+
+def population_params(params: Vector) -> Vector:
+    """
+    Prepares material parameters for broadcasting against a strain history.
+
+    A matrix of parameters of shape (S,P), holding one parameter set of size S per column
+    (as sent by scipy.optimize.differential_evolution in vectorized mode), is reshaped to (S,P,1)
+    so that each parameter broadcasts against the N points of the history. Single parameter sets
+    are returned as an array of shape (S,).
+
+    Parameters
+    ----------
+    params : Vector
+        Material parameters of shape (S,) or (S,P)
+
+    Returns
+    -------
+    params : Vector
+        Material parameters of shape (S,) or (S,P,1)
+    """
+    _params: Vector = asarray(params, dtype=float)
+
+    if _params.ndim == 2:
+        return _params[..., None]
+
+    return _params
@@ -0,0 +1,195 @@
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from numpy import asarray, float64, load, meshgrid, stack
+from numpy.lib.format import open_memmap
+
+from polymat.calibration.cache import CalibrationCache
+from polymat.mechanics.incompressible_deformation import INCOMPRESSIBLE_KINEMATICS, axial_stress_incompressible
+from polymat.mechanics.kinematics import Kinematics
+from polymat.types import ElasticDeformation, ElasticModel, Vector
+
+# Memory budget of the intermediate arrays of a chunk in bytes
+SWEEP_MEMORY = 256 * 2**20
+
+# Upper estimate of the float64 values held per parameter set and strain point while evaluating a chunk, about
+# 30 for the incompressible modes and 250 for the batched Newton solves of the compressible ones
+SWEEP_VALUES_PER_POINT = 256
+
+INDEX_SUFFIX = ".index"
+
+
+def parameter_grid(values: list[Vector]) -> Vector:
+    """
+    Parameter sets of a full factorial grid.
+
+    Parameters
+    ----------
+    values: list[Vector]
+        Values of each material parameter
+
+    Returns
+    -------
+    params: Vector
+        Matrix of shape (S,P) holding the P combinations of the values by columns, the last parameter varying
+        fastest
+    """
+    return stack([g.ravel() for g in meshgrid(*(asarray(v, dtype=float) for v in values), indexing="ij")])
+
+
+def sweep_chunk_size(points: int, max_memory: int = SWEEP_MEMORY) -> int:
+    """
+    Number of parameter sets evaluated at once within a memory budget.
+
+    Parameters
+    ----------
+    points: int
+        Number of points of the strain history
+
+    max_memory: int = SWEEP_MEMORY
+        Memory budget of the intermediate arrays in bytes
+
+    Returns
+    -------
+    chunk_size: int
+        Number of parameter sets per chunk, at least one
+    """
+    return max(max_memory // (SWEEP_VALUES_PER_POINT * float64().itemsize * max(points, 1)), 1)
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def _read_index(path: Path) -> dict[str, object] | None:
+    try:
+        with _index_path(path).open() as f:
+            return json.load(f)
+
+    # Missing, or left corrupted by an interrupted first write
+    except (OSError, ValueError):
+        return None
+
+
+def _write_index(path: Path, index: dict[str, object]) -> None:
+    """
+    Replaces the chunk index atomically, so that an interrupted sweep never leaves a partial index.
+    """
+    with NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as f:
+        json.dump(index, f)
+
+    os.replace(f.name, _index_path(path))
+
+
+def parameter_sweep(
+    path: str | Path,
+    elastic_model: ElasticModel,
+    params: Vector,
+    deformation_mode: list[ElasticDeformation],
+    strain: Vector,
+    chunk_size: int | None = None,
+    max_memory: int = SWEEP_MEMORY,
+    resume: bool = True,
+    callback: Callable[[int, int], None] | None = None,
+) -> Vector:
+    """
+    Evaluates the stress response of many parameter sets into a memory-mapped .npy file.
+
+    The parameter sets are evaluated by chunks of chunk_size columns in single batched calls of the deformation
+    modes, the kinematics of the incompressible modes being computed once for the whole sweep. The stress of
+    each chunk is written directly into the memory-mapped output, of shape (P,M,N) for P parameter sets, M
+    deformation modes and N strain points, so that the memory use is bounded by the chunk and not by the
+    sweep. After each chunk, the output is flushed and a chunk index, stored next to it with the INDEX_SUFFIX
+    suffix, records the number of completed parameter sets: an interrupted sweep resumes from there.
+
+    Parameters
+    ----------
+    path: str | Path
+        Output .npy file
+
+    elastic_model: ElasticModel
+        Hyperelastic material model from polymat.materials
+
+    params: Vector
+        Matrix of shape (S,P) holding P parameter sets by columns, e.g. from parameter_grid, in the convention of
+        the deformation modes (without bulk modulus for the incompressible ones)
+
+    deformation_mode: list[ElasticDeformation]
+        Stress computation functions from polymat.mechanics
+
+    strain: Vector
+        True strain history of shape (N,), common to every deformation mode
+
+    chunk_size: int | None = None
+        Number of parameter sets per chunk, by default the largest within max_memory (see sweep_chunk_size)
+
+    max_memory: int = SWEEP_MEMORY
+        Memory budget of the intermediate arrays of a chunk in bytes, when chunk_size is not given
+
+    resume: bool = True
+        If True, a sweep with the same inputs already (partially) written to path is continued. Otherwise, or
+        when path holds no such sweep, the sweep starts over.
+
+    callback: Callable[[int, int], None] | None = None
+        Called after each chunk with the number of completed parameter sets and the total number of sets
+
+    Returns
+    -------
+    stress: Vector
+        Read-only memory map of the output, of shape (P,M,N)
+    """
+    path = Path(path)
+    params = asarray(params, dtype=float)
+    strain = asarray(strain, dtype=float)
+
+    total: int = params.shape[1]
+    shape: tuple[int, int, int] = (total, len(deformation_mode), len(strain))
+
+    if chunk_size is None:
+        chunk_size = sweep_chunk_size(len(strain), max_memory)
+
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+    key: str = CalibrationCache.key("parameter-sweep", elastic_model, deformation_mode, strain, params)
+
+    index: dict[str, object] | None = _read_index(path) if resume and path.exists() else None
+
+    if index is not None and index.get("key") == key:
+        stress: Vector = open_memmap(path, mode="r+")
+    else:
+        index = {"key": key, "completed": 0}
+        stress = open_memmap(path, mode="w+", dtype=float64, shape=shape)
+        _write_index(path, index)
+
+    kinematics: list[Kinematics | None] = [
+        Kinematics(INCOMPRESSIBLE_KINEMATICS[_deformation](strain)).precompute()
+        if _deformation in INCOMPRESSIBLE_KINEMATICS
+        else None
+        for _deformation in deformation_mode
+    ]
+
+    for start in range(int(index["completed"]), total, chunk_size):
+        stop: int = min(start + chunk_size, total)
+        chunk: Vector = params[:, start:stop]
+
+        for m, (_deformation, K) in enumerate(zip(deformation_mode, kinematics)):
+            if K is not None:
+                stress[start:stop, m] = axial_stress_incompressible(elastic_model, K, chunk)
+            else:
+                stress[start:stop, m] = _deformation(elastic_model, strain, chunk)
+
+        # The stress is on disk before the index records it
+        stress.flush()
+        index["completed"] = stop
+        _write_index(path, index)
+
+        if callback is not None:
+            callback(stop, total)
+
+    del stress
+
+    return load(path, mmap_mode="r")
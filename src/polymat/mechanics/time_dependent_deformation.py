@@ -0,0 +1,152 @@
+from numpy import asarray, broadcast_to, eye
+
+from polymat.mechanics.incompressible_deformation import (
+    biaxial_stretch_incompressible,
+    planar_stretch_incompressible,
+    uniaxial_stretch_incompressible,
+)
+from polymat.mechanics.kinematics import Kinematics, population_params
+from polymat.types import Tensor, Vector, ViscoelasticModel
+
+
+def axial_stress_history(
+    model: ViscoelasticModel, F: Tensor | Kinematics, time: Vector, params: Vector, component: tuple[int, int] = (0, 0)
+) -> Vector:
+    """
+    Stress component history of a time-dependent material for a given deformation history.
+
+    Parameters
+    ----------
+    model : ViscoelasticModel
+        Time-dependent material model, e.g. a functools.partial of Prony
+
+    F : Tensor | Kinematics
+        Deformation gradient history of shape (N,3,3), or its precomputed Kinematics
+
+    time : Vector
+        Increasing time points of shape (N,)
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    component : tuple[int, int] = (0, 0)
+        Returned Cauchy stress component
+
+    Returns
+    -------
+    trueStress : Vector
+        True stress history, shape (N,) or (P,N)
+    """
+    return model(F, time, population_params(params))[..., component[0], component[1]]
+
+
+def uniaxial_stress_history(model: ViscoelasticModel, trueStrain: Vector, time: Vector, params: Vector) -> Vector:
+    """
+    Incompressible uniaxial loading history.
+
+    The deformation is isochoric, so that the bulk modulus of the hyperelastic parameters has no effect, and
+    the axial Cauchy stress is returned without lateral pressure, as by uniaxial_stress_incompressible.
+
+    Parameters
+    ----------
+    model : ViscoelasticModel
+        Time-dependent material model, e.g. a functools.partial of Prony
+
+    trueStrain : Vector
+        Uniaxial true strain history
+
+    time : Vector
+        Increasing time points, one per strain point
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    Returns
+    -------
+    trueStress : Vector
+        Uniaxial true stress history, shape (N,) or (P,N)
+    """
+    return axial_stress_history(model, uniaxial_stretch_incompressible(trueStrain), time, params)
+
+
+def biaxial_stress_history(model: ViscoelasticModel, trueStrain: Vector, time: Vector, params: Vector) -> Vector:
+    """
+    Incompressible equi-biaxial loading history, see uniaxial_stress_history.
+
+    Parameters
+    ----------
+    model : ViscoelasticModel
+        Time-dependent material model, e.g. a functools.partial of Prony
+
+    trueStrain : Vector
+        Principal true strain history
+
+    time : Vector
+        Increasing time points, one per strain point
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    Returns
+    -------
+    trueStress : Vector
+        Principal true stress history, shape (N,) or (P,N)
+    """
+    return axial_stress_history(model, biaxial_stretch_incompressible(trueStrain), time, params)
+
+
+def planar_stress_history(model: ViscoelasticModel, trueStrain: Vector, time: Vector, params: Vector) -> Vector:
+    """
+    Incompressible planar loading (pure shear) history, see uniaxial_stress_history.
+
+    Parameters
+    ----------
+    model : ViscoelasticModel
+        Time-dependent material model, e.g. a functools.partial of Prony
+
+    trueStrain : Vector
+        Principal true strain history
+
+    time : Vector
+        Increasing time points, one per strain point
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    Returns
+    -------
+    trueStress : Vector
+        Principal true stress history, shape (N,) or (P,N)
+    """
+    return axial_stress_history(model, planar_stretch_incompressible(trueStrain), time, params)
+
+
+def simple_shear_stress_history(model: ViscoelasticModel, shear: Vector, time: Vector, params: Vector) -> Vector:
+    """
+    Simple shear loading history, F = I + shear e1 x e2.
+
+    Parameters
+    ----------
+    model : ViscoelasticModel
+        Time-dependent material model, e.g. a functools.partial of Prony
+
+    shear : Vector
+        Amount of shear history
+
+    time : Vector
+        Increasing time points, one per shear point
+
+    params : Vector
+        Material parameters to be passed to model, shape (S,) or (S,P) for P parameter sets
+
+    Returns
+    -------
+    trueStress : Vector
+        Shear true stress history, shape (N,) or (P,N)
+    """
+    shear = asarray(shear, dtype=float)
+
+    F: Tensor = broadcast_to(eye(3), (*shear.shape, 3, 3)).copy()
+    F[..., 0, 1] = shear
+
+    return axial_stress_history(model, F, time, params, component=(0, 1))
@@ -1,8 +1,379 @@
-def main() -> int:
-    print("Hello from polymat!")
+"""
+Command line interface of polymat.
+
+    polymat fit --model Yeoh --lower 0,-1,-1 --upper 10,1,1 --curve uniaxial_incompressible:lot1.csv
+    polymat fit --model Yeoh --lower 0,-1,-1 --upper 10,1,1 --jobs 8 datasets.jsonl
+    polymat predict --model Yeoh --params 2,-0.016,3e-4 --mode uniaxial_incompressible strain.npy
+    polymat serve --port 8765 --workers 4
+
+Only the standard library is imported at startup, numpy, scipy and the polymat solvers are loaded by the
+subcommands that need them.
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from polymat.scripts.registry import DEFORMATION_MODES, MODELS, resolve
+
+if TYPE_CHECKING:
+    from polymat.calibration.batch import CalibrationJob, JobResult
+    from polymat.types import Vector
+
+
+def load_curve(path: str | Path) -> tuple["Vector", "Vector | None"]:
+    """
+    Reads a test curve from a CSV file (optional header row) or a memory-mapped .npy file.
+
+    Parameters
+    ----------
+    path: str | Path
+        File holding a strain column and optionally a stress column
+
+    Returns
+    -------
+    strain: Vector
+        True strain
+
+    stress: Vector | None
+        True stress, None for a single column
+    """
+    from numpy import load, loadtxt
+
+    path = Path(path)
+
+    if path.suffix == ".npy":
+        data: Vector = load(path, mmap_mode="r")
+    else:
+        with path.open() as f:
+            first: str = f.readline()
+
+        try:
+            [float(value) for value in first.replace(",", " ").split()]
+            header: int = 0
+        except ValueError:
+            header = 1
+
+        data = loadtxt(path, delimiter="," if "," in first else None, skiprows=header, ndmin=2)
+
+    if data.ndim == 1:
+        return data, None
+
+    # Curves stored by rows are transposed
+    if data.shape[0] <= 2 < data.shape[1]:
+        data = data.T
+
+    return data[:, 0], data[:, 1] if data.shape[1] > 1 else None
+
+
+def _floats(text: str) -> list[float]:
+    return [float(value) for value in text.split(",")]
+
+
+def _curve(spec: str | list[str] | dict[str, str]) -> tuple[str, str]:
+    """
+    Deformation mode and file of a curve given as "mode:file", [mode, file] or {"mode": ..., "file": ...}.
+    """
+    if isinstance(spec, dict):
+        return spec["mode"], spec["file"]
+
+    if isinstance(spec, str):
+        mode, _, file = spec.partition(":")
+        return mode, file
+
+    return spec[0], spec[1]
+
+
+# Errors of a single dataset, reported as a failed result without stopping the batch
+DATASET_ERRORS: tuple[type[Exception], ...] = (OSError, ValueError, KeyError, TypeError)
+
+
+def _datasets(args: argparse.Namespace) -> Iterator[tuple[str, dict[str, object] | Exception, Path]]:
+    """
+    Calibration datasets from the command line options or from JSON lines manifests, read lazily.
+
+    Each dataset is yielded with its name and root directory. A manifest that cannot be read, or a line that is
+    not a JSON object, is yielded as its error instead, so that the other datasets are still calibrated.
+    """
+    if args.curve:
+        name: str = args.name or Path(_curve(args.curve[0])[1]).stem
+        yield name, {"name": name, "curves": args.curve}, Path.cwd()
+
+    for manifest in args.manifest:
+        root: Path = Path.cwd() if manifest == "-" else Path(manifest).parent
+
+        try:
+            f: TextIO = sys.stdin if manifest == "-" else open(manifest)  # noqa: SIM115
+        except OSError as exc:
+            yield manifest, exc, root
+            continue
+
+        try:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+
+                name = f"{Path(manifest).stem}:{number}"
+
+                try:
+                    dataset: object = json.loads(line)
+                except ValueError as exc:
+                    yield name, exc, root
+                    continue
+
+                if not isinstance(dataset, dict):
+                    yield name, TypeError(f"Expected a JSON object, got {type(dataset).__name__}"), root
+                    continue
+
+                dataset.setdefault("name", name)
+                yield str(dataset["name"]), dataset, root
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def _fit_job(dataset: dict[str, object], root: Path, args: argparse.Namespace) -> "CalibrationJob":
+    """
+    Builds the calibration job of a dataset, with the command line options as defaults.
+    """
+    from polymat.calibration.batch import CalibrationJob
+
+    strain: list[Vector] = []
+    stress: list[Vector] = []
+    modes: list[object] = []
+
+    for spec in dataset["curves"]:
+        mode, file = _curve(spec)
+
+        _strain, _stress = load_curve(root / file)
+
+        if _stress is None:
+            raise ValueError(f"No stress column in {file}")
+
+        strain.append(_strain)
+        stress.append(_stress)
+        modes.append(resolve(DEFORMATION_MODES, mode))
+
+    options: dict[str, object] = {
+        "vectorized": args.vectorized,
+        "refine": args.refine,
+        "seed": args.seed,
+        "max_points": args.max_points,
+    }
+
+    if args.cache is not None:
+        from polymat.calibration.cache import CalibrationCache
+
+        options["cache"] = CalibrationCache(args.cache)
+    options.update(dataset.get("options", {}))
+
+    lower_bound: list[float] | None = dataset.get("lower_bound", args.lower)
+    upper_bound: list[float] | None = dataset.get("upper_bound", args.upper)
+
+    if lower_bound is None or upper_bound is None:
+        raise ValueError("Parameter bounds are required (--lower and --upper, or lower_bound and upper_bound)")
+
+    return CalibrationJob(
+        name=str(dataset["name"]),
+        strain=strain,
+        stress=stress,
+        elastic_model=resolve(MODELS, dataset.get("model", args.model)),
+        deformation_mode=modes,
+        lower_bound=lower_bound,
+        upper_bound=upper_bound,
+        options=options,
+        timeout=dataset.get("timeout"),
+    )
+
+
+def _write_result(result: "JobResult", out: TextIO) -> None:
+    record: dict[str, object] = {
+        "name": result.name,
+        "status": result.status,
+        "params": None if result.params is None else [float(p) for p in result.params],
+        "error": None if result.error is None else float(result.error),
+        "elapsed": round(result.elapsed, 6),
+        "message": result.message,
+    }
+
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+
+
+def fit(args: argparse.Namespace, out: TextIO) -> int:
+    """
+    polymat fit: calibrates every dataset and writes one JSON line per result, in order of completion.
+    """
+    from polymat.calibration.batch import JobResult, run_batch, run_job
+
+    failures: int = 0
+
+    def jobs() -> Iterator["CalibrationJob"]:
+        nonlocal failures
+
+        for name, dataset, root in _datasets(args):
+            try:
+                if isinstance(dataset, Exception):
+                    raise dataset
+
+                yield _fit_job(dataset, root, args)
+            except DATASET_ERRORS as exc:
+                failures += 1
+                _write_result(JobResult(-1, name, "failed", message=f"{type(exc).__name__}: {exc}"), out)
+
+    results: Iterable[JobResult]
+
+    if args.jobs > 1 or args.timeout is not None:
+        results = run_batch(jobs(), max_workers=args.jobs, timeout=args.timeout)
+    else:
+        results = (run_job(index, job) for index, job in enumerate(jobs()))
+
+    for result in results:
+        failures += result.status != "done"
+        _write_result(result, out)
+
+    return 1 if failures else 0
+
+
+def _predict_file(task: tuple[str, str, str, list[float]]) -> dict[str, object]:
+    """
+    Stress prediction for one strain file, run by the predict subcommand (possibly in a worker process).
+
+    A file that cannot be read or evaluated gives a failed record, so that the other files are still processed.
+    """
+    file, model_name, mode_name, params = task
+
+    try:
+        strain, _ = load_curve(file)
+
+        model = resolve(MODELS, model_name)
+        mode = resolve(DEFORMATION_MODES, mode_name)
+
+        stress: Vector = mode(model, strain, params)
+    except DATASET_ERRORS as exc:
+        return {"name": file, "mode": mode_name, "status": "failed", "message": f"{type(exc).__name__}: {exc}"}
+
+    return {"name": file, "mode": mode_name, "status": "done", "strain": strain.tolist(), "stress": stress.tolist()}
+
+
+def predict(args: argparse.Namespace, out: TextIO) -> int:
+    """
+    polymat predict: computes the stress response for every strain file and writes one JSON line per file.
+    """
+    tasks: list[tuple[str, str, str, list[float]]] = [(file, args.model, args.mode, args.params) for file in args.files]
+    failures: int = 0
+
+    def write(records: Iterable[dict[str, object]]) -> None:
+        nonlocal failures
+
+        for record in records:
+            failures += record["status"] != "done"
+            out.write(json.dumps(record) + "\n")
+
+    if args.jobs > 1:
+        from multiprocessing import Pool
+
+        with Pool(args.jobs) as pool:
+            write(pool.imap(_predict_file, tasks))
+    else:
+        write(map(_predict_file, tasks))
+
+    return 1 if failures else 0
+
+
+def serve(args: argparse.Namespace, out: TextIO) -> int:
+    """
+    polymat serve: runs the local calibration service until interrupted.
+    """
+    import asyncio
+
+    from polymat.scripts.service import serve
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.retention))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
 
     return 0
 
 
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="polymat", description="Polymer material mechanics utilities")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--output", "-o", help="Output JSON lines file, standard output by default")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    models: str = ", ".join(MODELS)
+    modes: str = ", ".join(DEFORMATION_MODES)
+
+    fit_parser = subparsers.add_parser(
+        "fit",
+        parents=[output],
+        help="Calibrate material models against test curves",
+        description="Calibrate material models against test curves. Each line of a manifest is a JSON dataset "
+        '{"name", "model", "curves": [[mode, file], ...], "lower_bound", "upper_bound", "options", "timeout"}, '
+        "missing fields being taken from the command line options. Files are CSV (strain, stress columns) or .npy.",
+    )
+    fit_parser.add_argument("manifest", nargs="*", help="JSON lines dataset manifests, - for standard input")
+    fit_parser.add_argument("--curve", "-c", action="append", default=[], help=f"MODE:FILE test curve ({modes})")
+    fit_parser.add_argument("--name", help="Name of the dataset given by --curve")
+    fit_parser.add_argument("--model", "-m", default="Yeoh", help=f"Material model ({models}) or module:attribute")
+    fit_parser.add_argument("--lower", type=_floats, help="Comma separated lower bounds of the parameters")
+    fit_parser.add_argument("--upper", type=_floats, help="Comma separated upper bounds of the parameters")
+    fit_parser.add_argument("--vectorized", action="store_true", help="Score whole populations at once")
+    fit_parser.add_argument("--refine", action="store_true", help="Coarse search and least squares refinement")
+    fit_parser.add_argument("--seed", type=int, help="Random seed of the search")
+    fit_parser.add_argument("--max-points", type=int, help="Resample each curve to about this number of points")
+    fit_parser.add_argument("--cache", help="Directory of a calibration cache reused across runs")
+    fit_parser.add_argument("--jobs", "-j", type=int, default=1, help="Number of datasets calibrated concurrently")
+    fit_parser.add_argument("--timeout", type=float, help="Time limit of each calibration in seconds")
+    fit_parser.set_defaults(func=fit)
+
+    predict_parser = subparsers.add_parser(
+        "predict",
+        parents=[output],
+        help="Compute the stress response to strain histories",
+        description="Compute the stress response to the strain histories of CSV or .npy files (first column).",
+    )
+    predict_parser.add_argument("files", nargs="+", help="Strain files")
+    predict_parser.add_argument("--model", "-m", required=True, help=f"Material model ({models}) or module:attribute")
+    predict_parser.add_argument("--mode", required=True, help=f"Deformation mode ({modes}) or module:attribute")
+    predict_parser.add_argument("--params", "-p", type=_floats, required=True, help="Comma separated parameters")
+    predict_parser.add_argument("--jobs", "-j", type=int, default=1, help="Number of files processed concurrently")
+    predict_parser.set_defaults(func=predict)
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a local calibration service",
+        description="Run a local HTTP/JSON calibration service with a warm pool of worker processes, "
+        "see polymat.scripts.service.",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    serve_parser.add_argument("--port", type=int, default=8765, help="TCP port, 0 for any free port")
+    serve_parser.add_argument("--unix", help="Unix socket path to listen on instead of TCP")
+    serve_parser.add_argument("--workers", "-j", type=int, help="Number of worker processes, all CPUs by default")
+    serve_parser.add_argument(
+        "--retention", type=int, default=1000, help="Number of finished jobs kept with their results and events"
+    )
+    serve_parser.set_defaults(func=serve, output=None)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args: argparse.Namespace = build_parser().parse_args(argv)
+
+    if args.output is None:
+        return args.func(args, sys.stdout)
+
+    with open(args.output, "w") as out:
+        return args.func(args, out)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
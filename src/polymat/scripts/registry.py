@@ -0,0 +1,50 @@
+from importlib import import_module
+
+# Names of the material models and deformation modes available from the command line, resolved on first use
+# so that listing them does not import numpy or scipy
+MODELS: dict[str, str] = {
+    "NeoHook": "polymat.materials.time_invariant.neo_hook:NeoHook",
+    "Yeoh": "polymat.materials.time_invariant.yeoh:Yeoh",
+    "Mooney5": "polymat.materials.time_invariant.mooney:Mooney5",
+    "EightChain": "polymat.materials.time_invariant.eight_chain:EightChain",
+    "Ogden": "polymat.materials.time_invariant.ogden:Ogden",
+    "Ogden2": "polymat.materials.time_invariant.ogden:Ogden2",
+}
+
+DEFORMATION_MODES: dict[str, str] = {
+    "uniaxial": "polymat.mechanics.elastic_deformation:uniaxial_stress",
+    "biaxial": "polymat.mechanics.elastic_deformation:biaxial_stress",
+    "planar": "polymat.mechanics.elastic_deformation:planar_stress",
+    "simple_shear": "polymat.mechanics.elastic_deformation:simple_shear_stress",
+    "confined_compression": "polymat.mechanics.elastic_deformation:confined_compression_stress",
+    "uniaxial_incompressible": "polymat.mechanics.incompressible_deformation:uniaxial_stress_incompressible",
+    "biaxial_incompressible": "polymat.mechanics.incompressible_deformation:biaxial_stress_incompressible",
+    "planar_incompressible": "polymat.mechanics.incompressible_deformation:planar_stress_incompressible",
+}
+
+
+def resolve(registry: dict[str, str], name: str) -> object:
+    """
+    Imports a registered object by name, or any object given as "package.module:attribute".
+
+    Parameters
+    ----------
+    registry: dict[str, str]
+        Registry of names, MODELS or DEFORMATION_MODES
+
+    name: str
+        Registered name or import path
+
+    Returns
+    -------
+    obj: object
+        Imported object
+    """
+    path: str = registry.get(name, name)
+
+    if ":" not in path:
+        raise ValueError(f"Unknown name {name!r}, expected one of {', '.join(registry)} or 'module:attribute'")
+
+    module, attribute = path.split(":", 1)
+
+    return getattr(import_module(module), attribute)
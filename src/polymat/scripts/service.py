@@ -0,0 +1,714 @@
+"""
+Local calibration service.
+
+    polymat serve --port 8765 --workers 4
+    polymat serve --unix /tmp/polymat.sock
+
+A single process holds a warm pool of workers, with numpy, scipy and the solvers already imported, and runs
+the jobs submitted by any number of clients by priority (lowest first, then in order of submission), so that
+concurrent notebooks and scripts share the cores instead of oversubscribing them. Jobs are JSON objects:
+
+    {"kind": "fit", "model": "Yeoh", "curves": [{"mode": "uniaxial_incompressible", "strain": [...],
+     "stress": [...]}], "lower_bound": [...], "upper_bound": [...], "options": {...}, "priority": 0}
+    {"kind": "predict", "model": "Yeoh", "mode": "uniaxial_incompressible", "params": [...], "strain": [...]}
+
+Models and deformation modes are given by their registered names only, the import paths accepted by the command
+line would let any client run arbitrary code in the service.
+
+HTTP/JSON API:
+
+    GET    /health              service status
+    GET    /jobs                summaries of the queued, running and last finished jobs
+    POST   /jobs                submits a job, returns its summary with its id
+    GET    /jobs/<id>           status and result of a job
+    DELETE /jobs/<id>           cancels a queued job, or stops a running fit after its current generation
+    GET    /jobs/<id>/events    JSON lines stream of the job events (progress of each generation of a fit,
+                                with the pid of its worker) until it finishes
+
+ServiceClient wraps the API for Python clients.
+"""
+
+import asyncio
+import http.client
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import count
+from multiprocessing import cpu_count
+from multiprocessing.queues import Queue
+from time import time
+from typing import TYPE_CHECKING
+
+from polymat.scripts.registry import DEFORMATION_MODES, MODELS, resolve
+
+if TYPE_CHECKING:
+    from polymat.calibration.instrumentation import Generation
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Thread pools of the numerical libraries, limited in the workers so that the service does not oversubscribe
+THREAD_VARIABLES: tuple[str, ...] = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+FINISHED: tuple[str, ...] = ("done", "failed", "cancelled")
+
+# Number of finished jobs kept, with their results and events, the oldest ones being dropped first
+DEFAULT_RETENTION = 1000
+
+# Largest request body read by the service in bytes
+MAX_REQUEST_SIZE = 64 * 2**20
+
+# Progress queue and cancellation requests, set in the worker processes by _init_worker
+_progress: Queue | None = None
+_cancelled: dict[int, bool] = {}
+
+
+def _init_worker(progress: Queue, cancelled: dict[int, bool]) -> None:
+    """
+    Initializer of the worker processes, limiting their threads and importing the solvers once.
+    """
+    global _progress, _cancelled
+
+    _progress = progress
+    _cancelled = cancelled
+
+    for variable in THREAD_VARIABLES:
+        os.environ.setdefault(variable, "1")
+
+    import polymat.calibration.solvers.elastic_fit  # noqa: F401
+
+
+def _warm_up() -> None:
+    pass
+
+
+def _registered(registry: dict[str, str], name: str) -> object:
+    """
+    Imports a registered object, unlike resolve never an arbitrary import path sent by a client.
+    """
+    if not isinstance(name, str) or name not in registry:
+        raise ValueError(f"Unknown name {name!r}, expected one of {', '.join(registry)}")
+
+    return resolve(registry, name)
+
+
+def _run_fit(job_id: int, job: dict[str, object]) -> dict[str, object]:
+    """
+    Calibration job, reporting the progress of each generation and stopping when cancelled.
+    """
+    from polymat.calibration.instrumentation import CalibrationResult
+    from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+
+    options: dict[str, object] = dict(job.get("options", {}))
+
+    if "workers" in options:
+        raise ValueError("The service runs each job in a single worker process, the workers option is not supported")
+
+    def callback(generation: "Generation") -> bool:
+        _progress.put(
+            (
+                job_id,
+                {
+                    "nit": generation.nit,
+                    "nfev": generation.nfev,
+                    "best_fitness": generation.best_fitness,
+                    "spread": generation.spread,
+                    "elapsed": generation.elapsed,
+                    "x": [float(x) for x in generation.x],
+                    "pid": os.getpid(),
+                },
+            )
+        )
+
+        return _cancelled.get(job_id, False)
+
+    result: CalibrationResult = fit_elastic_material(
+        [curve["strain"] for curve in job["curves"]],
+        [curve["stress"] for curve in job["curves"]],
+        _registered(MODELS, job["model"]),
+        [_registered(DEFORMATION_MODES, curve["mode"]) for curve in job["curves"]],
+        job["lower_bound"],
+        job["upper_bound"],
+        callback=callback,
+        full_output=True,
+        **options,
+    )
+
+    return {
+        "params": [float(p) for p in result.x],
+        "error": float(result.fun),
+        "nit": result.nit,
+        "nfev": result.nfev,
+        "elapsed": result.elapsed,
+    }
+
+
+def _run_predict(job_id: int, job: dict[str, object]) -> dict[str, object]:
+    """
+    Stress prediction job.
+    """
+    from numpy import asarray
+
+    model = _registered(MODELS, job["model"])
+    mode = _registered(DEFORMATION_MODES, job["mode"])
+
+    return {"stress": mode(model, asarray(job["strain"], dtype=float), job["params"]).tolist()}
+
+
+TASKS = {"fit": _run_fit, "predict": _run_predict}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status: int = status
+
+
+@dataclass(eq=False)
+class Job:
+    """
+    Job of the calibration service.
+
+    Parameters
+    ----------
+    id: int
+        Identifier of the job
+
+    kind: str
+        "fit" or "predict"
+
+    payload: dict[str, object]
+        Job description, see the module description
+
+    priority: int = 0
+        Jobs of lower priority value are run first
+
+    status: str = "queued"
+        "queued", "running", "done", "failed" or "cancelled"
+
+    result: dict[str, object] | None = None
+        Outcome of a finished job
+
+    message: str = ""
+        Description of the failure, if any
+
+    events: list[dict[str, object]]
+        Status changes and progress of the job
+
+    submitted: float
+        Submission time, as time.time()
+
+    started: float | None = None
+        Start time of a job taken by a worker
+
+    finished: float | None = None
+        End time of a finished job
+
+    cancel_requested: bool = False
+        Whether a running fit was asked to stop
+    """
+
+    id: int
+    kind: str
+    payload: dict[str, object]
+    priority: int = 0
+    status: str = "queued"
+    result: dict[str, object] | None = None
+    message: str = ""
+    events: list[dict[str, object]] = field(default_factory=list)
+    submitted: float = field(default_factory=time)
+    started: float | None = None
+    finished: float | None = None
+    cancel_requested: bool = False
+
+    # Set and replaced on every new event, see CalibrationService.emit
+    updated: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "priority": self.priority,
+            "status": self.status,
+            "result": self.result,
+            "message": self.message,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+class CalibrationService:
+    """
+    Priority queue of jobs run by a warm pool of worker processes.
+
+    Parameters
+    ----------
+    workers: int | None = None
+        Number of worker processes, the number of CPUs by default
+
+    retention: int = DEFAULT_RETENTION
+        Number of finished jobs kept, the oldest ones being dropped with their results and events, so that
+        the memory of a long-running service stays bounded
+    """
+
+    def __init__(self, workers: int | None = None, retention: int = DEFAULT_RETENTION) -> None:
+        self.workers: int = cpu_count() if workers is None else workers
+        self.retention: int = retention
+
+        if self.workers < 1:
+            raise ValueError(f"Invalid number of workers: {self.workers}")
+
+        if self.retention < 0:
+            raise ValueError(f"Invalid retention: {self.retention}")
+
+        self.jobs: dict[int, Job] = {}
+        self._finished: deque[int] = deque()
+
+        self._ids: Iterator[int] = count(1)
+        self._order: Iterator[int] = count()
+
+    async def start(self) -> None:
+        """
+        Starts the worker processes, waiting for them to be ready, and the job dispatchers.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # Workers are not forked from the service, which runs threads, so that a pool can be replaced safely
+        self._context: multiprocessing.context.BaseContext = multiprocessing.get_context(
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+
+        self._manager = self._context.Manager()
+        self._cancelled: dict[int, bool] = self._manager.dict()
+
+        self._new_pool(loop)
+
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_up) for _ in range(self.workers)))
+
+        self._queue: asyncio.PriorityQueue[tuple[int, int, Job]] = asyncio.PriorityQueue()
+        self._dispatchers: list[asyncio.Task[None]] = [
+            asyncio.create_task(self._dispatch()) for _ in range(self.workers)
+        ]
+
+    def _new_pool(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Starts a worker pool with its own progress queue and reader thread.
+
+        A worker killed while writing its progress can leave the queue locked or truncated: the queue of a broken
+        pool is abandoned with its reader, a daemon thread, rather than reused.
+        """
+        self._progress: Queue = self._context.Queue()
+
+        self._pool: ProcessPoolExecutor = ProcessPoolExecutor(
+            self.workers, mp_context=self._context, initializer=_init_worker, initargs=(self._progress, self._cancelled)
+        )
+
+        self._reader: threading.Thread = threading.Thread(
+            target=self._read_progress, args=(self._progress, loop), daemon=True
+        )
+        self._reader.start()
+
+    async def close(self) -> None:
+        """
+        Cancels the queued jobs, stops the running fits and shuts the worker processes down.
+        """
+        # Cancelling a queued job can drop finished jobs beyond the retention
+        for job in list(self.jobs.values()):
+            self.cancel(job)
+
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        await asyncio.to_thread(self._pool.shutdown, cancel_futures=True)
+
+        self._progress.put(None)
+        await asyncio.to_thread(self._reader.join)
+
+        self._manager.shutdown()
+
+    def emit(self, job: Job, event: str, **data: object) -> None:
+        """
+        Records an event of a job and wakes up its streams.
+        """
+        job.events.append({"id": job.id, "event": event, **data})
+
+        job.updated.set()
+        job.updated = asyncio.Event()
+
+    def submit(self, payload: dict[str, object]) -> Job:
+        """
+        Queues a job described by a JSON object, see the module description.
+        """
+        payload = dict(payload)
+        kind: object = payload.pop("kind", None)
+        priority: object = payload.pop("priority", 0)
+
+        if kind not in TASKS:
+            raise ValueError(f"Unknown job kind {kind!r}, expected one of {', '.join(TASKS)}")
+
+        if not isinstance(priority, int):
+            raise TypeError(f"Invalid priority {priority!r}, expected an integer")
+
+        job: Job = Job(next(self._ids), kind, payload, priority)
+        self.jobs[job.id] = job
+
+        self._queue.put_nowait((priority, next(self._order), job))
+        self.emit(job, "queued")
+
+        return job
+
+    def cancel(self, job: Job) -> None:
+        """
+        Cancels a queued job, or requests a running fit to stop after its current generation.
+        """
+        if job.status == "queued":
+            job.status = "cancelled"
+            self._finish(job)
+
+        # Only fits can stop early, a running prediction completes
+        elif job.status == "running" and job.kind == "fit" and not job.cancel_requested:
+            job.cancel_requested = True
+            self._cancelled[job.id] = True
+
+    def _finish(self, job: Job) -> None:
+        """
+        Records the end of a job, and drops the oldest finished jobs beyond the retention.
+        """
+        job.finished = time()
+        self.emit(job, job.status, result=job.result, message=job.message)
+
+        self._cancelled.pop(job.id, None)
+        self._finished.append(job.id)
+
+        while len(self._finished) > self.retention:
+            self.jobs.pop(self._finished.popleft(), None)
+
+    def _read_progress(self, queue: Queue, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Thread forwarding the progress reported by the workers to the event loop.
+        """
+        while (item := queue.get()) is not None:
+            job_id, progress = item
+            loop.call_soon_threadsafe(self._on_progress, job_id, progress)
+
+    def _on_progress(self, job_id: int, progress: dict[str, object]) -> None:
+        job: Job | None = self.jobs.get(job_id)
+
+        if job is not None and job.status == "running":
+            self.emit(job, "progress", **progress)
+
+    async def _dispatch(self) -> None:
+        """
+        Runs the queued jobs one at a time in the worker pool.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            _, _, job = await self._queue.get()
+
+            if job.status != "queued":
+                continue
+
+            job.status = "running"
+            job.started = time()
+            self.emit(job, "running")
+
+            pool: ProcessPoolExecutor = self._pool
+
+            try:
+                job.result = await loop.run_in_executor(pool, TASKS[job.kind], job.id, job.payload)
+
+            # A worker died (e.g. killed or out of memory): the jobs it was running fail, and the pool is replaced
+            # once, so that the next jobs run normally
+            except BrokenProcessPool as exc:
+                job.status = "failed"
+                job.message = f"{type(exc).__name__}: {exc}"
+
+                if self._pool is pool:
+                    self._new_pool(loop)
+                    pool.shutdown(wait=False, cancel_futures=True)
+
+            # Errors of a job are reported to its clients without affecting the service
+            except Exception as exc:  # noqa: BLE001
+                job.status = "failed"
+                job.message = f"{type(exc).__name__}: {exc}"
+            else:
+                job.status = "cancelled" if job.cancel_requested else "done"
+
+            self._finish(job)
+
+    def _job(self, path: str) -> Job:
+        try:
+            return self.jobs[int(path.split("/")[2])]
+        except (ValueError, KeyError):
+            raise _HTTPError(404, f"No job {path}") from None
+
+    def route(self, method: str, path: str, body: bytes) -> tuple[int, object]:
+        """
+        Response status and JSON data of a request, other than event streams.
+        """
+        parts: list[str] = path.strip("/").split("/")
+
+        if method == "GET" and parts == ["health"]:
+            statuses: list[str] = [job.status for job in self.jobs.values()]
+
+            return 200, {
+                "status": "ok",
+                "workers": self.workers,
+                "queued": statuses.count("queued"),
+                "running": statuses.count("running"),
+            }
+
+        if parts == ["jobs"] and method == "GET":
+            return 200, [job.summary() for job in self.jobs.values()]
+
+        if parts == ["jobs"] and method == "POST":
+            try:
+                return 201, self.submit(json.loads(body)).summary()
+            except (ValueError, TypeError, AttributeError) as exc:
+                raise _HTTPError(400, str(exc)) from None
+
+        if len(parts) == 2 and parts[0] == "jobs" and method == "GET":
+            return 200, self._job(path).summary()
+
+        if len(parts) == 2 and parts[0] == "jobs" and method == "DELETE":
+            job: Job = self._job(path)
+            self.cancel(job)
+
+            return 200, job.summary()
+
+        raise _HTTPError(404, f"No route {method} {path}")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves one HTTP request per connection.
+        """
+        try:
+            method, path, _ = (await reader.readline()).decode().split(" ", 2)
+
+            headers: dict[str, str] = {}
+
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode().partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            size: int = int(headers.get("content-length", 0))
+
+            if size > MAX_REQUEST_SIZE:
+                raise _HTTPError(413, f"Request body larger than {MAX_REQUEST_SIZE} bytes")
+
+            body: bytes = await reader.readexactly(size)
+
+            if method == "GET" and path.rstrip("/").endswith("/events"):
+                await self._stream(self._job(path), writer)
+            else:
+                status, data = self.route(method, path, body)
+                _respond(writer, status, data)
+
+        except _HTTPError as exc:
+            _respond(writer, exc.status, {"error": str(exc)})
+        except (ValueError, asyncio.IncompleteReadError):
+            _respond(writer, 400, {"error": "Malformed request"})
+
+        try:
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def _stream(self, job: Job, writer: asyncio.StreamWriter) -> None:
+        """
+        Writes the events of a job as JSON lines until it finishes.
+        """
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nConnection: close\r\n\r\n")
+
+        sent: int = 0
+
+        while True:
+            updated: asyncio.Event = job.updated
+
+            writer.writelines(json.dumps(event).encode() + b"\n" for event in job.events[sent:])
+            sent = len(job.events)
+
+            await writer.drain()
+
+            if job.status in FINISHED:
+                return
+
+            await updated.wait()
+
+
+def _respond(writer: asyncio.StreamWriter, status: int, data: object) -> None:
+    body: bytes = json.dumps(data).encode()
+
+    writer.write(
+        f"HTTP/1.1 {status} {http.client.responses[status]}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+        + body
+    )
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix: str | None = None,
+    workers: int | None = None,
+    retention: int = DEFAULT_RETENTION,
+) -> None:
+    """
+    Runs the calibration service until cancelled.
+
+    Parameters
+    ----------
+    host: str = DEFAULT_HOST
+        Interface to listen on
+
+    port: int = DEFAULT_PORT
+        TCP port, 0 for any free port
+
+    unix: str | None = None
+        Path of a Unix socket to listen on instead of TCP
+
+    workers: int | None = None
+        Number of worker processes, the number of CPUs by default
+
+    retention: int = DEFAULT_RETENTION
+        Number of finished jobs kept by the service
+    """
+    service: CalibrationService = CalibrationService(workers, retention)
+    await service.start()
+
+    if unix is not None:
+        server: asyncio.Server = await asyncio.start_unix_server(service.handle, unix)
+        address: str = f"unix:{unix}"
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+        address = "http://{}:{}".format(*server.sockets[0].getsockname()[:2])
+
+    # Terminating the service shuts the workers down as an interruption does
+    with suppress(NotImplementedError):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+
+    print(f"polymat service listening on {address} with {service.workers} workers", flush=True)
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float | None = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path: str = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+class ServiceClient:
+    """
+    Client of the calibration service, using only the standard library.
+
+    Parameters
+    ----------
+    host: str = DEFAULT_HOST
+        Host of the service
+
+    port: int = DEFAULT_PORT
+        TCP port of the service
+
+    unix: str | None = None
+        Unix socket of the service, instead of host and port
+
+    timeout: float | None = None
+        Socket timeout in seconds
+    """
+
+    def __init__(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix: str | None = None, timeout: float | None = None
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.unix: str | None = unix
+        self.timeout: float | None = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.unix is not None:
+            return _UnixHTTPConnection(self.unix, self.timeout)
+
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _request(self, method: str, path: str, data: object = None) -> object:
+        connection: http.client.HTTPConnection = self._connection()
+
+        try:
+            body: bytes | None = None if data is None else json.dumps(data).encode()
+            connection.request(method, path, body, {"Content-Type": "application/json"})
+
+            response: http.client.HTTPResponse = connection.getresponse()
+            result: object = json.loads(response.read())
+
+            if response.status >= 400:
+                raise RuntimeError(f"{method} {path}: {response.status} {result.get('error')}")
+
+            return result
+        finally:
+            connection.close()
+
+    def health(self) -> dict[str, object]:
+        return self._request("GET", "/health")
+
+    def submit(self, job: dict[str, object]) -> int:
+        """
+        Submits a job, see the description of polymat.scripts.service, and returns its id.
+        """
+        return self._request("POST", "/jobs", job)["id"]
+
+    def status(self, job_id: int) -> dict[str, object]:
+        return self._request("GET", f"/jobs/{job_id}")
+
+    def cancel(self, job_id: int) -> dict[str, object]:
+        return self._request("DELETE", f"/jobs/{job_id}")
+
+    def events(self, job_id: int) -> Iterator[dict[str, object]]:
+        """
+        Events of a job as they happen, until it finishes.
+        """
+        connection: http.client.HTTPConnection = self._connection()
+
+        try:
+            connection.request("GET", f"/jobs/{job_id}/events")
+            response: http.client.HTTPResponse = connection.getresponse()
+
+            if response.status >= 400:
+                raise RuntimeError(f"Events of job {job_id}: {response.status} {json.loads(response.read())['error']}")
+
+            while line := response.readline():
+                yield json.loads(line)
+        finally:
+            connection.close()
+
+    def result(self, job_id: int) -> dict[str, object]:
+        """
+        Waits for a job to finish and returns its summary, with the result if done.
+        """
+        for _ in self.events(job_id):
+            pass
+
+        return self.status(job_id)
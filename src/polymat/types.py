@@ -12,9 +12,22 @@ type Tensor = Annotated[ArrayLike, Literal[3, 3]]
 
 
 # Stress computation function signatures
+# Models accept a single deformation gradient or a stack of shape (N,3,3). Material parameters
+# may be arrays broadcastable against the stack shape to evaluate several parameter sets at once.
 type ElasticModel = Callable[[Tensor, list[float]], Tensor]
 
 type ElasticDeformation = Callable[[ElasticModel, Vector, list[float]], Vector]
 
 # Calibration helep function signatures
-type ErrorMeasure = Callable[[Vector, Vector], float]
+type ErrorMeasure = Callable[[Vector, Vector], float | Vector]
+
+# Derivatives of the stress of an ElasticModel with respect to its parameters, of shape (S,...,3,3)
+type ElasticModelJacobian = Callable[[Tensor, list[float]], Tensor]
+
+# Derivatives of the Cauchy stress of an ElasticModel with respect to the deformation gradient, of shape (...,3,3,3,3)
+type ElasticModelTangent = Callable[[Tensor, list[float]], Tensor]
+
+# Time-dependent models accept a deformation history of shape (N,3,3) and its time points of shape (N,)
+type ViscoelasticModel = Callable[[Tensor, Vector, list[float]], Tensor]
+
+type ViscoelasticDeformation = Callable[[ViscoelasticModel, Vector, Vector, list[float]], Vector]
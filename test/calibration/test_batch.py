@@ -0,0 +1,118 @@
+import os
+from pathlib import Path
+from time import perf_counter, sleep
+
+from numpy import isclose, linspace
+from pytest import mark
+
+from polymat.calibration.batch import CalibrationJob, JobResult, run_batch
+from polymat.materials.time_invariant.ogden import Ogden
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.elastic_deformation import uniaxial_stress
+from polymat.mechanics.incompressible_deformation import uniaxial_stress_incompressible
+from polymat.types import Vector
+
+
+def test_run_batch() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 30)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    ogdenStress: Vector = uniaxial_stress(Ogden, trueStrain, [1.0, 0.2, 2.0, -2.0, 100.0])
+
+    jobs: list[CalibrationJob] = [
+        # Slow compressible calibration, stopped by its time limit
+        CalibrationJob(
+            "ogden",
+            [trueStrain],
+            [ogdenStress],
+            Ogden,
+            [uniaxial_stress],
+            [0.01, 0.01, 0.5, -5.0, 50.0],
+            [5.0, 5.0, 5.0, -0.5, 200.0],
+            timeout=3.0,
+        ),
+        *(
+            CalibrationJob(
+                f"yeoh{i}",
+                [trueStrain],
+                [trueStress],
+                Yeoh,
+                [uniaxial_stress_incompressible],
+                [-1e4, -1e2, -1.0],
+                [1e4, 1e2, 1.0],
+                {"vectorized": True, "seed": i},
+            )
+            for i in range(2)
+        ),
+        # Inconsistent bounds
+        CalibrationJob("bad", [trueStrain], [trueStress], Yeoh, [uniaxial_stress_incompressible], [1.0], [0.0]),
+    ]
+
+    results: list[JobResult] = list(run_batch(jobs, max_workers=2))
+
+    # Quick calibrations are not held up by the slow one
+    assert [r.name for r in results][-1] == "ogden"
+
+    status: dict[str, JobResult] = {r.name: r for r in results}
+
+    assert status["ogden"].status == "timeout"
+    assert status["bad"].status == "failed" and status["bad"].message
+
+    for name in ("yeoh0", "yeoh1"):
+        assert status[name].status == "done"
+        assert all(isclose(status[name].params, test_material, rtol=0.01))
+
+
+def _process_groups() -> set[int]:
+    """
+    Process groups of the live processes of the current session.
+    """
+    groups: set[int] = set()
+
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            fields: list[str] = stat.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+
+        if fields[0] != "Z" and int(fields[3]) == os.getsid(0):
+            groups.add(int(fields[2]))
+
+    return groups
+
+
+@mark.skipif(not Path("/dev/shm").is_dir(), reason="Requires procfs and /dev/shm")
+def test_run_batch_timeout_workers() -> None:
+    trueStrain: Vector = linspace(0.0, 0.5, 30)
+    ogdenStress: Vector = uniaxial_stress(Ogden, trueStrain, [1.0, 0.2, 2.0, -2.0, 100.0])
+
+    groups: set[int] = _process_groups()
+    segments: set[Path] = set(Path("/dev/shm").glob("*"))
+
+    # Slow compressible calibration with its own worker pool, stopped by its time limit
+    job: CalibrationJob = CalibrationJob(
+        "ogden",
+        [trueStrain],
+        [ogdenStress],
+        Ogden,
+        [uniaxial_stress],
+        [0.01, 0.01, 0.5, -5.0, 50.0],
+        [5.0, 5.0, 5.0, -0.5, 200.0],
+        {"workers": 2},
+        timeout=2.0,
+    )
+
+    [result] = run_batch([job])
+
+    assert result.status == "timeout"
+
+    # Neither the workers of the job nor its shared memory block outlive it, the resource tracker of the job
+    # exiting shortly after
+    deadline: float = perf_counter() + 10.0
+
+    while not _process_groups() <= groups and perf_counter() < deadline:
+        sleep(0.1)
+
+    assert _process_groups() <= groups
+    assert set(Path("/dev/shm").glob("*")) <= segments
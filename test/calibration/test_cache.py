@@ -0,0 +1,137 @@
+import json
+import pickle
+from collections.abc import Callable
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+
+from numpy import linspace
+from pytest import MonkeyPatch
+from scipy.optimize import NonlinearConstraint
+
+from polymat.calibration import cache as cache_module
+from polymat.calibration.cache import CalibrationCache
+from polymat.calibration.instrumentation import CalibrationResult
+from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.materials.time_invariant.eight_chain import EightChain
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.incompressible_deformation import uniaxial_stress_incompressible
+from polymat.types import Vector
+
+
+def _put(directory: Path, index: int) -> None:
+    CalibrationCache(directory, max_size=4000).put(f"{index:064x}", [0.0] * 210)
+
+
+def test_calibration_cache(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    strain: Vector = linspace(0.0, 0.5, 10)
+
+    key: str = CalibrationCache.key([strain], Yeoh, [0.0, -1.0], {"seed": 0})
+
+    assert key == CalibrationCache.key([strain.copy()], Yeoh, [0, -1], {"seed": 0})
+    assert key != CalibrationCache.key([strain], Yeoh, [0.0, -1.0], {"seed": 1})
+    assert key != CalibrationCache.key([strain + 1e-12], Yeoh, [0.0, -1.0], {"seed": 0})
+    assert CalibrationCache.key(partial(EightChain, method="cohen")) != CalibrationCache.key(EightChain)
+
+    # Upgrading polymat, numpy or scipy invalidates the keys
+    with monkeypatch.context() as m:
+        m.setattr(cache_module, "_versions", lambda: "numpy=0.0")
+        assert key != CalibrationCache.key([strain], Yeoh, [0.0, -1.0], {"seed": 0})
+
+    cache: CalibrationCache = CalibrationCache(tmp_path / "cache", max_size=4000)
+
+    assert cache.get(key) is None
+
+    cache.put(key, ([1.0, 2.0], 0.5))
+
+    assert cache.get(key) == ([1.0, 2.0], 0.5)
+
+    # Entries are read as data only: a pickle, or a JSON object of an unknown type, is a miss
+    cache._path(key).write_bytes(pickle.dumps(([1.0, 2.0], 0.5)))
+    assert cache.get(key) is None
+
+    cache._path(key).write_text(json.dumps({"__type__": "Popen", "args": "true"}))
+    assert cache.get(key) is None
+
+    cache.put(key, ([1.0, 2.0], 0.5))
+
+    # Concurrent writers of 1050 bytes, the least recently used entries being evicted beyond 4000 bytes
+    with Pool(4) as pool:
+        pool.starmap(_put, [(cache.directory, index) for index in range(12)])
+
+    assert len(cache) == 3
+    assert cache.get(key) is None
+
+
+def test_fit_elastic_material_cache(tmp_path: Path) -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    cache: CalibrationCache = CalibrationCache(tmp_path)
+
+    fit = partial(
+        fit_elastic_material,
+        strain=[trueStrain],
+        stress=[trueStress],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+        vectorized=True,
+        seed=0,
+        cache=cache,
+    )
+
+    result: CalibrationResult = fit(full_output=True)
+    cached: CalibrationResult = fit(full_output=True, callback=lambda generation: True)
+
+    assert (cached.x == result.x).all() and cached.nfev == result.nfev and cached.elapsed == result.elapsed
+    assert len(cached.history) == len(result.history) and (cached.history[-1].x == result.history[-1].x).all()
+    assert cached.timings == result.timings and cached.counts == result.counts
+
+    calibrated_params, calibration_error = fit()
+
+    assert (calibrated_params == result.x).all() and calibration_error == result.fun
+    assert len(cache) == 1
+
+
+def test_fit_elastic_material_cache_lambda_constraints(tmp_path: Path) -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    cache: CalibrationCache = CalibrationCache(tmp_path)
+
+    fit = partial(
+        fit_elastic_material,
+        strain=[trueStrain],
+        stress=[trueStress],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+        seed=0,
+        cache=cache,
+    )
+
+    def upper(c: float) -> Callable[[Vector], float]:
+        return lambda x: x[0] - c
+
+    # Lambdas of one module share their import path, and are told apart by their code and closure
+    results: list[tuple[Vector, float]] = [
+        fit(nonlinear_constraint=NonlinearConstraint(constraint, -1.0, 0.0))
+        for constraint in (
+            lambda x: x[0] - 1.0,
+            lambda x: x[1],
+            upper(1.5),
+            upper(1.0),
+        )
+    ]
+
+    assert len(cache) == 4
+    assert results[0][0][0] <= 1.0 + 1e-6 and results[2][0][0] <= 1.5 + 1e-6
+    assert all(results[0][0] == results[3][0])
+
+    assert CalibrationCache.key(lambda x: x[0] - 1.0) == CalibrationCache.key(lambda x: x[0] - 1.0)
+    assert CalibrationCache.key(lambda x: x[0] - 1.0) != CalibrationCache.key(lambda x: x[0] - 2.0)
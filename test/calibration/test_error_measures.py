@@ -64,3 +64,15 @@ def test_error_nmad_3() -> None:
     err: float = error_nmad(x, p)
 
     assert isclose(err, 9.3, rtol=0.01)
+
+
+def test_error_measures_population() -> None:
+    x = array([0.1, 0.2, 0.3])
+    p = array([[0.15, 0.30, 0.45], [0.11, 0.21, 0.60]])
+
+    for error_measure in (error_nmad, error_rms, error_re):
+        err = error_measure(x, p)
+
+        assert err.shape == (2,)
+
+        assert isclose(err[1], error_measure(x, p[1]))
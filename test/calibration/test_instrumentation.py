@@ -0,0 +1,26 @@
+from time import perf_counter, sleep
+
+from polymat.calibration.instrumentation import Instrumentation
+
+
+def test_instrumentation() -> None:
+    instrumentation: Instrumentation = Instrumentation()
+
+    inner = instrumentation.wrap("inner", sleep)
+
+    start: float = perf_counter()
+
+    with instrumentation.timer("outer"):
+        inner(0.02)
+        inner(0.02)
+        sleep(0.01)
+
+    elapsed: float = perf_counter() - start
+
+    assert instrumentation.counts == {"outer": 1, "inner": 2}
+
+    # Time spent in the nested stage is not reported under the outer stage: the exclusive timings add up to the
+    # wall time, whatever the load of the machine
+    assert instrumentation.timings["inner"] >= 0.04
+    assert instrumentation.timings["outer"] >= 0.01
+    assert instrumentation.timings["inner"] + instrumentation.timings["outer"] <= elapsed
@@ -0,0 +1,22 @@
+from numpy import array, isclose
+
+from polymat.calibration.error_measures import error_re
+from polymat.calibration.fitness_functions import fitness_elastic
+from polymat.calibration.parallel import FitnessPool, SharedFitness
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.incompressible_deformation import uniaxial_stress_incompressible
+from polymat.types import Vector
+
+
+def test_shared_fitness() -> None:
+    strain: list[Vector] = [array([0.0, 0.1, 0.2, 0.3])]
+    stress: list[Vector] = [array([0.0, 0.6, 1.3, 2.1])]
+    params: list[Vector] = [array([1.0, -0.01, 1e-4]), array([0.9, -0.01, 1e-4])]
+
+    fitness: SharedFitness = SharedFitness(Yeoh, [uniaxial_stress_incompressible], error_re)
+
+    with FitnessPool(2, strain, stress) as pool:
+        errors: list[float] = pool.map(fitness, params)
+
+    for err, _params in zip(errors, params):
+        assert isclose(err, fitness_elastic(_params, strain, stress, Yeoh, [uniaxial_stress_incompressible], error_re))
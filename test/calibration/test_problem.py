@@ -0,0 +1,73 @@
+from numpy import allclose, array, isclose, linspace
+
+from polymat.calibration.error_measures import error_re
+from polymat.calibration.fitness_functions import fitness_elastic
+from polymat.calibration.instrumentation import CalibrationResult
+from polymat.calibration.problem import CalibrationProblem, MultiFidelityProblem
+from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.elastic_deformation import uniaxial_stress
+from polymat.mechanics.incompressible_deformation import planar_stress_incompressible, uniaxial_stress_incompressible
+from polymat.types import Vector
+
+
+def test_calibration_problem() -> None:
+    strain: list[Vector] = [linspace(0.0, 0.5, 10), linspace(0.0, 0.5, 10)]
+    stress: list[Vector] = [
+        array([0.01, 0.35, 0.69, 1.09, 1.48, 1.92, 2.41, 2.91, 3.44, 4.05]),
+        array([0.01, 0.30, 0.62, 0.98, 1.30, 1.71, 2.20, 2.70, 3.15, 3.70]),
+    ]
+    deformation_mode = [planar_stress_incompressible, uniaxial_stress]
+
+    problem: CalibrationProblem = CalibrationProblem(strain, stress, Yeoh, deformation_mode, error_re)
+
+    assert problem.kinematics[0] is not None and problem.kinematics[1] is None
+
+    params: list[float] = [1.0, -0.01, 1e-4, 100.0]
+
+    err: float = problem.fitness(params)
+
+    assert isclose(err, fitness_elastic(params, strain, stress, Yeoh, deformation_mode, error_re))
+
+
+def test_multi_fidelity_problem() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4, 200.0]
+    strain: list[Vector] = [linspace(0.0, 0.5, 500)]
+    stress: list[Vector] = [uniaxial_stress(Yeoh, strain[0], test_material)]
+
+    problem: MultiFidelityProblem = MultiFidelityProblem(strain, stress, Yeoh, [uniaxial_stress], window=4)
+
+    assert [len(level.strain[0]) for level in problem.levels] == [32, 63, 125, 250]
+
+    population: Vector = array([[2.0, 1.0, 5.0, 2.1], [-0.016, 0.0, 0.1, -0.01], [3e-4, 0.0, 0.0, 0.0], [200.0] * 4])
+
+    # The first window is scored on the full curves
+    assert allclose(problem.fitness(population), problem.full.fitness(population))
+
+    fitness: Vector = problem.fitness(population)
+    promising: Vector = fitness == problem.full.fitness(population)
+
+    assert promising[0] and not promising[2]
+    assert isclose(problem.best, 0.0, atol=1e-6)
+
+
+def test_fit_elastic_material_multi_fidelity() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    strain: Vector = linspace(0.0, 0.5, 2000)
+    stress: Vector = uniaxial_stress_incompressible(Yeoh, strain, test_material)
+
+    result: CalibrationResult = fit_elastic_material(
+        strain=[strain],
+        stress=[stress],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+        vectorized=True,
+        seed=0,
+        full_output=True,
+        multi_fidelity=True,
+    )
+
+    assert allclose(result.x, test_material, rtol=0.01)
+    assert isclose(result.fun, CalibrationProblem([strain], [stress], Yeoh, [uniaxial_stress_incompressible])(result.x))
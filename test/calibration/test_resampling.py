@@ -0,0 +1,67 @@
+from numpy import argmax, isclose, linspace, r_
+from numpy.random import default_rng
+
+from polymat.calibration.instrumentation import CalibrationResult
+from polymat.calibration.resampling import resample_curve, resample_curves, resampling_report
+from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.incompressible_deformation import uniaxial_stress_incompressible
+from polymat.types import Vector
+
+
+def test_resample_curve() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    loading: Vector = linspace(0.0, 0.5, 20000)
+
+    # Loading-unloading curve with measurement noise, unloaded down to a residual strain
+    trueStrain: Vector = r_[loading, loading[:3999:-1]]
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, loading, test_material)
+    trueStress = r_[trueStress, 0.8 * trueStress[:3999:-1]] * (1.0 + 0.01 * default_rng(0).standard_normal(36000))
+
+    indices: Vector = resample_curve(trueStrain, trueStress, 200)
+
+    assert len(indices) <= 205
+    assert indices[0] == 0 and indices[-1] == 35999
+    assert argmax(trueStress) in indices
+
+    reduced_strain, reduced_stress = resample_curves([trueStrain], [trueStress], 200)
+
+    assert (reduced_stress[0] == trueStress[indices]).all()
+
+    report = resampling_report(
+        [[2.0, 1.0], [-0.016, 0.0], [3e-4, 0.0]],
+        [trueStrain],
+        [trueStress],
+        reduced_strain,
+        reduced_stress,
+        Yeoh,
+        [uniaxial_stress_incompressible],
+    )
+
+    print(f"{report=}")
+
+    assert report.reduction > 170
+    assert report.difference < 1.0
+
+
+def test_fit_elastic_material_max_points() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 10000)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    result: CalibrationResult = fit_elastic_material(
+        strain=[trueStrain],
+        stress=[trueStress],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+        vectorized=True,
+        seed=0,
+        full_output=True,
+        max_points=50,
+    )
+
+    assert all(isclose(result.x, test_material, rtol=0.01))
+    assert result.resampling.reduced_points == [50]
+    assert isclose(result.fun, result.resampling.full_fitness)
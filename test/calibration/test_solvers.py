@@ -1,6 +1,16 @@
-from numpy import isclose, linspace
+from functools import partial
 
+from numpy import inf, isclose, isfinite, linspace, zeros
+from numpy.random import Generator, default_rng
+from pytest import raises
+from scipy.optimize import LinearConstraint
+
+from polymat.calibration.instrumentation import CalibrationResult, Generation
 from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.calibration.solvers.linear_fit import fit_linear_elastic_material, is_parameter_linear
+from polymat.calibration.solvers.local_fit import refine_elastic_material
+from polymat.materials.time_invariant.eight_chain import EightChain
+from polymat.materials.time_invariant.mooney import Mooney5
 from polymat.materials.time_invariant.yeoh import Yeoh
 from polymat.mechanics.incompressible_deformation import uniaxial_stress_incompressible
 from polymat.types import Vector
@@ -24,3 +34,225 @@ def test_fit_elastic_material() -> None:
     print(f"{calibration_error=}")
 
     assert all(isclose(calibrated_params, test_material, rtol=0.01))
+
+
+def test_fit_elastic_material_vectorized() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    calibrated_params, _calibration_error = fit_elastic_material(
+        strain=[trueStrain],
+        stress=[trueStress],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+        vectorized=True,
+    )
+
+    assert all(isclose(calibrated_params, test_material, rtol=0.01))
+
+
+def test_fit_elastic_material_workers() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    results: list[tuple[Vector, float]] = [
+        fit_elastic_material(
+            strain=[trueStrain],
+            stress=[trueStress],
+            elastic_model=Yeoh,
+            deformation_mode=[uniaxial_stress_incompressible],
+            lower_bound=[-1e4, -1e2, -1.0],
+            upper_bound=[1e4, 1e2, 1.0],
+            workers=workers,
+            seed=7,
+        )
+        for workers in (None, 1, 2)
+    ]
+
+    # A seeded search gives the same result serially and in parallel
+    assert all(results[0][0] == results[1][0])
+    assert all(results[0][0] == results[2][0])
+    assert results[0][1] == results[2][1]
+
+    assert all(isclose(results[1][0], test_material, rtol=0.01))
+
+
+def test_fit_linear_elastic_material() -> None:
+    test_material: list[float] = [0.175, 0.01, 1e-3, -1.35e-3, 3.9e-5]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Mooney5, trueStrain, test_material)
+
+    calibrated_params, calibration_error = fit_linear_elastic_material(
+        strain=[trueStrain],
+        stress=[trueStress],
+        elastic_model=Mooney5,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e4, -1e2, -1e2, -1.0],
+        upper_bound=[1e4, 1e4, 1e2, 1e2, 1.0],
+    )
+
+    assert isclose(calibration_error, 0.0, atol=1e-6)
+
+    assert all(isclose(uniaxial_stress_incompressible(Mooney5, trueStrain, calibrated_params), trueStress))
+
+
+def test_is_parameter_linear() -> None:
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+
+    assert is_parameter_linear([trueStrain], Yeoh, [uniaxial_stress_incompressible], 3)
+
+    assert not is_parameter_linear([trueStrain], EightChain, [uniaxial_stress_incompressible], 2)
+
+
+def test_fit_linear_elastic_material_invalid() -> None:
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+
+    # Nonlinear models are rejected, including models customized with functools.partial
+    with raises(ValueError, match="not linear"):
+        fit_linear_elastic_material(
+            strain=[trueStrain],
+            stress=[trueStrain],
+            elastic_model=partial(EightChain, method="newton"),
+            deformation_mode=[uniaxial_stress_incompressible],
+            lower_bound=[0.0, 1.1],
+            upper_bound=[10.0, 10.0],
+        )
+
+    # A curve of zero stress is fitted with unit weights
+    calibrated_params, _calibration_error = fit_linear_elastic_material(
+        strain=[trueStrain],
+        stress=[zeros(50)],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+    )
+
+    assert all(isfinite(calibrated_params))
+    assert all(isclose(calibrated_params, 0.0, atol=1e-9))
+
+
+def test_fit_elastic_material_refine() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    calibrated_params, _calibration_error = fit_elastic_material(
+        strain=[trueStrain],
+        stress=[trueStress],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+        vectorized=True,
+        refine=True,
+    )
+
+    assert all(isclose(calibrated_params, test_material, rtol=0.01))
+
+
+def test_fit_elastic_material_refine_constrained() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    # Active constraint excluding the unconstrained optimum, which the bounded refinement would otherwise reach
+    calibrated_params, _calibration_error = fit_elastic_material(
+        strain=[trueStrain],
+        stress=[trueStress],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+        linear_constraint=LinearConstraint([[1.0, 0.0, 0.0]], -inf, 1.9),
+        vectorized=True,
+        seed=0,
+        refine=True,
+    )
+
+    assert calibrated_params[0] <= 1.9
+
+
+def test_fit_elastic_material_refine_noisy() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    # Noisy curve with an outlier, on which least squares and error_re optima differ
+    rng: Generator = default_rng(0)
+    noisyStress: Vector = trueStress * (1.0 + 0.02 * rng.standard_normal(50))
+    noisyStress[30] *= 1.5
+
+    results: list[CalibrationResult] = [
+        fit_elastic_material(
+            strain=[trueStrain],
+            stress=[noisyStress],
+            elastic_model=Yeoh,
+            deformation_mode=[uniaxial_stress_incompressible],
+            lower_bound=[-1e4, -1e2, -1.0],
+            upper_bound=[1e4, 1e2, 1.0],
+            vectorized=True,
+            seed=0,
+            full_output=True,
+            refine=refine,
+        )
+        for refine in (False, True)
+    ]
+
+    # The refinement never worsens the coarse search, and saves most model evaluations of a full search
+    assert results[1].fun <= results[1].history[-1].best_fitness
+    assert results[1].nfev < results[0].nfev / 10
+    assert isclose(results[1].fun, results[0].fun, rtol=0.1)
+
+
+def test_refine_elastic_material_partial() -> None:
+    test_material: list[float] = [1.0, 3.0]
+    trueStrain: Vector = linspace(0.0, 0.8, 50)
+
+    # Model customized with functools.partial, whose parameter derivatives get the same arguments
+    model = partial(EightChain, method="newton")
+    trueStress: Vector = uniaxial_stress_incompressible(model, trueStrain, test_material)
+
+    calibrated_params, calibration_error = refine_elastic_material(
+        [1.2, 2.5], [trueStrain], [trueStress], model, [uniaxial_stress_incompressible], [0.1, 1.5], [10.0, 10.0]
+    )
+
+    assert all(isclose(calibrated_params, test_material, rtol=1e-6))
+    assert calibration_error < 1e-6
+
+
+def test_fit_elastic_material_full_output() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    generations: list[Generation] = []
+
+    def stop_after_ten(generation: Generation) -> bool:
+        generations.append(generation)
+        return generation.nit >= 10
+
+    result: CalibrationResult = fit_elastic_material(
+        strain=[trueStrain],
+        stress=[trueStress],
+        elastic_model=Yeoh,
+        deformation_mode=[uniaxial_stress_incompressible],
+        lower_bound=[-1e4, -1e2, -1.0],
+        upper_bound=[1e4, 1e2, 1.0],
+        vectorized=True,
+        seed=0,
+        callback=stop_after_ten,
+        full_output=True,
+    )
+
+    assert result.nit == 10 and len(generations) == 10 and result.history == generations
+
+    assert result.counts["model"] == result.counts["error_measure"] == result.counts["fitness"]
+
+    assert result.nfev == result.counts["parameter_sets"] > result.counts["fitness"]
+
+    assert set(result.timings) == {"kinematics", "model", "error_measure", "fitness"}
@@ -0,0 +1,101 @@
+import numpy as np
+
+from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.calibration.solvers.local_fit import refine_elastic_material
+from polymat.calibration.uncertainty import UncertaintyResult, bootstrap_elastic_material, profile_elastic_material
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.incompressible_deformation import biaxial_stress_incompressible, uniaxial_stress_incompressible
+from polymat.types import ElasticDeformation, Vector
+
+TEST_MATERIAL: list[float] = [1.0, -0.01, 1e-3]
+
+LOWER_BOUND: list[float] = [0.1, -1.0, -1.0]
+UPPER_BOUND: list[float] = [10.0, 1.0, 1.0]
+
+
+def _noisy_curves() -> tuple[list[Vector], list[Vector], list[ElasticDeformation], Vector]:
+    rng = np.random.default_rng(1)
+
+    strain: list[Vector] = [np.linspace(0.0, 0.8, 60), np.linspace(0.0, 0.5, 40)]
+    deformation_mode: list[ElasticDeformation] = [uniaxial_stress_incompressible, biaxial_stress_incompressible]
+
+    stress: list[Vector] = [
+        mode(Yeoh, e, TEST_MATERIAL) * (1.0 + 0.02 * rng.standard_normal(len(e)))
+        for mode, e in zip(deformation_mode, strain)
+    ]
+
+    params, _ = refine_elastic_material(TEST_MATERIAL, strain, stress, Yeoh, deformation_mode, LOWER_BOUND, UPPER_BOUND)
+
+    return strain, stress, deformation_mode, params
+
+
+def test_bootstrap_elastic_material() -> None:
+    strain, stress, deformation_mode, params = _noisy_curves()
+
+    results: list[UncertaintyResult] = [
+        bootstrap_elastic_material(
+            params,
+            strain,
+            stress,
+            Yeoh,
+            deformation_mode,
+            LOWER_BOUND,
+            UPPER_BOUND,
+            replicates=50,
+            resampling=resampling,
+            seed=0,
+            workers=workers,
+        )
+        for resampling, workers in (("residuals", None), ("residuals", 2), ("cases", None))
+    ]
+
+    for result in results:
+        assert result.failures == 0
+        assert result.samples.shape == (50, 3)
+        assert result.covariance.shape == (3, 3)
+        assert np.all(result.lower < params) and np.all(params < result.upper)
+        assert np.all(result.lower < TEST_MATERIAL) and np.all(TEST_MATERIAL < result.upper)
+
+    # The replicates do not depend on the number of workers
+    assert np.array_equal(results[0].samples, results[1].samples)
+
+
+def test_profile_elastic_material() -> None:
+    strain, stress, deformation_mode, params = _noisy_curves()
+
+    result: UncertaintyResult = profile_elastic_material(
+        params, strain, stress, Yeoh, deformation_mode, LOWER_BOUND, UPPER_BOUND
+    )
+
+    assert result.grid.shape == result.statistic.shape == (3, 17)
+    assert np.allclose(result.statistic[:, 8], 0.0)
+    assert np.all(result.lower < params) and np.all(params < result.upper)
+    assert np.all(result.lower < TEST_MATERIAL) and np.all(TEST_MATERIAL < result.upper)
+
+    # Nearly linear in the parameters: the profile intervals match the asymptotic ones
+    assert np.allclose(result.upper - result.lower, 2.0 * 1.96 * result.standard_error, rtol=0.1)
+
+
+def test_profile_elastic_material_from_search() -> None:
+    strain, stress, deformation_mode, params = _noisy_curves()
+
+    # error_re optimum of a global search, away from the least squares optimum of the refits
+    searched, _ = fit_elastic_material(
+        strain, stress, Yeoh, deformation_mode, LOWER_BOUND, UPPER_BOUND, vectorized=True, seed=0
+    )
+
+    result: UncertaintyResult = profile_elastic_material(
+        searched, strain, stress, Yeoh, deformation_mode, LOWER_BOUND, UPPER_BOUND
+    )
+
+    # The profiles are centered on the least squares optimum, the minimum of every profile
+    assert np.allclose(result.x, params, rtol=1e-4)
+    assert np.all(result.statistic > -1e-6)
+    assert np.all(np.argmin(result.statistic, axis=1) == 8)
+
+    reference: UncertaintyResult = profile_elastic_material(
+        params, strain, stress, Yeoh, deformation_mode, LOWER_BOUND, UPPER_BOUND
+    )
+
+    assert np.allclose(result.lower, reference.lower, rtol=1e-3)
+    assert np.allclose(result.upper, reference.upper, rtol=1e-3)
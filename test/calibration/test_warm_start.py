@@ -0,0 +1,69 @@
+from numpy import allclose, isclose, linspace
+
+from polymat.calibration.instrumentation import CalibrationResult
+from polymat.calibration.solvers.elastic_fit import fit_elastic_material
+from polymat.calibration.warm_start import initial_population, initial_shear_modulus, shear_modulus_guess
+from polymat.materials.time_invariant.ogden import Ogden2
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.elastic_deformation import uniaxial_stress
+from polymat.mechanics.incompressible_deformation import planar_stress_incompressible, uniaxial_stress_incompressible
+from polymat.types import Vector
+
+
+def test_initial_shear_modulus() -> None:
+    strain: Vector = linspace(0.0, 0.5, 100)
+
+    mu: float = initial_shear_modulus(
+        [strain, strain, strain],
+        [
+            uniaxial_stress_incompressible(Yeoh, strain, [2.0, -0.016, 3e-4]),
+            planar_stress_incompressible(Yeoh, strain, [2.0, -0.016, 3e-4]),
+            uniaxial_stress(Yeoh, strain, [2.0, -0.016, 3e-4, 1000.0]),
+        ],
+        [uniaxial_stress_incompressible, planar_stress_incompressible, uniaxial_stress],
+    )
+
+    assert isclose(mu, 4.0, rtol=0.05)
+
+    assert allclose(shear_modulus_guess(Yeoh, 4.0, [0.0, -1.0, -1.0, 100.0], [10.0, 1.0, 1.0, 300.0]), [2, 0, 0, 200])
+
+    ogden: Vector = shear_modulus_guess(Ogden2, 4.0, [0.0, 0.0, 1.0, 3.0], [10.0, 10.0, 3.0, 5.0])
+
+    assert isclose((ogden[:2] * ogden[2:]).sum() / 2.0, 4.0)
+
+
+def test_initial_population() -> None:
+    population: Vector = initial_population([0.0, -1.0], [10.0, 1.0], [[2.0, 0.1], [20.0, 0.0]], 40, rng=0)
+
+    assert population.shape == (40, 2)
+    assert allclose(population[:2], [[2.0, 0.1], [10.0, 0.0]])
+    assert (population >= [0.0, -1.0]).all() and (population <= [10.0, 1.0]).all()
+
+
+def test_fit_elastic_material_warm_start() -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 50)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    results: list[CalibrationResult] = [
+        fit_elastic_material(
+            strain=[trueStrain],
+            stress=[trueStress],
+            elastic_model=Yeoh,
+            deformation_mode=[uniaxial_stress_incompressible],
+            lower_bound=[-1e4, -1e2, -1.0],
+            upper_bound=[1e4, 1e2, 1.0],
+            vectorized=True,
+            seed=0,
+            full_output=True,
+            **options,
+        )
+        for options in ({}, {"estimate_shear_modulus": True}, {"guesses": [[2.1, -0.02, 4e-4]]})
+    ]
+
+    print(f"{[result.nit for result in results]=}")
+
+    for result in results:
+        assert allclose(result.x, test_material, rtol=0.01)
+
+    assert results[1].nit < results[0].nit and results[2].nit < results[0].nit
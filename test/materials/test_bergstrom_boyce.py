@@ -0,0 +1,65 @@
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from polymat.materials.time_dependent.bergstrom_boyce import (
+    BergstromBoyce,
+    bergstrom_boyce_flow,
+    bergstrom_boyce_viscous_stretch,
+)
+from polymat.materials.time_invariant.eight_chain import EightChain
+from polymat.mechanics.incompressible_deformation import uniaxial_stretch_incompressible
+from polymat.types import Tensor, Vector
+
+TEST_MAT: list[float] = [1.0, 3.0, 100.0, 2.0, 0.05, -0.5, 1.0, 4.0]
+
+
+def test_bergstrom_boyce_flow_reference() -> None:
+    time: Vector = np.linspace(0.0, 20.0, 401)
+    F: Tensor = uniaxial_stretch_incompressible(0.5 * np.sin(np.pi * time / 10.0))
+
+    Fv, steps = bergstrom_boyce_viscous_stretch(F, time, np.array(TEST_MAT)[:, None], full_output=True)
+
+    def rhs(t: float, y: Vector) -> Vector:
+        _F: Tensor = np.array([np.interp(t, time, f) for f in F.reshape(-1, 9).T]).reshape(1, 3, 3)
+        return bergstrom_boyce_flow(_F, y.reshape(1, 3, 3), np.array(TEST_MAT)[:, None]).ravel()
+
+    sol = solve_ivp(rhs, (0.0, 20.0), np.eye(3).ravel(), t_eval=time, rtol=1e-10, atol=1e-12, max_step=0.05)
+
+    assert np.allclose(Fv[0], sol.y.T.reshape(-1, 3, 3), atol=1e-4)
+    assert np.allclose(np.linalg.det(Fv[0]), 1.0, atol=1e-4)
+    assert steps[0] < len(time)
+
+
+def test_bergstrom_boyce_limits() -> None:
+    time: Vector = np.r_[0.0, np.geomspace(1e-6, 1e3, 200)]
+    F: Tensor = np.broadcast_to(uniaxial_stretch_incompressible(np.array([0.3])), (len(time), 3, 3))
+
+    # Linear flow: a step strain held constant relaxes from both networks to network A
+    test_mat: list[float] = [1.0, 3.0, 100.0, 2.0, 0.05, 0.0, 1.0, 1.0]
+
+    Stress: Tensor = BergstromBoyce(F, time, test_mat)
+
+    assert np.allclose(Stress[0], EightChain(F[0], [3.0, 3.0, 100.0]))
+    assert np.allclose(Stress[-1], EightChain(F[0], test_mat[:3]), atol=1e-6)
+    assert np.all(np.diff(Stress[:, 0, 0]) <= 1e-4)
+
+    # Slow flow steps over most of the history
+    _, steps = bergstrom_boyce_viscous_stretch(F, time, np.array(test_mat)[:, None], full_output=True)
+
+    assert steps[0] < len(time) / 2
+
+
+def test_bergstrom_boyce_population() -> None:
+    test_mats: Vector = np.tile(np.array(TEST_MAT)[:, None], 3)
+    test_mats[6] = [0.5, 1.0, 2.0]
+    test_mats[7] = [2.0, 4.0, 6.0]
+
+    time: Vector = np.linspace(0.0, 10.0, 101)
+    F: Tensor = uniaxial_stretch_incompressible(0.4 * np.sin(np.pi * time / 5.0))
+
+    Stress: Tensor = BergstromBoyce(F, time, test_mats[:, :, None])
+
+    assert Stress.shape == (3, 101, 3, 3)
+
+    for i in range(3):
+        assert np.allclose(Stress[i], BergstromBoyce(F, time, test_mats[:, i]), atol=1e-6)
@@ -1,7 +1,13 @@
 import numpy as np
 
-from polymat.materials.time_invariant.eight_chain import EightChain
-from polymat.types import Tensor
+from polymat.materials.time_invariant.eight_chain import (
+    INVERSE_LANGEVIN,
+    EightChain,
+    dEightChain_dF,
+    dEightChain_dparams,
+    invLangevin,
+)
+from polymat.types import Tensor, Vector
 
 
 def test_ec_zero_strain() -> None:
@@ -25,3 +31,66 @@ def test_ec_uniaxial_stress() -> None:
     Stress: Tensor = EightChain(F, test_mat)
 
     assert np.isclose(Stress[0, 0], 3.25, rtol=0.01)
+
+
+def test_ec_batch() -> None:
+    test_mat: list[float] = [1.0, 3.0, 100.0]
+
+    F: Tensor = np.array([np.diag([lam, 1.0 / np.sqrt(lam), 1.0 / np.sqrt(lam)]) for lam in (1.0, 1.5, 2.0)])
+
+    Stress: Tensor = EightChain(F, test_mat)
+
+    assert Stress.shape == (3, 3, 3)
+
+    assert np.allclose(Stress, [EightChain(_F, test_mat) for _F in F])
+
+
+def test_ec_dparams() -> None:
+    test_mat: Vector = np.array([1.0, 3.0, 100.0])
+
+    F: Tensor = np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]])
+
+    dStress: Tensor = dEightChain_dparams(F, test_mat)
+
+    for i, h in enumerate(1e-6 * test_mat):
+        dp: Vector = np.eye(len(test_mat))[i] * h
+        fd: Tensor = (EightChain(F, test_mat + dp) - EightChain(F, test_mat - dp)) / (2 * h)
+
+        assert np.allclose(dStress[i], fd, atol=1e-6)
+
+
+def test_inverse_langevin_methods() -> None:
+    x: Vector = np.linspace(-0.99, 0.99, 198)
+
+    y: Vector = invLangevin(x, "newton")
+
+    assert np.allclose(1.0 / np.tanh(y) - 1.0 / y, x, atol=1e-12)
+
+    tolerance: dict[str, float] = {"bergstrom": 1e-3, "cohen": 5e-2, "jedynak": 2e-2, "rational": 2e-3, "newton": 1e-10}
+
+    F: Tensor = np.diag([1.5, 1.0 / np.sqrt(1.5), 1.0 / np.sqrt(1.5)])
+    test_mat: Vector = np.array([1.0, 3.0, 100.0])
+    dp: Vector = np.array([0.0, 1e-6, 0.0])
+
+    for method in INVERSE_LANGEVIN:
+        assert np.allclose(invLangevin(x, method), y, rtol=tolerance[method], atol=0.0)
+
+        dStress: Tensor = dEightChain_dparams(F, test_mat, method)
+        fd: Tensor = (EightChain(F, test_mat + dp, method) - EightChain(F, test_mat - dp, method)) / (2 * dp[1])
+
+        assert np.allclose(dStress[1], fd, atol=1e-6)
+
+
+def test_ec_dF() -> None:
+    test_mat: Vector = np.array([1.0, 3.0, 100.0])
+
+    F: Tensor = np.array([np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]]), np.diag([1.3, 0.9, 0.9])])
+
+    dStress: Tensor = dEightChain_dF(F, test_mat)
+
+    for k, l in np.ndindex(3, 3):
+        dF: Tensor = np.zeros((3, 3))
+        dF[k, l] = 1e-6
+        fd: Tensor = (EightChain(F + dF, test_mat) - EightChain(F - dF, test_mat)) / 2e-6
+
+        assert np.allclose(dStress[..., k, l], fd, atol=1e-6)
@@ -1,6 +1,6 @@
 import numpy as np
 
-from polymat.materials.time_invariant.mooney import Mooney5
+from polymat.materials.time_invariant.mooney import Mooney5, dMooney5_dF, dMooney5_dparams
 from polymat.mechanics.elastic_deformation import uniaxial_stress
 from polymat.types import Tensor, Vector
 
@@ -23,3 +23,44 @@ def test_mooney_uniaxial_stress() -> None:
     trueStress: Vector = uniaxial_stress(Mooney5, trueStrain, test_mat)
 
     assert np.isclose(trueStress[-1], 29.02, rtol=0.02)
+
+
+def test_mooney_batch() -> None:
+    test_mat: list[float] = [0.175, 0.01, 1e-3, -1.35e-3, 3.9e-5, 1e3]
+
+    F: Tensor = np.array([np.diag([lam, 1.0 / np.sqrt(lam), 1.0 / np.sqrt(lam)]) for lam in (1.0, 1.5, 2.0)])
+
+    Stress: Tensor = Mooney5(F, test_mat)
+
+    assert Stress.shape == (3, 3, 3)
+
+    assert np.allclose(Stress, [Mooney5(_F, test_mat) for _F in F])
+
+
+def test_mooney_dparams() -> None:
+    test_mat: Vector = np.array([0.175, 0.01, 1e-3, -1.35e-3, 3.9e-5, 1e3])
+
+    F: Tensor = np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]])
+
+    dStress: Tensor = dMooney5_dparams(F, test_mat)
+
+    for i in range(len(test_mat)):
+        dp: Vector = np.eye(len(test_mat))[i] * 1e-4
+        fd: Tensor = (Mooney5(F, test_mat + dp) - Mooney5(F, test_mat - dp)) / 2e-4
+
+        assert np.allclose(dStress[i], fd, atol=1e-6)
+
+
+def test_mooney_dF() -> None:
+    test_mat: Vector = np.array([1.0, 0.2, 0.01, 0.001, 0.0005, 100.0])
+
+    F: Tensor = np.array([np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]]), np.diag([1.3, 0.9, 0.9])])
+
+    dStress: Tensor = dMooney5_dF(F, test_mat)
+
+    for k, l in np.ndindex(3, 3):
+        dF: Tensor = np.zeros((3, 3))
+        dF[k, l] = 1e-6
+        fd: Tensor = (Mooney5(F + dF, test_mat) - Mooney5(F - dF, test_mat)) / 2e-6
+
+        assert np.allclose(dStress[..., k, l], fd, atol=1e-6)
@@ -1,6 +1,6 @@
 import numpy as np
 
-from polymat.materials.time_invariant.neo_hook import NeoHook
+from polymat.materials.time_invariant.neo_hook import NeoHook, dNeoHook_dF, dNeoHook_dparams
 from polymat.mechanics.elastic_deformation import uniaxial_stress
 from polymat.types import Tensor, Vector
 
@@ -23,3 +23,44 @@ def test_neo_hook_uniaxial_stress() -> None:
     trueStress: Vector = uniaxial_stress(NeoHook, trueStrain, test_mat)
 
     assert np.isclose(trueStress[-1], 29.02, rtol=0.02)
+
+
+def test_neo_hook_batch() -> None:
+    test_mat: list[float] = [1.0, 100.0]
+
+    F: Tensor = np.array([np.diag([lam, 1.0 / np.sqrt(lam), 1.0 / np.sqrt(lam)]) for lam in (1.0, 1.5, 2.0)])
+
+    Stress: Tensor = NeoHook(F, test_mat)
+
+    assert Stress.shape == (3, 3, 3)
+
+    assert np.allclose(Stress, [NeoHook(_F, test_mat) for _F in F])
+
+
+def test_neo_hook_dparams() -> None:
+    test_mat: Vector = np.array([1.0, 100.0])
+
+    F: Tensor = np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]])
+
+    dStress: Tensor = dNeoHook_dparams(F, test_mat)
+
+    for i, h in enumerate(1e-6 * test_mat):
+        dp: Vector = np.eye(len(test_mat))[i] * h
+        fd: Tensor = (NeoHook(F, test_mat + dp) - NeoHook(F, test_mat - dp)) / (2 * h)
+
+        assert np.allclose(dStress[i], fd, atol=1e-6)
+
+
+def test_neo_hook_dF() -> None:
+    test_mat: Vector = np.array([1.0, 100.0])
+
+    F: Tensor = np.array([np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]]), np.diag([1.3, 0.9, 0.9])])
+
+    dStress: Tensor = dNeoHook_dF(F, test_mat)
+
+    for k, l in np.ndindex(3, 3):
+        dF: Tensor = np.zeros((3, 3))
+        dF[k, l] = 1e-6
+        fd: Tensor = (NeoHook(F + dF, test_mat) - NeoHook(F - dF, test_mat)) / 2e-6
+
+        assert np.allclose(dStress[..., k, l], fd, atol=1e-6)
@@ -1,6 +1,15 @@
 import numpy as np
 
-from polymat.materials.time_invariant.ogden import Ogden, Ogden2
+from polymat.materials.time_invariant.ogden import (
+    Ogden,
+    Ogden2,
+    dOgden2_dF,
+    dOgden2_dparams,
+    dOgden_dF,
+    dOgden_dparams,
+    ogden2_principal_stress,
+    ogden_principal_stress,
+)
 from polymat.mechanics.elastic_deformation import uniaxial_stress
 from polymat.types import Tensor, Vector
 
@@ -33,3 +42,71 @@ def test_ogden_marc_zero_strain() -> None:
     Stress: Tensor = Ogden2(F, test_mat)
 
     assert np.isclose(Stress[0, 0], 0.0)
+
+
+def test_ogden_batch() -> None:
+    test_mat: list[float] = [1.0, 2.0, 1.1, 0.4, 100.0]
+
+    F: Tensor = np.array([[[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.0]], np.diag([1.5, 0.8, 0.8]), np.eye(3)])
+
+    for model in (Ogden, Ogden2):
+        Stress: Tensor = model(F, test_mat)
+
+        assert Stress.shape == (3, 3, 3)
+
+        assert np.allclose(Stress, [model(_F, test_mat) for _F in F])
+
+
+def test_ogden_dparams() -> None:
+    test_mat: Vector = np.array([1.0, 2.0, 1.1, 0.4, 100.0])
+
+    F: Tensor = np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]])
+
+    for model, model_jacobian in ((Ogden, dOgden_dparams), (Ogden2, dOgden2_dparams)):
+        dStress: Tensor = model_jacobian(F, test_mat)
+
+        for i, h in enumerate(1e-6 * test_mat):
+            dp: Vector = np.eye(len(test_mat))[i] * h
+            fd: Tensor = (model(F, test_mat + dp) - model(F, test_mat - dp)) / (2 * h)
+
+            assert np.allclose(dStress[i], fd, atol=1e-6)
+
+
+def test_ogden_principal_stress() -> None:
+    test_mat: Vector = np.array([1.0, 0.2, 2.0, -2.0, 100.0])
+
+    lam: Vector = np.array([1.3, 0.9, 0.85])
+
+    # Rotated loading, evaluated through the eigen-decomposition of b
+    c, s = np.cos(0.3), np.sin(0.3)
+    R: Tensor = np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+
+    for model, principal_stress, model_jacobian in (
+        (Ogden, ogden_principal_stress, dOgden_dparams),
+        (Ogden2, ogden2_principal_stress, dOgden2_dparams),
+    ):
+        StressP: Vector = principal_stress(lam, test_mat)
+
+        assert np.allclose(model(np.diag(lam), test_mat), np.diag(StressP))
+        assert np.allclose(model(R @ np.diag(lam), test_mat), R @ np.diag(StressP) @ R.T)
+
+        assert np.allclose(model_jacobian(R @ np.diag(lam), test_mat), R @ model_jacobian(np.diag(lam), test_mat) @ R.T)
+
+
+def test_ogden_dF() -> None:
+    test_mat: Vector = np.array([1.0, 0.2, 2.0, -2.0, 100.0])
+
+    # General, uniaxial (two equal principal stretches) and undeformed states
+    F: Tensor = np.array(
+        [np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]]), np.diag([1.3, 0.9, 0.9]), np.eye(3)]
+    )
+
+    for model, model_tangent in ((Ogden, dOgden_dF), (Ogden2, dOgden2_dF)):
+        dStress: Tensor = model_tangent(F, test_mat)
+
+        for k, l in np.ndindex(3, 3):
+            dF: Tensor = np.zeros((3, 3))
+            dF[k, l] = 1e-6
+            fd: Tensor = (model(F + dF, test_mat) - model(F - dF, test_mat)) / 2e-6
+
+            assert np.allclose(dStress[..., k, l], fd, atol=1e-6)
@@ -0,0 +1,90 @@
+from functools import partial
+
+import numpy as np
+
+from polymat.materials.time_dependent.prony import Prony, relaxation_scan
+from polymat.materials.time_invariant.neo_hook import NeoHook
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.incompressible_deformation import uniaxial_stretch_incompressible
+from polymat.types import Tensor, Vector
+
+
+def test_prony_relaxation() -> None:
+    test_mat: list[float] = [1.0, 100.0, 0.3, 0.2, 1.0, 10.0]
+
+    model = partial(Prony, elastic_model=NeoHook, terms=2)
+
+    # Step strain held constant, relaxing by the Prony series from the instantaneous response
+    time: Vector = np.linspace(0.0, 50.0, 501)
+    F: Tensor = np.broadcast_to(np.diag([1.5, 0.9, 0.9]), (len(time), 3, 3))
+
+    Stress: Tensor = model(F, time, test_mat)
+
+    relaxation: Vector = 0.5 + 0.3 * np.exp(-time) + 0.2 * np.exp(-time / 10.0)
+
+    assert np.allclose(Stress, relaxation[:, None, None] * NeoHook(F[0], test_mat[:2]))
+
+
+def test_prony_recursive_update() -> None:
+    test_mat: list[float] = [1.0, -0.01, 1e-4, 100.0, 0.3, 0.2, 1.0, 10.0]
+
+    rng = np.random.default_rng(0)
+
+    time: Vector = np.cumsum(rng.random(500))
+    F: Tensor = uniaxial_stretch_incompressible(0.3 * np.sin(time / 5.0))
+
+    Stress: Tensor = Prony(F, time, test_mat, elastic_model=Yeoh, terms=2)
+
+    # Step by step exponential integrator update of the second Piola-Kirchhoff stress
+    g: Vector = np.array([0.3, 0.2])
+    tau: Vector = np.array([1.0, 10.0])
+
+    S0: Tensor = np.array([np.linalg.inv(_F) @ Yeoh(_F, test_mat[:4]) @ np.linalg.inv(_F).T for _F in F])
+    H: Tensor = g[:, None, None] * S0[0]
+
+    for n in range(len(time)):
+        if n > 0:
+            x: Vector = (time[n] - time[n - 1]) / tau
+            H = np.exp(-x)[:, None, None] * H + (g * (1.0 - np.exp(-x)) / x)[:, None, None] * (S0[n] - S0[n - 1])
+
+        S: Tensor = (1.0 - g.sum()) * S0[n] + H.sum(axis=0)
+
+        assert np.allclose(Stress[n], F[n] @ S @ F[n].T, atol=1e-12)
+
+
+def test_prony_population() -> None:
+    test_mats: Vector = np.array([[1.0, 100.0, 0.3, 1.0], [2.0, 100.0, 0.5, 0.1]]).T
+
+    time: Vector = np.linspace(0.0, 10.0, 50)
+    F: Tensor = uniaxial_stretch_incompressible(np.linspace(0.0, 0.5, 50))
+
+    Stress: Tensor = Prony(F, time, test_mats[..., None], elastic_model=NeoHook)
+
+    assert Stress.shape == (2, 50, 3, 3)
+
+    assert np.allclose(Stress[1], Prony(F, time, test_mats[:, 1], elastic_model=NeoHook))
+
+
+def test_relaxation_scan() -> None:
+    rng = np.random.default_rng(0)
+
+    # Long history spanning many blocks of the shortest relaxation time, with a few long steps
+    time: Vector = np.cumsum(rng.exponential(0.05, 20000))
+    time[5000:] += 100.0
+
+    u: Tensor = rng.standard_normal((20000, 3, 3))
+    tau: Vector = np.array([0.1, 1e3])[:, None, None, None]
+
+    H: Tensor = relaxation_scan(u, time, tau)
+
+    expected: Tensor = np.zeros((2, 3, 3))
+
+    for n in range(len(time)):
+        if n > 0:
+            expected *= np.exp(-(time[n] - time[n - 1]) / tau[:, 0])
+        expected += u[n]
+
+        if n % 997 == 0:
+            assert np.allclose(H[:, n], expected)
+
+    assert np.allclose(H[:, -1], expected)
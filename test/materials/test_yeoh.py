@@ -1,7 +1,7 @@
 import numpy as np
 
-from polymat.materials.time_invariant.yeoh import Yeoh
-from polymat.types import Tensor
+from polymat.materials.time_invariant.yeoh import Yeoh, dYeoh_dF, dYeoh_dparams
+from polymat.types import Tensor, Vector
 
 
 def test_yeoh_zero_strain() -> None:
@@ -25,3 +25,44 @@ def test_yeoh_uniaxial_stress() -> None:
     Stress: Tensor = Yeoh(F, test_mat)
 
     assert np.isclose(Stress[0, 0], 8.476, rtol=0.01)
+
+
+def test_yeoh_batch() -> None:
+    test_mat: list[float] = [1.0, -0.01, 1e-4, 100.0]
+
+    F: Tensor = np.array([np.diag([lam, 1.0 / np.sqrt(lam), 1.0 / np.sqrt(lam)]) for lam in (1.0, 1.5, 2.0)])
+
+    Stress: Tensor = Yeoh(F, test_mat)
+
+    assert Stress.shape == (3, 3, 3)
+
+    assert np.allclose(Stress, [Yeoh(_F, test_mat) for _F in F])
+
+
+def test_yeoh_dparams() -> None:
+    test_mat: Vector = np.array([1.0, -0.01, 1e-4, 100.0])
+
+    F: Tensor = np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]])
+
+    dStress: Tensor = dYeoh_dparams(F, test_mat)
+
+    for i, h in enumerate(1e-6 * np.maximum(np.abs(test_mat), 1.0)):
+        dp: Vector = np.eye(len(test_mat))[i] * h
+        fd: Tensor = (Yeoh(F, test_mat + dp) - Yeoh(F, test_mat - dp)) / (2 * h)
+
+        assert np.allclose(dStress[i], fd, atol=1e-6)
+
+
+def test_yeoh_dF() -> None:
+    test_mat: Vector = np.array([1.0, -0.01, 1e-3, 100.0])
+
+    F: Tensor = np.array([np.array([[1.2, 0.3, 0.0], [0.0, 0.9, 0.1], [0.0, 0.0, 1.05]]), np.diag([1.3, 0.9, 0.9])])
+
+    dStress: Tensor = dYeoh_dF(F, test_mat)
+
+    for k, l in np.ndindex(3, 3):
+        dF: Tensor = np.zeros((3, 3))
+        dF[k, l] = 1e-6
+        fd: Tensor = (Yeoh(F + dF, test_mat) - Yeoh(F - dF, test_mat)) / 2e-6
+
+        assert np.allclose(dStress[..., k, l], fd, atol=1e-6)
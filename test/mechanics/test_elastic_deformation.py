@@ -1,8 +1,22 @@
-from numpy import isclose, linspace
-
-from polymat.materials.time_invariant.yeoh import Yeoh
-from polymat.mechanics.elastic_deformation import biaxial_stress, planar_stress, uniaxial_stress
-from polymat.types import Vector
+from numpy import abs, allclose, array, exp, eye, isclose, linspace, maximum
+from pytest import raises
+
+from polymat.materials.time_invariant.neo_hook import NeoHook
+from polymat.materials.time_invariant.yeoh import Yeoh, dYeoh_dparams
+from polymat.mechanics.elastic_deformation import (
+    MixedLoading,
+    biaxial_stress,
+    confined_compression_stress,
+    mixed_stretch,
+    model_tangent,
+    planar_stress,
+    simple_shear_loading,
+    simple_shear_stress,
+    stress_jacobian,
+    uniaxial_stress,
+)
+from polymat.mechanics.kinematics import stretch_tensor
+from polymat.types import Tensor, Vector
 
 
 def test_uniaxial_stress_yeoh() -> None:
@@ -39,3 +53,126 @@ def test_planar_stress_yeoh() -> None:
     assert isclose(0.0, trueStress[0], atol=1e-12)
 
     assert isclose(8.46, trueStress[-1], rtol=0.01)
+
+
+def test_uniaxial_stress_methods_yeoh() -> None:
+    test_mat: list[float] = [1.0, -0.01, 1e-4, 100.0]
+
+    trueStrain: Vector = linspace(-0.3, 0.8, 50)
+
+    rootStress, iterations = uniaxial_stress(Yeoh, trueStrain, test_mat, method="brentq", full_output=True)
+
+    searchStress: Vector = uniaxial_stress(Yeoh, trueStrain, test_mat, method="nelder-mead")
+
+    assert all(isclose(rootStress, searchStress, rtol=1e-6, atol=1e-9))
+
+    assert iterations.shape == trueStrain.shape
+
+    assert iterations.max() < 20
+
+
+def test_newton_methods_yeoh() -> None:
+    test_mat: list[float] = [1.0, -0.01, 1e-4, 100.0]
+
+    trueStrain: Vector = linspace(-0.3, 0.8, 50)
+
+    for deformation in (uniaxial_stress, biaxial_stress, planar_stress):
+        newtonStress, iterations = deformation(Yeoh, trueStrain, test_mat, full_output=True)
+
+        rootStress: Vector = deformation(Yeoh, trueStrain, test_mat, method="brentq")
+
+        assert allclose(newtonStress, rootStress, rtol=1e-9, atol=1e-9)
+
+        assert iterations.max() < 10
+
+
+def test_simple_shear_stress_neo_hook() -> None:
+    test_mat: list[float] = [1.5, 100.0]
+
+    shear: Vector = linspace(0, 1, 20)
+
+    assert allclose(simple_shear_stress(NeoHook, shear, test_mat), 1.5 * shear)
+
+
+def test_confined_compression_stress_neo_hook() -> None:
+    test_mat: list[float] = [1.5, 100.0]
+
+    trueStrain: Vector = linspace(-0.2, 0, 20)
+    lam: Vector = exp(trueStrain)
+
+    expected: Vector = 1.5 / lam * lam ** (-2 / 3) * 2 * (lam**2 - 1) / 3 + 100.0 * (lam - 1)
+
+    assert allclose(confined_compression_stress(NeoHook, trueStrain, test_mat), expected)
+
+
+def test_mixed_stretch_yeoh() -> None:
+    test_mat: list[float] = [1.0, -0.01, 1e-4, 100.0]
+
+    # Simple shear with stress-free normal faces, free to stretch (Poynting effect)
+    shear: MixedLoading = simple_shear_loading(linspace(0, 1, 20))
+    F, iterations = mixed_stretch(Yeoh, MixedLoading(shear.F, free=((1, 1), (2, 2))), test_mat)
+
+    stress: Tensor = Yeoh(F, test_mat)
+
+    assert allclose(stress[:, 1, 1], 0.0, atol=1e-9)
+    assert allclose(stress[:, 2, 2], 0.0, atol=1e-9)
+    assert (F[1:, 1, 1] != 1.0).all()
+    assert iterations.max() < 10
+
+    # Uniaxial tension under lateral pressure, for two parameter sets at once
+    lam: Vector = exp(linspace(0, 0.5, 20))
+    pressure: Tensor = -0.1 * eye(3)
+    loading: MixedLoading = MixedLoading(stretch_tensor(lam, 1.0, 1.0), free=((1, 1), (2, 2)), stress=pressure)
+
+    test_mats: Vector = array([test_mat, [0.5, -0.02, 2e-4, 50.0]]).T
+    F, _ = mixed_stretch(Yeoh, loading, test_mats)
+
+    assert F.shape == (2, 20, 3, 3)
+    assert allclose(Yeoh(F[1], test_mats[:, 1])[:, 1:, 1:], pressure[1:, 1:], atol=1e-9)
+
+    # Same solution with the analytic tangent of the model
+    F_tangent, _ = mixed_stretch(Yeoh, loading, test_mats, tangent=model_tangent(Yeoh))
+
+    assert allclose(F_tangent, F, rtol=1e-10)
+
+    with raises(ValueError):
+        MixedLoading(shear.F, free=((0, 1), (1, 0)))
+
+
+def test_biaxial_stress_population_yeoh() -> None:
+    test_mats: Vector = array([[1.0, 0.5], [-0.01, -0.02], [1e-4, 2e-4], [100.0, 50.0]])
+
+    trueStrain: Vector = linspace(0, 0.8, 100)
+
+    trueStress: Vector = biaxial_stress(Yeoh, trueStrain, test_mats)
+
+    assert trueStress.shape == (2, 100)
+
+    assert allclose(trueStress[1], biaxial_stress(Yeoh, trueStrain, test_mats[:, 1]))
+
+
+def test_stress_jacobian_yeoh() -> None:
+    test_mat: Vector = array([1.0, -0.01, 1e-4, 100.0])
+
+    trueStrain: Vector = linspace(0, 0.8, 20)
+
+    dStress: Vector = stress_jacobian(Yeoh, dYeoh_dparams, planar_stress, trueStrain, test_mat)
+
+    for i, h in enumerate(1e-5 * maximum(abs(test_mat), 1.0)):
+        dp: Vector = eye(len(test_mat))[i] * h
+        fd: Vector = (
+            planar_stress(Yeoh, trueStrain, test_mat + dp) - planar_stress(Yeoh, trueStrain, test_mat - dp)
+        ) / (2 * h)
+
+        assert allclose(dStress[i], fd, rtol=1e-4, atol=1e-8)
+
+
+def test_stress_jacobian_simple_shear_yeoh() -> None:
+    test_mat: Vector = array([1.0, -0.01, 1e-4, 100.0])
+
+    shear: Vector = linspace(0, 1, 20)
+
+    dStress: Vector = stress_jacobian(Yeoh, dYeoh_dparams, simple_shear_stress, shear, test_mat)
+
+    assert dStress.shape == (4, 20)
+    assert allclose(dStress[3], 0.0)
@@ -1,9 +1,10 @@
-from numpy import isclose, linspace
+from numpy import allclose, array, isclose, linspace
 
-from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.materials.time_invariant.yeoh import Yeoh, dYeoh_dparams
 from polymat.mechanics.incompressible_deformation import (
     biaxial_stress_incompressible,
     planar_stress_incompressible,
+    stress_jacobian_incompressible,
     uniaxial_stress_incompressible,
 )
 from polymat.types import Vector
@@ -43,3 +44,27 @@ def test_planar_stress_incompressible_yeoh() -> None:
     assert isclose(0.0, trueStress[0], atol=1e-12)
 
     assert isclose(5.45, trueStress[-1], rtol=0.01)
+
+
+def test_uniaxial_stress_incompressible_population() -> None:
+    test_mats: Vector = array([[1.0, 0.5], [-0.01, -0.02], [1e-4, 2e-4]])
+
+    trueStrain: Vector = linspace(0, 0.8, 100)
+
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_mats)
+
+    assert trueStress.shape == (2, 100)
+
+    assert allclose(trueStress[1], uniaxial_stress_incompressible(Yeoh, trueStrain, test_mats[:, 1]))
+
+
+def test_stress_jacobian_incompressible_yeoh() -> None:
+    test_mat: Vector = array([1.0, -0.01, 1e-4])
+
+    trueStrain: Vector = linspace(0, 0.8, 20)
+
+    dStress: Vector = stress_jacobian_incompressible(dYeoh_dparams, biaxial_stress_incompressible, trueStrain, test_mat)
+
+    assert dStress.shape == (3, 20)
+
+    assert allclose(dStress.T @ test_mat, biaxial_stress_incompressible(Yeoh, trueStrain, test_mat))
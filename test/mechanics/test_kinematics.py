@@ -0,0 +1,44 @@
+from numpy import allclose, array, diag, eye, sort, zeros
+from numpy.linalg import eigvalsh
+
+from polymat.materials.time_invariant.mooney import Mooney5, dMooney5_dF
+from polymat.mechanics.kinematics import Kinematics, spatial_tangent, stretch_tensor
+from polymat.types import Tensor
+
+
+def test_stretch_tensor() -> None:
+    F: Tensor = stretch_tensor(array([1.0, 2.0]), array([1.0, 0.5]), 1.0)
+
+    assert F.shape == (2, 3, 3)
+
+    assert allclose(F[1], diag([2.0, 0.5, 1.0]))
+
+
+def test_kinematics() -> None:
+    F: Tensor = array([[1.2, 0.1, 0.0], [0.0, 0.9, 0.05], [0.0, 0.0, 1.1]])
+
+    K: Kinematics = Kinematics(F)
+
+    assert allclose(K.J, 1.2 * 0.9 * 1.1)
+    assert allclose(K.b, F @ F.T)
+    assert allclose(sort(K.principal_stretches**2), eigvalsh(F @ F.T))
+
+    params: list[float] = [1.0, 0.2, 0.01, 0.001, 0.0005, 100.0]
+
+    assert allclose(Mooney5(K, params), Mooney5(F, params))
+
+
+def test_spatial_tangent() -> None:
+    F: Tensor = array([[1.2, 0.1, 0.0], [0.0, 0.9, 0.05], [0.0, 0.0, 1.1]])
+
+    params: list[float] = [1.0, 0.2, 0.01, 0.001, 0.0005, 100.0]
+
+    a: Tensor = spatial_tangent(F, dMooney5_dF(F, params))
+
+    # Stress increment of a small velocity gradient applied for a unit time, dF = l F
+    l: Tensor = zeros((3, 3))
+    l[0, 1] = 1e-6
+
+    dStress: Tensor = Mooney5((eye(3) + l) @ F, params) - Mooney5(F, params)
+
+    assert allclose(a[..., 0, 1] * 1e-6, dStress, atol=1e-10)
@@ -0,0 +1,87 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.elastic_deformation import uniaxial_stress
+from polymat.mechanics.incompressible_deformation import (
+    biaxial_stress_incompressible,
+    uniaxial_stress_incompressible,
+)
+from polymat.mechanics.parameter_sweep import INDEX_SUFFIX, parameter_grid, parameter_sweep
+from polymat.types import ElasticDeformation, Vector
+
+MODES: list[ElasticDeformation] = [uniaxial_stress_incompressible, biaxial_stress_incompressible]
+
+
+def test_parameter_grid() -> None:
+    params: Vector = parameter_grid([[1.0, 2.0], [-0.01, 0.0, 0.01], [1e-4]])
+
+    assert params.shape == (3, 6)
+    assert np.array_equal(params[:, 1], [1.0, 0.0, 1e-4])
+    assert np.array_equal(params[:, 3], [2.0, -0.01, 1e-4])
+
+
+def test_parameter_sweep(tmp_path: Path) -> None:
+    trueStrain: Vector = np.linspace(0.0, 0.5, 20)
+    params: Vector = parameter_grid([np.linspace(0.5, 2.0, 5), np.linspace(-0.02, 0.0, 4), [0.0, 1e-3]])
+
+    stress: Vector = parameter_sweep(tmp_path / "sweep.npy", Yeoh, params, MODES, trueStrain, chunk_size=7)
+
+    assert stress.shape == (40, 2, 20)
+    assert np.allclose(np.load(tmp_path / "sweep.npy"), stress)
+
+    for i in (0, 13, 39):
+        for m, mode in enumerate(MODES):
+            assert np.allclose(stress[i, m], mode(Yeoh, trueStrain, params[:, i]))
+
+    # Compressible modes are evaluated by their batched driver
+    params = np.r_[params[:, :6], np.full((1, 6), 100.0)]
+    stress = parameter_sweep(tmp_path / "compressible.npy", Yeoh, params, [uniaxial_stress], trueStrain, chunk_size=4)
+
+    assert np.allclose(stress[:, 0], uniaxial_stress(Yeoh, trueStrain, params))
+
+
+def test_parameter_sweep_resume(tmp_path: Path) -> None:
+    trueStrain: Vector = np.linspace(0.0, 0.5, 20)
+    params: Vector = parameter_grid([np.linspace(0.5, 2.0, 5), np.linspace(-0.02, 0.0, 4), [0.0, 1e-3]])
+    path: Path = tmp_path / "sweep.npy"
+
+    class Interrupted(Exception):
+        pass
+
+    def interrupt(completed: int, total: int) -> None:
+        if completed >= 20:
+            raise Interrupted
+
+    try:
+        parameter_sweep(path, Yeoh, params, MODES, trueStrain, chunk_size=8, callback=interrupt)
+    except Interrupted:
+        pass
+
+    with open(str(path) + INDEX_SUFFIX) as f:
+        assert json.load(f)["completed"] == 24
+
+    # Only the remaining chunks are evaluated, possibly with another chunk size
+    progress: list[int] = []
+    stress: Vector = parameter_sweep(
+        path,
+        Yeoh,
+        params,
+        MODES,
+        trueStrain,
+        chunk_size=10,
+        callback=lambda completed, total: progress.append(completed),
+    )
+
+    assert progress == [34, 40]
+    assert np.allclose(stress, parameter_sweep(tmp_path / "full.npy", Yeoh, params, MODES, trueStrain))
+
+    # A sweep with other inputs starts over
+    progress.clear()
+    parameter_sweep(
+        path, Yeoh, params[:, :10], MODES, trueStrain, callback=lambda completed, total: progress.append(completed)
+    )
+
+    assert progress == [10]
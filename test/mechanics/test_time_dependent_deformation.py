@@ -0,0 +1,71 @@
+from functools import partial
+
+from numpy import allclose, array, exp, full, linspace
+
+from polymat.materials.time_dependent.prony import Prony
+from polymat.materials.time_invariant.neo_hook import NeoHook
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.incompressible_deformation import (
+    biaxial_stress_incompressible,
+    planar_stress_incompressible,
+    uniaxial_stress_incompressible,
+)
+from polymat.mechanics.time_dependent_deformation import (
+    biaxial_stress_history,
+    planar_stress_history,
+    simple_shear_stress_history,
+    uniaxial_stress_history,
+)
+from polymat.types import Vector
+
+
+def test_stress_history_elastic_limit() -> None:
+    # Without relaxation, the incompressible drivers are recovered
+    test_mat: list[float] = [1.0, -0.01, 1e-4, 100.0, 0.0, 1.0]
+
+    model = partial(Prony, elastic_model=Yeoh)
+
+    trueStrain: Vector = linspace(0, 0.8, 50)
+    time: Vector = linspace(0, 10, 50)
+
+    for history, deformation in (
+        (uniaxial_stress_history, uniaxial_stress_incompressible),
+        (biaxial_stress_history, biaxial_stress_incompressible),
+        (planar_stress_history, planar_stress_incompressible),
+    ):
+        assert allclose(history(model, trueStrain, time, test_mat), deformation(Yeoh, trueStrain, test_mat[:3]))
+
+
+def test_uniaxial_stress_history_rate() -> None:
+    test_mat: list[float] = [1.0, -0.01, 1e-4, 100.0, 0.5, 1.0]
+
+    model = partial(Prony, elastic_model=Yeoh)
+
+    trueStrain: Vector = linspace(0, 0.5, 100)
+
+    fast: Vector = uniaxial_stress_history(model, trueStrain, linspace(0, 0.01, 100), test_mat)
+    slow: Vector = uniaxial_stress_history(model, trueStrain, linspace(0, 1000, 100), test_mat)
+
+    # Instantaneous response at high rate, long term modulus at low rate
+    assert allclose(fast, uniaxial_stress_incompressible(Yeoh, trueStrain, test_mat[:3]), rtol=0.01)
+    assert allclose(slow, 0.5 * uniaxial_stress_incompressible(Yeoh, trueStrain, test_mat[:3]), rtol=0.02, atol=1e-3)
+
+    test_mats: Vector = array([test_mat, [2.0, -0.01, 1e-4, 100.0, 0.2, 5.0]]).T
+
+    population: Vector = uniaxial_stress_history(model, trueStrain, linspace(0, 10, 100), test_mats)
+
+    assert population.shape == (2, 100)
+    assert allclose(population[1], uniaxial_stress_history(model, trueStrain, linspace(0, 10, 100), test_mats[:, 1]))
+
+
+def test_simple_shear_stress_history_long() -> None:
+    test_mat: list[float] = [1.0, 100.0, 0.4, 1.0]
+
+    model = partial(Prony, elastic_model=NeoHook)
+
+    # Shear relaxation over 10^5 steps
+    time: Vector = linspace(0, 100, 100000)
+
+    shearStress: Vector = simple_shear_stress_history(model, full(len(time), 0.1), time, test_mat)
+
+    assert allclose(shearStress, 0.1 * (0.6 + 0.4 * exp(-time)))
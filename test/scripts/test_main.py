@@ -0,0 +1,77 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from numpy import allclose, column_stack, linspace, save, savetxt
+
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.incompressible_deformation import uniaxial_stress_incompressible
+from polymat.scripts.main import main
+from polymat.types import Vector
+
+
+def test_lazy_imports() -> None:
+    modules: str = subprocess.run(
+        [sys.executable, "-c", "import sys, polymat.scripts.main; print(sorted(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert "numpy" not in modules and "scipy" not in modules
+
+
+def test_fit(tmp_path: Path) -> None:
+    test_material: list[float] = [2.0, -0.016, 3e-4]
+    trueStrain: Vector = linspace(0.0, 0.5, 30)
+    trueStress: Vector = uniaxial_stress_incompressible(Yeoh, trueStrain, test_material)
+
+    savetxt(tmp_path / "lot.csv", column_stack([trueStrain, trueStress]), delimiter=",", header="strain,stress")
+    save(tmp_path / "lot.npy", column_stack([trueStrain, trueStress]))
+
+    manifest: Path = tmp_path / "datasets.jsonl"
+    lines: list[str] = [
+        json.dumps({"name": name, "curves": [["uniaxial_incompressible", file]]})
+        for name, file in (("csv", "lot.csv"), ("npy", "lot.npy"), ("missing", "missing.csv"))
+    ]
+
+    # Malformed lines fail on their own, the datasets after them are still calibrated
+    manifest.write_text("\n".join([lines[0], "not json", "[1, 2]", *lines[1:]]))
+
+    output: Path = tmp_path / "results.jsonl"
+
+    status: int = main(
+        ["fit", str(manifest), "--lower=-10,-1,-1", "--upper=10,1,1", "--vectorized", "--seed=0", "-o", str(output)]
+    )
+
+    results: dict[str, dict[str, object]] = {r["name"]: r for r in map(json.loads, output.read_text().splitlines())}
+
+    assert status == 1
+
+    for name in ("missing", "datasets:2", "datasets:3"):
+        assert results[name]["status"] == "failed"
+
+    for name in ("csv", "npy"):
+        assert results[name]["status"] == "done"
+        assert allclose(results[name]["params"], test_material, rtol=0.01)
+
+
+def test_predict(tmp_path: Path) -> None:
+    trueStrain: Vector = linspace(0.0, 0.5, 30)
+
+    save(tmp_path / "strain.npy", trueStrain)
+
+    output: Path = tmp_path / "stress.jsonl"
+
+    status: int = main(
+        ["predict", str(tmp_path / "missing.npy"), str(tmp_path / "strain.npy"), "-m", "Yeoh"]
+        + ["--mode", "uniaxial_incompressible", "-p", "2,-0.016,3e-4", "-o", str(output)]
+    )
+
+    missing, record = map(json.loads, output.read_text().splitlines())
+
+    assert status == 1
+    assert missing["status"] == "failed" and "missing.npy" in missing["message"]
+    assert record["status"] == "done"
+    assert allclose(record["stress"], uniaxial_stress_incompressible(Yeoh, trueStrain, [2.0, -0.016, 3e-4]))
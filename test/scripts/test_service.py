@@ -0,0 +1,185 @@
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+from numpy import allclose, linspace
+
+from polymat.materials.time_invariant.yeoh import Yeoh
+from polymat.mechanics.incompressible_deformation import uniaxial_stress_incompressible
+from polymat.scripts.service import FINISHED, CalibrationService, Job, ServiceClient
+from polymat.types import Vector
+
+
+def test_service(tmp_path: Path) -> None:
+    socket_path: str = str(tmp_path / "polymat.sock")
+
+    service: subprocess.Popen[str] = subprocess.Popen(
+        [sys.executable, "-m", "polymat.scripts.main", "serve", "--unix", socket_path, "--workers", "1"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+    try:
+        assert service.stdout.readline().startswith("polymat service listening")
+
+        client: ServiceClient = ServiceClient(unix=socket_path, timeout=60.0)
+
+        assert client.health()["workers"] == 1
+
+        strain: Vector = linspace(0.0, 0.5, 30)
+        stress: Vector = uniaxial_stress_incompressible(Yeoh, strain, [2.0, -0.016, 3e-4])
+
+        curves: list[dict[str, object]] = [{"mode": "uniaxial", "strain": strain.tolist(), "stress": stress.tolist()}]
+
+        # Slow compressible fit occupying the only worker, cancelled after its first generations
+        slow: int = client.submit(
+            {
+                "kind": "fit",
+                "model": "Yeoh",
+                "curves": curves,
+                "lower_bound": [-10.0, -1.0, -1.0, 100.0],
+                "upper_bound": [10.0, 1.0, 1.0, 1000.0],
+                "options": {"seed": 0},
+            }
+        )
+
+        predict: dict[str, object] = {
+            "kind": "predict",
+            "model": "Yeoh",
+            "mode": "uniaxial_incompressible",
+            "params": [2.0, -0.016, 3e-4],
+            "strain": strain.tolist(),
+        }
+
+        low: int = client.submit({**predict, "priority": 5})
+        high: int = client.submit({**predict, "priority": -5})
+
+        for event in client.events(slow):
+            if event["event"] == "progress":
+                assert event["nit"] >= 1
+                client.cancel(slow)
+
+        results: list[dict[str, object]] = [client.result(job_id) for job_id in (slow, low, high)]
+
+        assert [result["status"] for result in results] == ["cancelled", "done", "done"]
+        assert results[2]["started"] <= results[1]["started"]
+        assert allclose(results[1]["result"]["stress"], stress)
+
+        # Only registered names are resolved, never an import path sent by a client
+        unregistered: dict[str, object] = client.result(client.submit({**predict, "model": "os:getcwd"}))
+
+        assert unregistered["status"] == "failed" and "Unknown name" in unregistered["message"]
+
+        # Oversized requests are rejected before their body is read
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(60.0)
+            connection.connect(socket_path)
+            connection.sendall(b"POST /jobs HTTP/1.1\r\nContent-Length: 100000000000\r\n\r\n")
+
+            assert connection.recv(1024).startswith(b"HTTP/1.1 413")
+    finally:
+        service.terminate()
+        service.wait(timeout=30)
+
+
+def test_service_recovery() -> None:
+    strain: Vector = linspace(0.0, 0.5, 30)
+    stress: Vector = uniaxial_stress_incompressible(Yeoh, strain, [2.0, -0.016, 3e-4])
+
+    predict: dict[str, object] = {
+        "kind": "predict",
+        "model": "Yeoh",
+        "mode": "uniaxial_incompressible",
+        "params": [2.0, -0.016, 3e-4],
+        "strain": strain.tolist(),
+    }
+
+    fit: dict[str, object] = {
+        "kind": "fit",
+        "model": "Yeoh",
+        "curves": [{"mode": "uniaxial", "strain": strain.tolist(), "stress": stress.tolist()}],
+        "lower_bound": [-10.0, -1.0, -1.0, 100.0],
+        "upper_bound": [10.0, 1.0, 1.0, 1000.0],
+        "options": {"seed": 0},
+    }
+
+    async def finished(job: Job) -> None:
+        while job.status not in FINISHED:
+            await job.updated.wait()
+
+    async def run() -> None:
+        service: CalibrationService = CalibrationService(workers=1, retention=2)
+        await service.start()
+
+        try:
+            # A prediction asked to stop while running completes
+            job: Job = service.submit(predict)
+
+            while job.status == "queued":
+                await job.updated.wait()
+
+            service.cancel(job)
+            await finished(job)
+
+            assert job.status == "done"
+            assert allclose(job.result["stress"], stress)
+
+            # A worker killed during a fit fails that job only, the pool being replaced for the next ones
+            job = service.submit(fit)
+
+            while not (progress := [event for event in job.events if event["event"] == "progress"]):
+                await job.updated.wait()
+
+            os.kill(progress[0]["pid"], signal.SIGKILL)
+
+            await finished(job)
+
+            assert job.status == "failed" and "BrokenProcessPool" in job.message
+
+            jobs: list[Job] = [service.submit(predict) for _ in range(3)]
+
+            for job in jobs:
+                await finished(job)
+
+            assert [job.status for job in jobs] == ["done", "done", "done"]
+
+            # Only the last finished jobs are kept
+            assert list(service.jobs) == [job.id for job in jobs[1:]]
+        finally:
+            await service.close()
+
+    asyncio.run(run())
+
+
+def test_service_close() -> None:
+    strain: Vector = linspace(0.0, 0.5, 30)
+
+    async def run() -> None:
+        service: CalibrationService = CalibrationService(workers=1, retention=0)
+        await service.start()
+
+        predict: dict[str, object] = {
+            "kind": "predict",
+            "model": "Yeoh",
+            "mode": "uniaxial_incompressible",
+            "params": [2.0, -0.016, 3e-4],
+            "strain": strain.tolist(),
+        }
+
+        # The first job occupies the only worker, the second one is still queued when the service closes
+        running: Job = service.submit(predict)
+        queued: Job = service.submit(predict)
+
+        while running.status == "queued":
+            await running.updated.wait()
+
+        await service.close()
+
+        assert queued.status == "cancelled"
+        assert queued.id not in service.jobs
+
+    asyncio.run(run())